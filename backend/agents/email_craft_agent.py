@@ -442,8 +442,11 @@ def _locale_for_language(language_code: str, fallback_locale: str = "en_US") ->
     return mapping.get(normalized, fallback_locale)
 
 
+_SLUG_SEPARATOR_RE = re.compile(r"[^a-z0-9]+")
+
+
 def _slugify_template_segment(value: str, fallback: str = "general") -> str:
-    normalized = re.sub(r"[^a-z0-9]+", "_", str(value or "").strip().lower()).strip("_")
+    normalized = _SLUG_SEPARATOR_RE.sub("_", str(value or "").strip().lower()).strip("_")
     return normalized or fallback
 
 
@@ -599,6 +602,11 @@ async def _personalize_template_sequence(
     return None
 
 
+_BUYER_ORIENTED_TOKENS = ("you", "your", "您", "贵公司", "votre", "ihr", "su ", "sua ", "vos", "tu empresa")
+_GENERIC_CLAIM_PHRASES = ("leading provider", "world-class", "best-in-class", "industry-leading")
+_AGGRESSIVE_CTA_TOKENS = ("urgent", "last chance", "final notice")
+
+
 def _rule_validate_emails_payload(emails_list: list[dict[str, Any]]) -> dict[str, Any]:
     issues: list[str] = []
     suggestions: list[str] = []
@@ -633,10 +641,10 @@ def _rule_validate_emails_payload(emails_list: list[dict[str, Any]]) -> dict[str
 
         lowered_body = body.lower()
         lowered_subject = str(em.get("subject", "") or "").lower()
-        if not any(token in lowered_body for token in ["you", "your", "您", "贵公司", "votre", "ihr", "su ", "sua ", "vos", "tu empresa"]):
+        if not any(token in lowered_body for token in _BUYER_ORIENTED_TOKENS):
             issues.append(f"Email {i + 1}: lacks clear buyer-oriented language")
             suggestions.append(f"Email {i + 1}: explain why this recipient/company is relevant")
-        if any(phrase in lowered_body for phrase in ["leading provider", "world-class", "best-in-class", "industry-leading"]) and wc < 120:
+        if any(phrase in lowered_body for phrase in _GENERIC_CLAIM_PHRASES) and wc < 120:
             issues.append(f"Email {i + 1}: relies on generic marketing claims")
             suggestions.append(f"Email {i + 1}: replace generic superlatives with concrete proof points")
         if previous_subject and previous_subject == lowered_subject:
@@ -650,7 +658,7 @@ def _rule_validate_emails_payload(emails_list: list[dict[str, Any]]) -> dict[str
         if email_1[:120] == email_2[:120]:
             issues.append("Email 2 repeats Email 1 instead of deepening relevance")
             suggestions.append("Use Email 2 to add product/application fit or proof points")
-        if any(token in email_3 for token in ["urgent", "last chance", "final notice"]):
+        if any(token in email_3 for token in _AGGRESSIVE_CTA_TOKENS):
             issues.append("Email 3 CTA is too aggressive for cold outreach")
             suggestions.append("Use a lighter follow-up or qualification CTA in Email 3")
 
@@ -991,6 +999,9 @@ async def _validate_and_revise_sequence(
     return current, last_summary
 
 
+_ENGLISH_EVIDENCE_TOKENS = ("/en", "english", "global", "international")
+
+
 def _fallback_language_choice(
     lead: dict[str, Any],
     *,
@@ -1020,7 +1031,7 @@ def _fallback_language_choice(
             "reason": "english_only mode",
             "fallback_used": True,
         }
-    if any(token in evidence_text for token in ["/en", "english", "global", "international"]):
+    if any(token in evidence_text for token in _ENGLISH_EVIDENCE_TOKENS):
         return {
             "chosen_language": "en",
             "chosen_locale": "en_US",
@@ -1276,9 +1287,8 @@ def _build_email_tools(llm: LLMTool, locale: str) -> list[ToolDef]:
         if not emails_json or not emails_json.strip():
             return json.dumps({"passed": False, "issues": ["No emails provided"], "suggestions": []})
 
-        from tools.llm_output import parse_json as _parse
         try:
-            submitted = _parse(emails_json, context="validate_emails")
+            submitted = parse_json(emails_json, context="validate_emails")
             if submitted is None:
                 return json.dumps({"passed": False, "issues": ["Could not parse emails_json as JSON"], "suggestions": []})
             emails_list = submitted.get("emails", submitted) if isinstance(submitted, dict) else submitted
@@ -1317,8 +1327,7 @@ def _build_email_tools(llm: LLMTool, locale: str) -> list[ToolDef]:
                 temperature=0.1,
                 response_format={"type": "json_object"},
             )
-            from tools.llm_output import parse_json as _parse2
-            llm_result = _parse2(raw, context="validate_emails_llm")
+            llm_result = parse_json(raw, context="validate_emails_llm")
             if llm_result and isinstance(llm_result, dict):
                 issues.extend(llm_result.get("issues", []))
                 suggestions.extend(llm_result.get("suggestions", []))
@@ -1511,7 +1520,6 @@ async def _craft_for_lead(
             logger.warning("[EmailCraft] ReAct loop failed for %s: %s", lead.get("company_name"), e)
             return None
 
-        from tools.llm_output import validate_dict, EMAIL_SEQUENCE_REQUIRED, EMAIL_SEQUENCE_DEFAULTS
         parsed = parse_json(raw, context="EmailCraftAgent")
         if parsed is None:
             logger.warning("[EmailCraft] Unparseable output for %s", lead.get("company_name"))
@@ -1642,6 +1650,89 @@ async def email_craft_node(state: HuntState) -> dict:
         )
         return group_key, result
 
+    async def _apply_for_member(
+        template_result: dict[str, Any],
+        *,
+        version_group: str,
+        index: int,
+        template_assigned_count: int,
+        lead: dict[str, Any],
+        target: dict[str, str],
+        targets: list[dict[str, str]],
+    ) -> dict[str, Any]:
+        base_group = version_group.rsplit("|v", 1)[0]
+        applied = _apply_template_to_lead(
+            template_result,
+            lead=lead,
+            target=target,
+            template_group=version_group,
+            template_index=index,
+            template_assigned_count=template_assigned_count,
+            template_max_send_count=template_max_send_count,
+        )
+        applied["template_group_base"] = base_group
+        applied["targets"] = targets
+        if index > 1:
+            async with semaphore:
+                personalized = await _personalize_template_sequence(
+                    llm,
+                    base_sequence=applied,
+                    lead=lead,
+                    target=target,
+                    insight=insight,
+                )
+                if isinstance(personalized, dict):
+                    validated = validate_dict(
+                        personalized,
+                        EMAIL_SEQUENCE_REQUIRED,
+                        defaults=EMAIL_SEQUENCE_DEFAULTS,
+                        context="EmailCraftTemplatePersonalizer",
+                    )
+                    if validated is not None and validated.get("emails"):
+                        applied["emails"] = validated["emails"]
+                        review_summary = _review_email_sequence(
+                            lead,
+                            locale=str(applied.get("locale", "en_US") or "en_US"),
+                            emails=validated["emails"],
+                            template_profile=applied.get("template_profile", {}) or {},
+                            template_plan=applied.get("template_plan", {}) or {},
+                            min_score=int(settings.email_review_min_score or 75),
+                            max_blocking_issues=int(settings.email_review_max_blocking_issues or 0),
+                        )
+                        optimized_sequence, review_summary, review_optimization = await _auto_improve_reviewed_sequence(
+                            llm,
+                            locale=str(applied.get("locale", "en_US") or "en_US"),
+                            rules=_get_locale_rules(str(applied.get("locale", "en_US") or "en_US")),
+                            user_prompt=(
+                                f"Personalize this approved template sequence for {lead.get('company_name', '')} "
+                                f"and the chosen contact {target.get('target_name', '')} <{target.get('target_email', '')}>."
+                            ),
+                            current_sequence={
+                                "locale": str(applied.get("locale", "en_US") or "en_US"),
+                                "emails": validated["emails"],
+                            },
+                            lead=lead,
+                            template_profile=applied.get("template_profile", {}) or {},
+                            template_plan=applied.get("template_plan", {}) or {},
+                            min_score=int(settings.email_review_min_score or 75),
+                            max_blocking_issues=int(settings.email_review_max_blocking_issues or 0),
+                            validation_max_revisions=max(0, int(getattr(settings, "email_validation_max_revisions", 2) or 2)),
+                            max_rounds=max(0, int(getattr(settings, "email_review_auto_fix_rounds", 2) or 2)),
+                        )
+                        applied["emails"] = format_email_sequence_bodies(list(optimized_sequence.get("emails", []) or validated["emails"]))
+                        applied["review_summary"] = review_summary
+                        applied["validation_summary"] = {
+                            "passed": review_summary["status"] == "approved",
+                            "status": review_summary["status"],
+                            "issues": list(review_summary.get("issues", [])),
+                            "suggestions": list(review_summary.get("suggestions", [])),
+                        }
+                        applied["review_status"] = review_summary["status"]
+                        applied["review_optimization"] = review_optimization
+                        applied["auto_send_eligible"] = _review_allows_send(review_summary, settings)
+                        applied["generation_mode"] = "template_pool_personalized"
+        return applied
+
     try:
         template_max_send_count = int(getattr(settings, "email_template_max_send_count", _DEFAULT_TEMPLATE_MAX_SEND_COUNT) or _DEFAULT_TEMPLATE_MAX_SEND_COUNT)
         seed_tasks = []
@@ -1656,84 +1747,26 @@ async def email_craft_node(state: HuntState) -> dict:
         seed_results = await asyncio.gather(*seed_tasks)
 
         template_results = {group_key: result for group_key, result in seed_results if result is not None}
-        email_sequences: list[dict[str, Any]] = []
+        # Personalizing later batch members is one LLM round-trip chain per
+        # lead; run them concurrently under the same email_gen_concurrency
+        # semaphore and keep the original lead order in the output.
+        member_tasks = []
         for version_group, members in batch_members.items():
             template_result = template_results.get(version_group)
             if template_result is None:
                 continue
-            base_group = version_group.rsplit("|v", 1)[0]
             template_assigned_count = len(members)
             for index, (lead, target, targets) in enumerate(members, start=1):
-                applied = _apply_template_to_lead(
+                member_tasks.append(_apply_for_member(
                     template_result,
+                    version_group=version_group,
+                    index=index,
+                    template_assigned_count=template_assigned_count,
                     lead=lead,
                     target=target,
-                    template_group=version_group,
-                    template_index=index,
-                    template_assigned_count=template_assigned_count,
-                    template_max_send_count=template_max_send_count,
-                )
-                applied["template_group_base"] = base_group
-                applied["targets"] = targets
-                if index > 1:
-                    personalized = await _personalize_template_sequence(
-                        llm,
-                        base_sequence=applied,
-                        lead=lead,
-                        target=target,
-                        insight=insight,
-                    )
-                    if isinstance(personalized, dict):
-                        validated = validate_dict(
-                            personalized,
-                            EMAIL_SEQUENCE_REQUIRED,
-                            defaults=EMAIL_SEQUENCE_DEFAULTS,
-                            context="EmailCraftTemplatePersonalizer",
-                        )
-                        if validated is not None and validated.get("emails"):
-                            applied["emails"] = validated["emails"]
-                            review_summary = _review_email_sequence(
-                                lead,
-                                locale=str(applied.get("locale", "en_US") or "en_US"),
-                                emails=validated["emails"],
-                                template_profile=applied.get("template_profile", {}) or {},
-                                template_plan=applied.get("template_plan", {}) or {},
-                                min_score=int(settings.email_review_min_score or 75),
-                                max_blocking_issues=int(settings.email_review_max_blocking_issues or 0),
-                            )
-                            optimized_sequence, review_summary, review_optimization = await _auto_improve_reviewed_sequence(
-                                llm,
-                                locale=str(applied.get("locale", "en_US") or "en_US"),
-                                rules=_get_locale_rules(str(applied.get("locale", "en_US") or "en_US")),
-                                user_prompt=(
-                                    f"Personalize this approved template sequence for {lead.get('company_name', '')} "
-                                    f"and the chosen contact {target.get('target_name', '')} <{target.get('target_email', '')}>."
-                                ),
-                                current_sequence={
-                                    "locale": str(applied.get("locale", "en_US") or "en_US"),
-                                    "emails": validated["emails"],
-                                },
-                                lead=lead,
-                                template_profile=applied.get("template_profile", {}) or {},
-                                template_plan=applied.get("template_plan", {}) or {},
-                                min_score=int(settings.email_review_min_score or 75),
-                                max_blocking_issues=int(settings.email_review_max_blocking_issues or 0),
-                                validation_max_revisions=max(0, int(getattr(settings, "email_validation_max_revisions", 2) or 2)),
-                                max_rounds=max(0, int(getattr(settings, "email_review_auto_fix_rounds", 2) or 2)),
-                            )
-                            applied["emails"] = format_email_sequence_bodies(list(optimized_sequence.get("emails", []) or validated["emails"]))
-                            applied["review_summary"] = review_summary
-                            applied["validation_summary"] = {
-                                "passed": review_summary["status"] == "approved",
-                                "status": review_summary["status"],
-                                "issues": list(review_summary.get("issues", [])),
-                                "suggestions": list(review_summary.get("suggestions", [])),
-                            }
-                            applied["review_status"] = review_summary["status"]
-                            applied["review_optimization"] = review_optimization
-                            applied["auto_send_eligible"] = _review_allows_send(review_summary, settings)
-                            applied["generation_mode"] = "template_pool_personalized"
-                email_sequences.append(applied)
+                    targets=targets,
+                ))
+        email_sequences: list[dict[str, Any]] = list(await asyncio.gather(*member_tasks))
     finally:
         await llm.close()
 
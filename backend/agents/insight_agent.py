@@ -33,6 +33,7 @@ from tools.google_search import GoogleSearchTool
 from tools.jina_reader import JinaReaderTool
 from tools.pdf_parser import PDFParserTool
 from tools.excel_parser import ExcelParserTool
+from tools.llm_output import INSIGHT_DEFAULTS, INSIGHT_REQUIRED, parse_json, validate_dict
 from tools.react_runner import ToolDef, react_loop
 
 logger = logging.getLogger(__name__)
@@ -172,16 +173,21 @@ _IMPORTANT_PATH_KEYWORDS = {
 }
 
 
+_MARKDOWN_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+
 def _discover_important_links(content: str, base_url: str) -> list[dict]:
     """Find important subpage links (About, Products, etc.) from page content."""
     base_domain = urlparse(base_url).netloc
-    link_pattern = re.compile(r'\[([^\]]+)\]\(([^)]+)\)', re.IGNORECASE)
     results = []
     seen = set()
+    checked: set[str] = set()
 
-    for text, href in link_pattern.findall(content):
-        if not href or href.startswith("#") or href.startswith("javascript:"):
+    for text, href in _MARKDOWN_LINK_RE.findall(content):
+        # Navigation links repeat across header/footer; classify each href once.
+        if not href or href in checked or href.startswith(("#", "javascript:")):
             continue
+        checked.add(href)
         absolute = urljoin(base_url, href)
         parsed = urlparse(absolute)
         if parsed.netloc != base_domain:
@@ -591,10 +597,6 @@ async def insight_node(state: HuntState) -> dict:
         target_regions,
     )
 
-    from tools.llm_output import (
-        parse_json, validate_dict, INSIGHT_REQUIRED, INSIGHT_DEFAULTS,
-    )
-
     fallback_insight = {
         **INSIGHT_DEFAULTS,
         "products": product_keywords or [],
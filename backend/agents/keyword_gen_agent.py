@@ -9,6 +9,7 @@ from typing import Any
 from config.settings import get_settings
 from graph.state import HuntState
 from tools.llm_client import LLMTool
+from tools.llm_output import parse_json
 from agents.search_agent import _REGION_GEO
 
 logger = logging.getLogger(__name__)
@@ -258,7 +259,6 @@ async def keyword_gen_node(state: HuntState) -> dict:
             response_format={"type": "json_object"},
         )
 
-        from tools.llm_output import parse_json
         parsed = parse_json(raw, context="KeywordGenAgent")
         if parsed is None:
             raise ValueError("Unparseable LLM output")
@@ -36,9 +36,10 @@ from tools.contact_extractor import (
 from tools.email_finder import extract_emails_from_text
 from tools.email_verifier import EmailVerifierTool
 from tools.google_search import GoogleSearchTool
+from tools.html_text import compact_for_llm
 from tools.jina_reader import JinaReaderTool
 from tools.llm_client import LLMTool
-from tools.llm_output import parse_json
+from tools.llm_output import LEAD_DEFAULTS, LEAD_REQUIRED, parse_json, validate_dict
 from tools.customs_router import find_customs_data as route_customs_data
 from tools.react_runner import ToolDef, react_loop
 from tools.url_filter import classify_url
@@ -86,31 +87,38 @@ def _derive_priority_tier(fit_score: float, contactability_score: float) -> str:
     return "low"
 
 
+_NO_CUSTOMS_DATA_MARKERS = (
+    "no data found",
+    "no concrete customs data found",
+    "no detailed customs data available",
+    "no data available",
+    "no public customs data",
+    "not an importer/exporter",
+    "not an importer",
+    "not an exporter",
+    "not an importer/exporter of goods",
+    "not an importer/exporter of physical goods",
+    "service-based",
+    "engineering services provider",
+    "not applicable",
+)
+_NO_CUSTOMS_DATA_RE = re.compile("|".join(re.escape(m) for m in _NO_CUSTOMS_DATA_MARKERS))
+
+
 def _has_concrete_customs_data(value: str | None) -> bool:
     """Return True only when customs_data contains positive, concrete trade evidence."""
     text = str(value or "").strip().lower()
     if not text:
         return False
-    negative_markers = [
-        "no data found",
-        "no concrete customs data found",
-        "no detailed customs data available",
-        "no data available",
-        "no public customs data",
-        "not an importer/exporter",
-        "not an importer",
-        "not an exporter",
-        "not an importer/exporter of goods",
-        "not an importer/exporter of physical goods",
-        "service-based",
-        "engineering services provider",
-        "not applicable",
-    ]
-    return not any(marker in text for marker in negative_markers)
+    return _NO_CUSTOMS_DATA_RE.search(text) is None
+
+
+_NAME_PART_RE = re.compile(r"[a-z]+")
+_MAILBOX_SEPARATOR_RE = re.compile(r"[\W_]+")
 
 
 def _split_person_name(name: str) -> tuple[str, str]:
-    parts = [p for p in re.findall(r"[a-zA-Z]+", (name or "").lower()) if p]
+    parts = _NAME_PART_RE.findall((name or "").lower())
     if not parts:
         return "", ""
     first = parts[0]
@@ -124,6 +132,10 @@ _GENERIC_MAILBOX_LOCALS = {
     "inquiry", "inquiries", "export", "exports", "import", "imports",
     "cs", "customerservice",
 }
+_GENERIC_MAILBOX_TOKENS = frozenset({
+    "info", "sales", "contact", "support", "office", "team", "admin",
+    "marketing", "service", "customer", "export", "import",
+})
 
 
 def _is_generic_mailbox(email: str) -> bool:
@@ -133,14 +145,10 @@ def _is_generic_mailbox(email: str) -> bool:
         return False
     local, _, _ = normalized.partition("@")
     local = local.replace("(inferred)", "").strip()
-    compact = re.sub(r"[\W_]+", "", local)
+    compact = _MAILBOX_SEPARATOR_RE.sub("", local)
     if local in _GENERIC_MAILBOX_LOCALS or compact in _GENERIC_MAILBOX_LOCALS:
         return True
-    generic_tokens = {
-        "info", "sales", "contact", "support", "office", "team", "admin",
-        "marketing", "service", "customer", "export", "import",
-    }
-    return any(token in generic_tokens for token in re.split(r"[\W_]+", local) if token)
+    return not _GENERIC_MAILBOX_TOKENS.isdisjoint(_MAILBOX_SEPARATOR_RE.split(local))
 
 
 def _classify_email_pattern(name: str, email: str, domain: str) -> str | None:
@@ -481,8 +489,24 @@ If uncertain, keep it.
 """
 
 
+QUICK_GATE_BATCH_PROMPT = QUICK_GATE_PROMPT + """
+## Multiple candidates
+The input lists several candidates numbered from 1. Judge each one independently
+and return {"results": [...]} with one object per candidate, each containing
+"index" (the candidate number exactly as shown, starting at 1) plus every field
+of the single-candidate schema.
+"""
+
+
 # ── Scrape & extract helpers ─────────────────────────────────────────────
 
+# Cap on regex-extracted emails per page; spam traps and directory dumps can
+# carry thousands of addresses that would otherwise flood the tool results.
+_EMAIL_MAX_PER_PAGE = 20
+
+# Candidates judged per quick-gate LLM call.
+_QUICK_GATE_BATCH_SIZE = 8
+
 async def _scrape_page(jina: JinaReaderTool, url: str) -> str:
     """Scrape a single page, returning content or empty string on failure."""
     try:
@@ -495,12 +519,20 @@ async def _scrape_page(jina: JinaReaderTool, url: str) -> str:
 
 def _extract_contacts_from_text(text: str) -> tuple[list[str], list[str], dict[str, str]]:
     """Extract emails, phones, and social media from raw text."""
-    emails = extract_emails_from_text(text)
+    emails = extract_emails_from_text(text, limit=_EMAIL_MAX_PER_PAGE)
     phones = extract_phone_numbers(text)
     social = extract_social_media(text)
     return emails, phones, social
 
 
+_B2C_MARKERS = ("restaurant", "cafe", "bar", "salon", "spa", "hotel", "tourist", "bakery")
+_COMPETITOR_MARKERS = ("manufacturer", "factory", "producer", "oem")
+_BUYER_TYPES = (
+    "distributor", "importer", "wholesaler", "reseller",
+    "retailer", "agent", "installer", "integrator",
+)
+
+
 def _quick_gate_fallback(search_result: dict, insight: dict) -> tuple[bool, dict]:
     """Rule fallback when quick-gate LLM is unavailable."""
     maps = search_result.get("maps_data", {}) or {}
@@ -511,8 +543,7 @@ def _quick_gate_fallback(search_result: dict, insight: dict) -> tuple[bool, dict
         str(maps.get("description", "")),
     ]).lower()
 
-    b2c_markers = ["restaurant", "cafe", "bar", "salon", "spa", "hotel", "tourist", "bakery"]
-    if any(m in text for m in b2c_markers):
+    if any(m in text for m in _B2C_MARKERS):
         return False, {
             "pass_gate": False,
             "reason": "Likely B2C-only business with weak B2B procurement signal.",
@@ -529,8 +560,7 @@ def _quick_gate_fallback(search_result: dict, insight: dict) -> tuple[bool, dict
         for tok in p.split()
         if len(tok.strip()) >= 4
     }
-    competitor_markers = ["manufacturer", "factory", "producer", "oem"]
-    if any(m in text for m in competitor_markers) and any(t in text for t in product_tokens):
+    if any(m in text for m in _COMPETITOR_MARKERS) and any(t in text for t in product_tokens):
         return False, {
             "pass_gate": False,
             "reason": "Likely direct competitor (same product family manufacturer).",
@@ -552,23 +582,61 @@ def _quick_gate_fallback(search_result: dict, insight: dict) -> tuple[bool, dict
     }
 
 
-async def _quick_gate_candidate(search_result: dict, llm: LLMTool, insight: dict) -> tuple[bool, dict]:
-    """Low-cost pre-filter before deep ReAct enrichment."""
+def _quick_gate_candidate_block(search_result: dict) -> str:
+    """Render the candidate facts the quick gate judges."""
     maps = search_result.get("maps_data", {}) or {}
-    prompt = (
-        "## Candidate (Google Maps / URL)\n"
+    return (
         f"title: {search_result.get('title', '')}\n"
         f"website: {search_result.get('link', '') or maps.get('website', '')}\n"
         f"address: {maps.get('address', '')}\n"
         f"type: {maps.get('type', '')}\n"
         f"types: {maps.get('types', [])}\n"
-        f"description: {maps.get('description', '')}\n\n"
+        f"description: {maps.get('description', '')}\n"
+    )
+
+
+def _quick_gate_seller_block(insight: dict) -> str:
+    return (
         "## Seller context\n"
         f"products: {insight.get('products', [])}\n"
         f"target industries: {insight.get('industries', [])}\n"
         f"target customer profile: {insight.get('target_customer_profile', '')}\n"
         f"negative criteria: {insight.get('negative_targeting_criteria', [])}\n"
     )
+
+
+def _quick_gate_verdict(parsed: dict) -> tuple[bool, dict]:
+    """Turn one parsed quick-gate answer into ``(passed, gate)``."""
+    passed = bool(parsed.get("pass_gate", True))
+    competitor_risk = str(parsed.get("competitor_risk", "")).lower().strip()
+    entity_type = str(parsed.get("entity_type", "")).lower().strip()
+    customer_role_guess = str(parsed.get("customer_role_guess", "")).lower().strip()
+    if bool(parsed.get("suspected_competitor", False)):
+        passed = False
+    if competitor_risk == "high" and customer_role_guess not in {"distributor", "importer", "wholesaler", "oem", "integrator", "end_user"}:
+        passed = False
+    if entity_type and entity_type not in {"company", "unknown"}:
+        passed = False
+
+    return passed, {
+        "pass_gate": passed,
+        "reason": str(parsed.get("reason", "")) or "No reason provided",
+        "risk_flags": parsed.get("risk_flags", []) if isinstance(parsed.get("risk_flags"), list) else [],
+        "confidence": float(parsed.get("confidence", 0.0) or 0.0),
+        "entity_type": entity_type or "unknown",
+        "customer_role_guess": customer_role_guess or "unknown",
+        "competitor_risk": competitor_risk or "low",
+    }
+
+
+async def _quick_gate_candidate(search_result: dict, llm: LLMTool, insight: dict) -> tuple[bool, dict]:
+    """Low-cost pre-filter before deep ReAct enrichment."""
+    prompt = (
+        "## Candidate (Google Maps / URL)\n"
+        + _quick_gate_candidate_block(search_result)
+        + "\n"
+        + _quick_gate_seller_block(insight)
+    )
     try:
         raw = await llm.generate(
             prompt,
@@ -581,49 +649,76 @@ async def _quick_gate_candidate(search_result: dict, llm: LLMTool, insight: dict
         parsed = parse_json(raw, context="QuickGate")
         if not isinstance(parsed, dict):
             return _quick_gate_fallback(search_result, insight)
-
-        passed = bool(parsed.get("pass_gate", True))
-        competitor_risk = str(parsed.get("competitor_risk", "")).lower().strip()
-        entity_type = str(parsed.get("entity_type", "")).lower().strip()
-        customer_role_guess = str(parsed.get("customer_role_guess", "")).lower().strip()
-        if bool(parsed.get("suspected_competitor", False)):
-            passed = False
-        if competitor_risk == "high" and customer_role_guess not in {"distributor", "importer", "wholesaler", "oem", "integrator", "end_user"}:
-            passed = False
-        if entity_type and entity_type not in {"company", "unknown"}:
-            passed = False
-
-        return passed, {
-            "pass_gate": passed,
-            "reason": str(parsed.get("reason", "")) or "No reason provided",
-            "risk_flags": parsed.get("risk_flags", []) if isinstance(parsed.get("risk_flags"), list) else [],
-            "confidence": float(parsed.get("confidence", 0.0) or 0.0),
-            "entity_type": entity_type or "unknown",
-            "customer_role_guess": customer_role_guess or "unknown",
-            "competitor_risk": competitor_risk or "low",
-        }
+        return _quick_gate_verdict(parsed)
     except Exception as e:
         logger.debug("[LeadExtract][QuickGate] fallback due to error: %s", e)
         return _quick_gate_fallback(search_result, insight)
 
 
+async def _quick_gate_batch(search_results: list[dict], llm: LLMTool, insight: dict) -> list[tuple[bool, dict]]:
+    """Gate several candidates with one LLM call, in input order.
+
+    The system prompt and seller context are sent once for the whole batch.
+    Candidates are numbered from 1. The batch answer is used only when it
+    returns exactly one well-formed verdict for each number 1..N; otherwise
+    every candidate is re-gated one by one, since a shifted or partial
+    numbering cannot be mapped back to candidates reliably.
+    """
+    if len(search_results) == 1:
+        return [await _quick_gate_candidate(search_results[0], llm, insight)]
+
+    prompt = "".join(
+        f"## Candidate {index} (Google Maps / URL)\n{_quick_gate_candidate_block(r)}\n"
+        for index, r in enumerate(search_results, start=1)
+    ) + _quick_gate_seller_block(insight)
+    verdicts: list[dict] = []
+    try:
+        raw = await llm.generate(
+            prompt,
+            system=QUICK_GATE_BATCH_PROMPT,
+            temperature=0.0,
+            response_format={"type": "json_object"},
+        )
+        parsed = parse_json(raw, context="QuickGateBatch") if isinstance(raw, str) else None
+        items = parsed.get("results") if isinstance(parsed, dict) else None
+        verdicts = [
+            item for item in (items if isinstance(items, list) else [])
+            if isinstance(item, dict) and isinstance(item.get("index"), int) and "pass_gate" in item
+        ]
+    except Exception as e:
+        logger.debug("[LeadExtract][QuickGate] batch failed, gating individually: %s", e)
+
+    expected = list(range(1, len(search_results) + 1))
+    if sorted(item["index"] for item in verdicts) == expected:
+        by_index = {item["index"]: item for item in verdicts}
+        return [_quick_gate_verdict(by_index[index]) for index in expected]
+
+    if verdicts:
+        logger.debug(
+            "[LeadExtract][QuickGate] batch returned indices %s for %d candidates, gating individually",
+            sorted(item["index"] for item in verdicts), len(search_results),
+        )
+    return list(await asyncio.gather(*(_quick_gate_candidate(r, llm, insight) for r in search_results)))
+
+
 def _normalized_domain(url: str) -> str:
     """Normalize URL netloc for stable dedupe keys."""
     domain = urlparse(url or "").netloc.lower().strip()
     if domain.startswith("www."):
         domain = domain[4:]
-    if ":" in domain:
-        domain = domain.split(":", 1)[0]
-    return domain
+    return domain.partition(":")[0]
 
 
-def _official_website_domain(url: str) -> str:
+def _official_website_domain(url: str, url_type: str | None = None) -> str:
     """Return domain only for official company-site URLs.
 
     Platform/profile/content URLs (LinkedIn, Thomasnet, etc.) are excluded
     from dedupe keys to avoid false deduplication across different companies.
+    Pass ``url_type`` when the caller has already classified the URL.
     """
-    if classify_url(url or "") != "company_site":
+    if url_type is None:
+        url_type = classify_url(url or "")
+    if url_type != "company_site":
         return ""
     return _normalized_domain(url)
 
@@ -681,6 +776,7 @@ def _build_react_tools(
             contacts from scrape_page / google_search tool calls. Keys:
             'emails' (set), 'phones' (set), 'social' (dict).
     """
+    scraped_pages: dict[str, str] = {}
 
     async def tool_scrape_page(url: str = "") -> str:
         """Scrape a web page and return its content plus auto-extracted contacts."""
@@ -689,8 +785,12 @@ def _build_react_tools(
         content = await _scrape_page(jina, url)
         if not content:
             return json.dumps({"error": "Failed to scrape page or page has no content", "url": url})
-        # Truncate to avoid huge tool results
-        truncated = content[:6000]
+        # Keep the page server-side so extract_lead_info can take the URL
+        # instead of the model echoing the page text back as an argument.
+        scraped_pages[url] = content
+        # Truncate to avoid huge tool results; image and link URLs would
+        # otherwise take a large share of the budget.
+        truncated = compact_for_llm(content, limit=6000)
         # Auto-extract contacts from the FULL content (not truncated)
         emails, phones, social = _extract_contacts_from_text(content)
         # Collect into the shared accumulator for post-hoc merge (P0-3)
@@ -746,17 +846,21 @@ def _build_react_tools(
         except Exception as e:
             return json.dumps({"error": f"Search failed: {e}"})
 
-    async def tool_extract_lead_info(page_content: str = "") -> str:
+    async def tool_extract_lead_info(page_content: str = "", urls: list[str] | None = None) -> str:
         """Use AI to extract structured company facts from page content (no scoring)."""
+        cached = [scraped_pages[u] for u in urls or [] if u in scraped_pages]
+        if cached:
+            page_content = "\n\n".join(cached + [page_content])
         if not page_content.strip():
-            return json.dumps({"error": "page_content is required — pass the scraped text"})
-        prompt = f"## Page Content\n{page_content[:5000]}"
+            return json.dumps({"error": "page_content or scraped urls are required — pass the scraped text"})
+        prompt = f"## Page Content\n{compact_for_llm(page_content, limit=5000)}"
         try:
             raw = await llm.generate(
                 prompt,
                 system=LEAD_EXTRACT_PROMPT,
                 temperature=0.1,
                 response_format={"type": "json_object"},
+                cache=True,
             )
             return raw
         except Exception as e:
@@ -805,10 +909,7 @@ def _build_react_tools(
         if target_profile:
             # Extract business type keywords from the ICP description
             icp_lower = target_profile.lower()
-            types = []
-            for t in ["distributor", "importer", "wholesaler", "reseller", "retailer", "agent", "installer", "integrator"]:
-                if t in icp_lower:
-                    types.append(t)
+            types = [t for t in _BUYER_TYPES if t in icp_lower]
             if types:
                 buyer_type_hint = ", ".join(types)
         prompt = (
@@ -842,7 +943,7 @@ def _build_react_tools(
     return [
         ToolDef(
             name="scrape_page",
-            description="Fetch and read a web page. Returns markdown content, auto-extracted emails/phones/social media, and discovered contact page links. If the page can't be scraped (anti-bot, JS-only), returns an error — use google_search as fallback.",
+            description="Fetch and read a web page. Returns markdown content, auto-extracted emails/phones/social media, and discovered contact page links. If the page can't be scraped (anti-bot, JS-only), returns an error — use google_search as fallback. To read several pages (e.g. discovered contact links), call this tool for each URL in the same turn; the calls run in parallel.",
             parameters={
                 "type": "object",
                 "properties": {
@@ -866,15 +967,20 @@ def _build_react_tools(
         ),
         ToolDef(
             name="extract_lead_info",
-            description="Use AI to extract structured company facts (name, industry, description, business type, key products, contacts, etc.) from page content. Pure extraction — no fit scoring. Call this once you have gathered enough content.",
+            description="Use AI to extract structured company facts (name, industry, description, business type, key products, contacts, etc.) from page content. Pure extraction — no fit scoring. Call this once you have gathered enough content. Prefer passing the URLs you already scraped with scrape_page instead of copying their text.",
             parameters={
                 "type": "object",
                 "properties": {
-                    "page_content": {"type": "string", "description": "The combined page content to analyze"},
+                    "urls": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "URLs already fetched with scrape_page; their full content is analyzed",
+                    },
+                    "page_content": {"type": "string", "description": "Extra page content to analyze (e.g. search snippets)"},
                 },
-                "required": ["page_content"],
             },
             fn=tool_extract_lead_info,
+            sequential=True,
         ),
         ToolDef(
             name="find_customs_data",
@@ -909,6 +1015,7 @@ def _build_react_tools(
                 "required": ["company_profile"],
             },
             fn=tool_assess_lead_fit,
+            sequential=True,
         ),
     ]
 
@@ -1018,7 +1125,6 @@ async def _scrape_and_extract(
             return None
 
         # Parse + validate the final JSON answer
-        from tools.llm_output import parse_json, validate_dict, LEAD_REQUIRED, LEAD_DEFAULTS
         parsed = parse_json(raw_result, context=f"LeadExtract:{domain}")
         if parsed is None:
             logger.warning("[LeadExtract] Invalid JSON from %s", domain)
@@ -1045,10 +1151,10 @@ async def _scrape_and_extract(
         if maps_phone:
             existing_phones = sanitize_phone_list(existing_phones + [maps_phone])
 
-        existing_emails = list(set(validated.get("emails", [])))
+        existing_emails = list(dict.fromkeys(validated.get("emails", [])))
         maps_email = str(maps_data.get("email", "")).strip()
-        if maps_email:
-            existing_emails = list(set(existing_emails + [maps_email]))
+        if maps_email and maps_email not in existing_emails:
+            existing_emails.append(maps_email)
 
         lead = {
             "company_name": validated.get("company_name") or domain,
@@ -1218,31 +1324,30 @@ async def lead_extract_node(state: HuntState) -> dict:
         d for d in (_official_website_domain(l.get("website", "")) for l in existing_leads)
         if d
     }
-    to_process = []
+    processable = []
+    irrelevant_count = 0
     seen_candidate_domains: set[str] = set(existing_domains)
     for r in search_results:
         link = r.get("link", "")
         maps_title = (r.get("title") or (r.get("maps_data") or {}).get("title") or "").strip()
         if not link and not maps_title:
             continue
-        link_official_domain = _official_website_domain(link)
-        if link_official_domain and link_official_domain in existing_domains:
-            continue
+        # Classify once per link; it drives both the domain dedupe and the
+        # irrelevant filter (search engines, entertainment).
+        url_type = classify_url(link) if link else ""
+        link_official_domain = _official_website_domain(link, url_type)
         if link_official_domain and link_official_domain in seen_candidate_domains:
             continue
         if link_official_domain:
             seen_candidate_domains.add(link_official_domain)
-        to_process.append(r)
-
-    # Filter out truly irrelevant URLs (search engines, entertainment)
-    processable = [
-        r for r in to_process
-        if (not r.get("link")) or classify_url(r.get("link", "")) != "irrelevant"
-    ]
+        if url_type == "irrelevant":
+            irrelevant_count += 1
+            continue
+        processable.append(r)
 
     logger.info(
         "[LeadExtractAgent] %d URLs to process (%d irrelevant filtered out)",
-        len(processable), len(to_process) - len(processable),
+        len(processable), irrelevant_count,
     )
 
     if not processable:
@@ -1275,32 +1380,38 @@ async def lead_extract_node(state: HuntState) -> dict:
 
     try:
         # ── Quick Gate: low-cost pre-filter before deep ReAct ───────────
-        async def _run_gate(r: dict) -> tuple[dict, bool, dict]:
+        async def _run_gate(batch: list[dict]) -> list[tuple[dict, bool, dict]]:
             async with semaphore:
                 try:
-                    passed, gate = await _quick_gate_candidate(r, llm, insight)
-                    return r, passed, gate
+                    verdicts = await _quick_gate_batch(batch, llm, insight)
+                    return [(r, passed, gate) for r, (passed, gate) in zip(batch, verdicts)]
                 except Exception as e:
                     logger.warning("[LeadExtract][QuickGate] gate failed, fallback keep: %s", e)
-                    return r, True, {"reason": "gate_error_fallback_keep", "risk_flags": ["insufficient_data"], "confidence": 0.0}
+                    return [
+                        (r, True, {"reason": "gate_error_fallback_keep", "risk_flags": ["insufficient_data"], "confidence": 0.0})
+                        for r in batch
+                    ]
 
         gated_candidates: list[dict] = []
         filtered_count = 0
-        gate_tasks = [_run_gate(r) for r in processable]
+        gate_tasks = [
+            _run_gate(processable[i:i + _QUICK_GATE_BATCH_SIZE])
+            for i in range(0, len(processable), _QUICK_GATE_BATCH_SIZE)
+        ]
         for future in asyncio.as_completed(gate_tasks):
-            row, passed, gate = await future
-            if passed:
-                row["quick_gate"] = gate
-                gated_candidates.append(row)
-            else:
-                filtered_count += 1
-                _emit_progress(
-                    "gate_filtered",
-                    domain=(urlparse(row.get("link", "")).netloc or row.get("title", "unknown")),
-                    reason=gate.get("reason", ""),
-                    risk_flags=gate.get("risk_flags", []),
-                    confidence=gate.get("confidence", 0.0),
-                )
+            for row, passed, gate in await future:
+                if passed:
+                    row["quick_gate"] = gate
+                    gated_candidates.append(row)
+                else:
+                    filtered_count += 1
+                    _emit_progress(
+                        "gate_filtered",
+                        domain=(urlparse(row.get("link", "")).netloc or row.get("title", "unknown")),
+                        reason=gate.get("reason", ""),
+                        risk_flags=gate.get("risk_flags", []),
+                        confidence=gate.get("confidence", 0.0),
+                    )
 
         logger.info(
             "[LeadExtractAgent] QuickGate kept %d / %d candidates (filtered=%d)",
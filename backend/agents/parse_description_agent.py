@@ -25,6 +25,7 @@ import logging
 from config.settings import get_settings
 from graph.state import HuntState
 from tools.llm_client import LLMTool
+from tools.llm_output import parse_json
 
 logger = logging.getLogger(__name__)
 
@@ -87,7 +88,6 @@ async def parse_description_node(state: HuntState) -> dict:
             response_format={"type": "json_object"},
         )
 
-        from tools.llm_output import parse_json
         parsed = parse_json(raw, context="ParseDescriptionAgent")
 
         if not parsed or not isinstance(parsed, dict):
@@ -8,6 +8,7 @@ from typing import Any
 
 from config.settings import get_settings
 from graph.state import HuntState
+from observability.cost_tracker import get_tracker
 from tools.google_maps_search import GoogleMapsSearchTool
 from tools.platform_registry import PlatformRegistryTool  # backward-compatible patch target
 from tools.web_search import WebSearchTool  # backward-compatible patch target
@@ -180,6 +181,9 @@ def _build_maps_snippet(place: dict) -> str:
 def _result_identity_key(item: dict) -> str:
     """Stable dedupe key for a search result, including Maps-only rows without website."""
     link = (item.get("link") or "").strip().lower()
+    # Fragments, a trailing slash and a leading "www." do not change the page,
+    # so they must not let the same site through twice.
+    link = link.partition("#")[0].rstrip("/").replace("://www.", "://", 1)
     if link:
         return f"url:{link}"
 
@@ -327,8 +331,6 @@ async def search_node(state: HuntState) -> dict:
     hunt_id = state.get("hunt_id", "")
     if hunt_id:
         try:
-            from observability.cost_tracker import get_tracker
-
             tracker = get_tracker(hunt_id)
             for r in raw_results:
                 tracker.record_search_call(provider=r.get("source", "google_maps"), result_count=r.get("result_count", 0))
@@ -54,6 +54,7 @@ from emailing.reply_detector import run_reply_detection_once
 from emailing.scheduler import run_scheduler_once
 from emailing.store import EmailStore
 from scripts.headless_worker import JobCancelledError, _campaign_name
+from tools.jina_reader import close_shared_clients
 
 # Configure logging for the entire application
 logging.basicConfig(
@@ -717,6 +718,7 @@ async def lifespan(app: FastAPI):
         update_worker_state("consumer", running=False, active_job_id="")
 
     await stop_background_workers()
+    await close_shared_clients()
 
 
 def create_app() -> FastAPI:
@@ -131,13 +131,7 @@ def _campaign_preview(hunt_id: str) -> dict[str, Any]:
         return {"campaign_count": 0, "sequence_count": 0, "target_emails": []}
     store = _email_store()
     campaigns = store.list_campaigns_for_hunt(hunt_id)
-    sequences = []
-    for item in campaigns:
-        campaign = item.get("campaign") if isinstance(item, dict) else None
-        campaign_id = str((campaign or {}).get("id", "") or "")
-        if not campaign_id:
-            continue
-        sequences.extend(store.list_sequences_for_campaign(campaign_id))
+    sequences = store.list_sequences_for_hunt(hunt_id) if campaigns else []
     target_emails = list(
         dict.fromkeys(
             str(sequence.get("lead_email", "") or "").strip().lower()
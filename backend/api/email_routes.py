@@ -75,6 +75,7 @@ def _campaign_summary(store: EmailStore, campaign_id: str) -> dict[str, Any]:
     settings = get_settings()
     campaign = store.get_campaign(campaign_id)
     sequences = store.list_sequences_for_campaign(campaign_id)
+    message_counts = store.count_messages_by_status_for_campaign(campaign_id)
     template_summary = store.get_template_performance_for_campaign(
         campaign_id,
         underperforming_min_assigned=int(getattr(settings, "email_template_underperforming_min_assigned", 10) or 10),
@@ -83,36 +84,38 @@ def _campaign_summary(store: EmailStore, campaign_id: str) -> dict[str, Any]:
     return {
         "campaign": campaign,
         "sequence_count": len(sequences),
-        "sent_count": store.count_messages_for_campaign(campaign_id, status="sent"),
-        "pending_count": store.count_messages_for_campaign(campaign_id, status="pending"),
-        "failed_count": store.count_messages_for_campaign(campaign_id, status="failed"),
+        "sent_count": message_counts.get("sent", 0),
+        "pending_count": message_counts.get("pending", 0),
+        "failed_count": message_counts.get("failed", 0),
         "template_summary": list(template_summary.values()),
         "sequences": sequences,
     }
 
 
-def _write_summary_to_hunt(store: EmailStore, hunt_id: str, campaign_id: str) -> None:
+def _write_summary_to_hunt(
+    store: EmailStore,
+    hunt_id: str,
+    campaign_id: str,
+    summary: dict[str, Any] | None = None,
+) -> None:
+    """Persist the campaign summary into the hunt; reuses ``summary`` when given."""
     hunt = load_hunt(hunt_id)
     if not hunt:
         return
     result = hunt.setdefault("result", {})
-    settings = get_settings()
-    campaign = store.get_campaign(campaign_id)
-    sequences = store.list_sequences_for_campaign(campaign_id)
-    template_summary = store.get_template_performance_for_campaign(
-        campaign_id,
-        underperforming_min_assigned=int(getattr(settings, "email_template_underperforming_min_assigned", 10) or 10),
-        underperforming_min_reply_rate=float(getattr(settings, "email_template_underperforming_min_reply_rate", 1.0) or 1.0),
-    )
+    summary = summary or _campaign_summary(store, campaign_id)
+    campaign = summary["campaign"]
+    sequences = summary["sequences"]
+    template_summary = {str(t["template_id"]): t for t in summary["template_summary"]}
     result["email_campaign_summary"] = {
         "campaign_id": campaign_id,
         "status": campaign.get("status", "draft") if campaign else "draft",
-        "sequences_total": len(sequences),
-        "sent_count": store.count_messages_for_campaign(campaign_id, status="sent"),
-        "failed_count": store.count_messages_for_campaign(campaign_id, status="failed"),
-        "pending_count": store.count_messages_for_campaign(campaign_id, status="pending"),
+        "sequences_total": summary["sequence_count"],
+        "sent_count": summary["sent_count"],
+        "failed_count": summary["failed_count"],
+        "pending_count": summary["pending_count"],
         "replied_count": sum(1 for seq in sequences if seq.get("status") == "replied"),
-        "template_summary": list(template_summary.values()),
+        "template_summary": summary["template_summary"],
     }
     generated_sequences = result.get("email_sequences")
     if isinstance(generated_sequences, list):
@@ -220,38 +223,15 @@ async def create_email_campaign(hunt_id: str, payload: CreateCampaignRequest):
             if store.has_contact_history_for_lead_key(lead_key):
                 continue
             sequence_id = str(uuid.uuid4())
-            store.create_sequence({
-                "id": sequence_id,
-                "campaign_id": campaign_id,
-                "hunt_id": hunt_id,
-                "lead_key": lead_key or (sequence_id.lower() + "|" + str(target.get("target_email") or "").lower()),
-                "lead_email": str(target.get("target_email") or ""),
-                "lead_name": str(lead.get("company_name") or ""),
-                "decision_maker_name": str(target.get("target_name") or ""),
-                "decision_maker_title": str(target.get("target_title") or ""),
-                "locale": str(seq.get("locale") or "en_US"),
-                "generation_mode": str(seq.get("generation_mode") or "personalized"),
-                "template_id": str(seq.get("template_id") or ""),
-                "template_group": str(seq.get("template_group") or ""),
-                "template_usage_index": int(seq.get("template_usage_index", 0) or 0),
-                "template_max_send_count": int(seq.get("template_max_send_count", 0) or 0),
-                "status": "scheduled",
-                "current_step": 0,
-                "stop_reason": "",
-                "replied_at": "",
-                "last_sent_at": "",
-                "next_scheduled_at": "",
-                "created_at": created,
-                "updated_at": created,
-            })
             next_scheduled = ""
+            messages = []
             for email in emails:
                 step_number = int(email.get("sequence_number", 1) or 1)
                 delay_days = int(email.get("suggested_send_day", 0) or 0)
                 scheduled_at = (base_time + timedelta(days=delay_days)).isoformat()
                 if step_number == 1:
                     next_scheduled = scheduled_at
-                store.create_message({
+                messages.append({
                     "id": str(uuid.uuid4()),
                     "sequence_id": sequence_id,
                     "step_number": step_number,
@@ -268,10 +248,34 @@ async def create_email_campaign(hunt_id: str, payload: CreateCampaignRequest):
                     "created_at": created,
                     "updated_at": created,
                 })
-            store.update_sequence_status(sequence_id, status="scheduled", updated_at=created, next_scheduled_at=next_scheduled)
+            sequence = {
+                "id": sequence_id,
+                "campaign_id": campaign_id,
+                "hunt_id": hunt_id,
+                "lead_key": lead_key or (sequence_id.lower() + "|" + str(target.get("target_email") or "").lower()),
+                "lead_email": str(target.get("target_email") or ""),
+                "lead_name": str(lead.get("company_name") or ""),
+                "decision_maker_name": str(target.get("target_name") or ""),
+                "decision_maker_title": str(target.get("target_title") or ""),
+                "locale": str(seq.get("locale") or "en_US"),
+                "generation_mode": str(seq.get("generation_mode") or "personalized"),
+                "template_id": str(seq.get("template_id") or ""),
+                "template_group": str(seq.get("template_group") or ""),
+                "template_usage_index": int(seq.get("template_usage_index", 0) or 0),
+                "template_max_send_count": int(seq.get("template_max_send_count", 0) or 0),
+                "status": "scheduled",
+                "current_step": 0,
+                "stop_reason": "",
+                "replied_at": "",
+                "last_sent_at": "",
+                "next_scheduled_at": next_scheduled,
+                "created_at": created,
+                "updated_at": created,
+            }
+            store.create_sequence_with_messages(sequence, messages)
 
-    _write_summary_to_hunt(store, hunt_id, campaign_id)
     summary = _campaign_summary(store, campaign_id)
+    _write_summary_to_hunt(store, hunt_id, campaign_id, summary)
     return CampaignResponse(campaign_id=campaign_id, status="draft", sequence_count=summary["sequence_count"])
 
 
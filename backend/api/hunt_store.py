@@ -6,47 +6,165 @@ On server startup, all existing hunt files are loaded into the in-memory _hunts
 
 from __future__ import annotations
 
-import json
+import asyncio
+import hashlib
+import itertools
 import logging
+import os
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
 from config.settings import get_settings
+from tools.json_codec import dumps_bytes, loads
 
 logger = logging.getLogger(__name__)
 
+# path -> (digest, seq) of the newest save prepared for it.  Hunts are saved
+# on every stage/progress event, often with an unchanged payload; skipping
+# identical rewrites avoids re-writing multi-MB result files.  Comparing with
+# the newest *prepared* save rather than the last finished write keeps a
+# repeat of an older state from being skipped while a different one is queued.
+_last_prepared: dict[str, tuple[bytes, int]] = {}
+
+
+_ensured_dirs: set[str] = set()
+
 
 def _hunts_dir() -> Path:
-    """Return the hunts directory path, creating it if needed."""
+    """Return the hunts directory path, creating it on first use."""
     settings = get_settings()
     p = Path(settings.hunts_dir)
-    p.mkdir(parents=True, exist_ok=True)
+    key = str(p)
+    if key not in _ensured_dirs:
+        p.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(key)
     return p
 
 
+# Writes may finish out of order once they run on worker threads; each save
+# gets a sequence number and a write is dropped if a newer one already landed.
+_write_seq = itertools.count()
+_latest_seq: dict[str, int] = {}
+# Guards only the bookkeeping dicts above; file writes hold the per-path lock
+# instead, so a sync save of one hunt never waits on another hunt's write.
+_write_lock = threading.Lock()
+_path_locks: dict[str, threading.Lock] = {}
+
+
+def _path_lock(key: str) -> threading.Lock:
+    with _write_lock:
+        lock = _path_locks.get(key)
+        if lock is None:
+            lock = _path_locks[key] = threading.Lock()
+        return lock
+
+
+def _prepare_save(hunt_id: str, hunt_data: dict[str, Any]) -> tuple[Path, bytes, bytes, int] | None:
+    """Serialize a hunt, returning ``None`` when the file already holds it."""
+    path = _hunts_dir() / f"{hunt_id}.json"
+    payload = {"hunt_id": hunt_id, **hunt_data}
+    raw = dumps_bytes(payload)
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    key = str(path)
+    with _write_lock:
+        previous = _last_prepared.get(key)
+        if previous is not None and previous[0] == digest and path.exists():
+            return None
+        seq = next(_write_seq)
+        _last_prepared[key] = (digest, seq)
+    return path, raw, digest, seq
+
+
+def _write_atomic(path: Path, raw: bytes) -> None:
+    """Replace ``path`` in one step so a crash mid-write keeps the old file.
+
+    Hunt files are rewritten on every checkpoint and hold every lead found so
+    far; a torn in-place write would lose the whole hunt on the next load.
+    """
+    temp_path = path.with_suffix(path.suffix + ".tmp")
+    temp_path.write_bytes(raw)
+    temp_path.replace(path)
+
+
+def _write_prepared(path: Path, raw: bytes, digest: bytes, seq: int) -> None:
+    key = str(path)
+    with _path_lock(key):
+        with _write_lock:
+            if _latest_seq.get(key, -1) > seq:
+                return
+        try:
+            _write_atomic(path, raw)
+        except Exception:
+            # The file does not hold this payload; let the next save retry it.
+            with _write_lock:
+                if _last_prepared.get(key) == (digest, seq):
+                    del _last_prepared[key]
+            raise
+        with _write_lock:
+            _latest_seq[key] = seq
+
+
 def save_hunt(hunt_id: str, hunt_data: dict[str, Any]) -> None:
     """Persist a hunt to disk as JSON."""
     try:
-        path = _hunts_dir() / f"{hunt_id}.json"
-        payload = {"hunt_id": hunt_id, **hunt_data}
-        path.write_text(json.dumps(payload, ensure_ascii=False, default=str), encoding="utf-8")
+        prepared = _prepare_save(hunt_id, hunt_data)
+        if prepared is not None:
+            _write_prepared(*prepared)
+    except Exception as e:
+        logger.warning("[HuntStore] Failed to save hunt %s: %s", hunt_id[:8], e)
+
+
+async def save_hunt_async(hunt_id: str, hunt_data: dict[str, Any]) -> None:
+    """Persist a hunt without blocking the event loop on the file write.
+
+    The payload is serialized before returning control, so the caller may keep
+    mutating ``hunt_data`` while the bytes are written on a worker thread.
+    """
+    try:
+        prepared = _prepare_save(hunt_id, hunt_data)
+        if prepared is not None:
+            await asyncio.to_thread(_write_prepared, *prepared)
     except Exception as e:
         logger.warning("[HuntStore] Failed to save hunt %s: %s", hunt_id[:8], e)
 
 
+# path -> ((mtime_ns, size), (hunt_id, hunt)) from the last runtime read.  The
+# notifier and metrics reload every hunt on each pass; unchanged files are not
+# re-read or re-parsed.
+_runtime_read_cache: dict[str, tuple[tuple[int, int], tuple[str, dict[str, Any]]]] = {}
+
+
 def load_all_hunts(*, mark_interrupted: bool = False) -> dict[str, dict[str, Any]]:
     """Load all hunts from disk into a dict keyed by hunt_id.
 
     `mark_interrupted=True` should only be used during process startup recovery.
-    Runtime readers such as metrics/notifiers must not mutate running hunts.
+    Runtime readers such as metrics/notifiers must not mutate running hunts;
+    their hunt dicts are shared between calls while the file is unchanged.
     """
     hunts: dict[str, dict[str, Any]] = {}
     hunts_path = _hunts_dir()
 
-    for path in hunts_path.glob("*.json"):
+    with os.scandir(hunts_path) as it:
+        entries = [entry for entry in it if entry.name.endswith(".json") and entry.is_file()]
+    if not mark_interrupted:
+        present = {entry.path for entry in entries}
+        for stale in _runtime_read_cache.keys() - present:
+            del _runtime_read_cache[stale]
+
+    for entry in entries:
+        path = Path(entry.path)
         try:
-            data = json.loads(path.read_text(encoding="utf-8"))
+            if not mark_interrupted:
+                stat = entry.stat()
+                stamp = (stat.st_mtime_ns, stat.st_size)
+                cached = _runtime_read_cache.get(entry.path)
+                if cached is not None and cached[0] == stamp:
+                    hid, data = cached[1]
+                    hunts[hid] = data
+                    continue
+            data = loads(path.read_bytes())
             hid = data.pop("hunt_id", path.stem)
             # Any hunt that was running/pending when the process died is now interrupted.
             # This mutation is only safe during startup recovery, not during runtime reads.
@@ -56,12 +174,15 @@ def load_all_hunts(*, mark_interrupted: bool = False) -> dict[str, dict[str, Any
                 data["completed_at"] = now_iso()
                 # Persist the updated status so it survives future restarts
                 payload = {"hunt_id": hid, **data}
-                path.write_text(json.dumps(payload, ensure_ascii=False, default=str), encoding="utf-8")
+                _write_atomic(path, dumps_bytes(payload))
+                _last_prepared.pop(str(path), None)
                 logger.info("[HuntStore] Marked interrupted hunt %s as failed", hid[:8])
+            if not mark_interrupted:
+                _runtime_read_cache[entry.path] = (stamp, (hid, data))
             hunts[hid] = data
             logger.debug("[HuntStore] Loaded hunt %s (status=%s)", hid[:8], data.get("status"))
         except Exception as e:
-            logger.warning("[HuntStore] Failed to load %s: %s", path.name, e)
+            logger.warning("[HuntStore] Failed to load %s: %s", entry.name, e)
 
     if hunts:
         logger.info("[HuntStore] Loaded %d historical hunts from %s", len(hunts), hunts_path)
@@ -72,6 +193,7 @@ def delete_hunt(hunt_id: str) -> None:
     """Delete a hunt file from disk."""
     try:
         path = _hunts_dir() / f"{hunt_id}.json"
+        _last_prepared.pop(str(path), None)
         if path.exists():
             path.unlink()
     except Exception as e:
@@ -84,7 +206,7 @@ def load_hunt(hunt_id: str) -> dict[str, Any] | None:
         path = _hunts_dir() / f"{hunt_id}.json"
         if not path.exists():
             return None
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = loads(path.read_bytes())
         data.pop("hunt_id", None)
         return data
     except Exception as e:
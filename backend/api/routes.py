@@ -12,7 +12,7 @@ from datetime import datetime, timezone
 from typing import Any, Literal
 
 import os
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, UploadFile, File
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Response, UploadFile, File
 from pydantic import BaseModel, Field
 
 from agents.parse_description_agent import parse_description_node
@@ -25,9 +25,10 @@ from config.settings import get_settings
 from emailing.template_pipeline import compose_template_plan, extract_template_profile
 from emailing.imap_client import search_recent_replies
 from emailing.readiness import ensure_imap_ready, ensure_imap_tested, ensure_smtp_ready
+from tools.json_codec import dumps_bytes, loads
 from tools.llm_client import LLMTool
 from emailing.smtp_client import send_smtp_email
-from api.hunt_store import load_all_hunts, save_hunt, now_iso
+from api.hunt_store import load_all_hunts, save_hunt, save_hunt_async, now_iso
 from api.security import require_api_access
 from graph.builder import build_graph
 from graph.evaluate import evaluate_progress, should_continue_hunting, _build_keyword_performance
@@ -86,7 +87,8 @@ def _dedupe_leads(leads: list[dict[str, Any]]) -> list[dict[str, Any]]:
 
 
 def _unique_leads_count(leads: list[dict[str, Any]]) -> int:
-    return len(_dedupe_leads(leads))
+    # Count distinct keys only; no need to build the merged lead list.
+    return len({_lead_key(lead) for lead in leads if isinstance(lead, dict)})
 
 
 def _validate_uploaded_file_ids(file_ids: list[str]) -> list[str]:
@@ -282,7 +284,7 @@ def _load_template_seed_cache() -> dict[str, Any]:
     if not path.exists():
         return {}
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = loads(path.read_bytes())
     except Exception as exc:
         logger.warning("[TemplateSeed] Failed to read cache, ignoring: %s", exc)
         return {}
@@ -293,7 +295,7 @@ def _save_template_seed_cache(cache: dict[str, Any]) -> None:
     path = Path(get_settings().template_seed_cache_path)
     path.parent.mkdir(parents=True, exist_ok=True)
     temp_path = path.with_suffix(path.suffix + ".tmp")
-    temp_path.write_text(json.dumps(cache, ensure_ascii=False, indent=2), encoding="utf-8")
+    temp_path.write_bytes(dumps_bytes(cache))
     temp_path.replace(path)
 
 
@@ -436,6 +438,9 @@ def _sequence_recipient(sequence: dict[str, Any]) -> str:
     return ""
 
 
+_REPLY_SCAN_CONCURRENCY = 4
+
+
 async def _scan_hunt_replies() -> None:
     settings = get_settings()
     if not bool(settings.email_reply_detection_enabled):
@@ -446,10 +451,20 @@ async def _scan_hunt_replies() -> None:
         logger.debug("[ReplyDetection] Skipping automated reply scan because IMAP is not verified: %s", exc)
         return
 
+    semaphore = asyncio.Semaphore(_REPLY_SCAN_CONCURRENCY)
+
+    async def _search(recipient: str) -> list[dict[str, Any]] | None:
+        async with semaphore:
+            try:
+                return await asyncio.to_thread(search_recent_replies, settings, from_address=recipient)
+            except Exception as exc:
+                logger.debug("[ReplyDetection] IMAP scan failed for %s: %s", recipient, exc)
+                return None
+
     for hunt_id, hunt in list(_hunts.items()):
         result = hunt.get("result") or {}
         sequences = result.get("email_sequences", []) or []
-        changed = False
+        pending: list[tuple[dict[str, Any], dict[str, Any], str]] = []
         for sequence in sequences:
             if not isinstance(sequence, dict):
                 continue
@@ -465,14 +480,20 @@ async def _scan_hunt_replies() -> None:
             )
             if not sent_any:
                 continue
+            pending.append((sequence, lead, recipient))
 
-            previous_count = int(((sequence.get("reply_detection") or {}).get("reply_count", 0)) or 0)
-            try:
-                replies = await asyncio.to_thread(search_recent_replies, settings, from_address=recipient)
-            except Exception as exc:
-                logger.debug("[ReplyDetection] IMAP scan failed for %s: %s", recipient, exc)
-                continue
+        if not pending:
+            continue
 
+        # Each recipient is an independent IMAP search; run them together
+        # (bounded) instead of one mailbox round trip after another.
+        all_replies = await asyncio.gather(*(_search(recipient) for _, _, recipient in pending))
+
+        changed = False
+        for (sequence, lead, recipient), replies in zip(pending, all_replies):
+            if replies is None:
+                continue
+            previous_count = int(((sequence.get("reply_detection") or {}).get("reply_count", 0)) or 0)
             sequence["reply_detection"] = {
                 "checked_at": now_iso(),
                 "reply_count": len(replies),
@@ -681,7 +702,7 @@ async def _run_hunt(hunt_id: str, request: HuntRequest) -> None:
 
                     # Checkpoint: persist accumulated state so kill -9 doesn't lose data
                     _hunts[hunt_id]["result"] = dict(accumulated)
-                    save_hunt(hunt_id, _hunts[hunt_id])
+                    await save_hunt_async(hunt_id, _hunts[hunt_id])
 
                     prev_stage = stage
 
@@ -938,7 +959,7 @@ async def _run_resume_hunt(hunt_id: str, request: ResumeRequest, prior_result: d
 
                     # Checkpoint: persist accumulated state so kill -9 doesn't lose data
                     _hunts[hunt_id]["result"] = dict(accumulated)
-                    save_hunt(hunt_id, _hunts[hunt_id])
+                    await save_hunt_async(hunt_id, _hunts[hunt_id])
 
                     prev_stage = stage
 
@@ -1148,7 +1169,7 @@ async def get_hunt_result(hunt_id: str):
     hunt = _hunts[hunt_id]
     result = hunt.get("result") or {}
     deduped_leads = _dedupe_leads(result.get("leads", []))
-    return HuntResult(
+    payload = HuntResult(
         hunt_id=hunt_id,
         status=hunt["status"],
         insight=result.get("insight"),
@@ -1160,6 +1181,10 @@ async def get_hunt_result(hunt_id: str):
         keyword_search_stats=result.get("keyword_search_stats", {}),
         search_result_count=len(result.get("search_results", [])),
     )
+    # Results can carry thousands of leads.  Serialize the already-validated
+    # model in one pydantic-core pass instead of letting FastAPI re-validate
+    # and re-encode it against response_model.
+    return Response(content=payload.model_dump_json(), media_type="application/json")
 
 @router.post(
     "/hunts/{hunt_id}/email-sequences/{sequence_index}/decision",
@@ -160,7 +160,7 @@ async def get_settings_api():
     masked = {key: _mask(value) for key, value in raw.items()}
     return SettingsResponse(
         settings=masked,
-        is_configured=is_configured(),
+        is_configured=is_configured(raw),
     )
 
 
@@ -7,7 +7,6 @@ instead of polling.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import AsyncGenerator
 
@@ -19,6 +18,7 @@ from api.routes import _hunts, _sse_queues
 from api.security import require_api_access
 from automation.job_queue import HuntJobQueue
 from config.settings import get_settings
+from tools.json_codec import dumps_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -34,7 +34,7 @@ def _automation_job_queue() -> HuntJobQueue:
 
 def _sse_event(event_type: str, data: dict) -> str:
     """Format a Server-Sent Event string."""
-    json_data = json.dumps(data, ensure_ascii=False)
+    json_data = dumps_bytes(data).decode("utf-8")
     return f"event: {event_type}\ndata: {json_data}\n\n"
 
 
@@ -105,7 +105,8 @@ async def _event_generator(hunt_id: str, queue: asyncio.Queue) -> AsyncGenerator
 
 async def _automation_job_event_generator(job_id: str) -> AsyncGenerator[str, None]:
     queue = _automation_job_queue()
-    previous_snapshot = ""
+    # Compared as dicts, so unchanged polls are never encoded.
+    previous_payload: dict | None = None
     while True:
         job = queue.get(job_id)
         if not job:
@@ -113,17 +114,16 @@ async def _automation_job_event_generator(job_id: str) -> AsyncGenerator[str, No
             return
 
         payload = _serialize_job(job)
-        snapshot = json.dumps(payload, ensure_ascii=False, sort_keys=True)
-        if snapshot != previous_snapshot:
+        if payload != previous_payload:
             event_type = "update"
-            if previous_snapshot == "":
+            if previous_payload is None:
                 event_type = "heartbeat"
             elif payload["status"] == "completed":
                 event_type = "completed"
             elif payload["status"] == "failed":
                 event_type = "failed"
             yield _sse_event(event_type, payload)
-            previous_snapshot = snapshot
+            previous_payload = payload
 
         if payload["status"] in {"completed", "failed"}:
             return
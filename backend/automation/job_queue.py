@@ -33,6 +33,11 @@ ON hunt_jobs(status, available_at, created_at);
 """
 
 
+# Queue databases already set up by this process; the API and SSE streams
+# build a new HuntJobQueue (and call init_db) on every request and poll.
+_initialized_paths: set[str] = set()
+
+
 class HuntJobQueue:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
@@ -44,12 +49,15 @@ class HuntJobQueue:
         return conn
 
     def init_db(self) -> None:
+        if self.db_path in _initialized_paths and Path(self.db_path).exists():
+            return
         with self._connect() as conn:
             conn.executescript(_DDL)
             self._ensure_column(conn, "hunt_jobs", "progress_stage", "TEXT DEFAULT ''")
             self._ensure_column(conn, "hunt_jobs", "progress_message", "TEXT DEFAULT ''")
             self._ensure_column(conn, "hunt_jobs", "template_seed_status", "TEXT DEFAULT ''")
             self._ensure_column(conn, "hunt_jobs", "template_seed_source", "TEXT DEFAULT ''")
+        _initialized_paths.add(self.db_path)
 
     def _ensure_column(self, conn: sqlite3.Connection, table_name: str, column_name: str, definition: str) -> None:
         columns = {
@@ -84,6 +92,12 @@ class HuntJobQueue:
             )
         return job_id
 
+    def count_grouped_by_status(self) -> dict[str, int]:
+        """Return ``{status: job_count}`` in one grouped query."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM hunt_jobs GROUP BY status").fetchall()
+        return {str(row[0]): int(row[1]) for row in rows}
+
     def count_by_status(self, *statuses: str) -> int:
         if not statuses:
             return 0
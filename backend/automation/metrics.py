@@ -81,11 +81,13 @@ def collect_automation_status(*, hunts: dict[str, dict[str, Any]] | None = None)
             "email_sequences_count": int(hunt.get("email_sequences_count", 0) or 0),
         })
 
+    job_counts = queue.count_grouped_by_status()
+    message_counts = store.count_messages_grouped_by_status()
     return {
         "hunt_jobs": {
-            "queued": queue.count_by_status("queued"),
-            "running": queue.count_by_status("running"),
-            "failed": queue.count_by_status("failed"),
+            "queued": job_counts.get("queued", 0),
+            "running": job_counts.get("running", 0),
+            "failed": job_counts.get("failed", 0),
         },
         "hunts": {
             "running": len(running_hunts),
@@ -93,10 +95,10 @@ def collect_automation_status(*, hunts: dict[str, dict[str, Any]] | None = None)
             "running_details": running_details,
         },
         "email_queue": {
-            "pending": store.count_messages_by_status("pending"),
-            "sent": store.count_messages_by_status("sent"),
-            "failed": store.count_messages_by_status("failed"),
-            "cancelled": store.count_messages_by_status("cancelled"),
+            "pending": message_counts.get("pending", 0),
+            "sent": message_counts.get("sent", 0),
+            "failed": message_counts.get("failed", 0),
+            "cancelled": message_counts.get("cancelled", 0),
             "active_campaigns": store.count_campaigns_by_status("active"),
             "draft_campaigns": store.count_campaigns_by_status("draft"),
             "active_sequences": store.count_sequences_by_status("scheduled", "running"),
@@ -136,15 +138,15 @@ def collect_automation_metrics(*, hours: int = 24, hunts: dict[str, dict[str, An
         result = hunt.get("result") or {}
         leads = result.get("leads") or []
         sequences = result.get("email_sequences") or []
-        if isinstance(leads, list):
-            new_leads += _unique_leads_count(leads)
-        if isinstance(sequences, list):
-            generated_sequences += len(sequences)
+        lead_count = _unique_leads_count(leads) if isinstance(leads, list) else 0
+        sequence_count = len(sequences) if isinstance(sequences, list) else 0
+        new_leads += lead_count
+        generated_sequences += sequence_count
         recent_completed.append({
             "hunt_id": str(hunt.get("hunt_id", "") or hunt_id),
             "website_url": _hunt_website_url(hunt),
-            "lead_count": _unique_leads_count(leads) if isinstance(leads, list) else 0,
-            "email_sequence_count": len(sequences) if isinstance(sequences, list) else 0,
+            "lead_count": lead_count,
+            "email_sequence_count": sequence_count,
             "status": str(hunt.get("status", "") or ""),
         })
     recent_completed = recent_completed[-3:]
@@ -173,14 +175,15 @@ def collect_automation_metrics(*, hours: int = 24, hunts: dict[str, dict[str, An
             "retry_attempts": retry_attempts,
         })
 
+    job_counts = queue.count_grouped_by_status()
     return {
         "window_hours": hours,
         "since": since_iso,
         "hunt_jobs": {
             "completed": queue.count_finished_since("completed", since_iso),
             "failed": queue.count_finished_since("failed", since_iso),
-            "queued": queue.count_by_status("queued"),
-            "running": queue.count_by_status("running"),
+            "queued": job_counts.get("queued", 0),
+            "running": job_counts.get("running", 0),
             "retrying": queue.count_retrying_since(since_iso),
         },
         "hunts": {
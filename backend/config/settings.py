@@ -12,10 +12,12 @@ from pydantic_settings import BaseSettings, SettingsConfigDict
 _BACKEND_ROOT = Path(__file__).resolve().parent.parent
 
 
+@lru_cache(maxsize=1)
 def _app_data_dir() -> Path | None:
     """Return the user's writable app-data directory when running packaged.
 
-    Returns None in dev mode so callers fall back to relative paths.
+    Returns None in dev mode so callers fall back to relative paths.  Resolved
+    (and created) once; every path field below asks for it at import time.
     """
     if not getattr(sys, "frozen", False):
         return None
@@ -45,25 +47,15 @@ def _resolve_env_file() -> str:
 
 
 def _resolve_dir(relative: str) -> str:
-    """Resolve a writable directory path (created if missing in packaged mode)."""
-    d = _app_data_dir()
-    if d is not None:
-        resolved = d / relative
-        resolved.mkdir(parents=True, exist_ok=True)
-        return str(resolved)
-    resolved = _BACKEND_ROOT / relative
+    """Resolve a writable directory path (created if missing)."""
+    resolved = (_app_data_dir() or _BACKEND_ROOT) / relative
     resolved.mkdir(parents=True, exist_ok=True)
     return str(resolved)
 
 
 def _resolve_file(relative: str) -> str:
-    """Resolve a writable file path (parent dir created if missing in packaged mode)."""
-    d = _app_data_dir()
-    if d is not None:
-        resolved = d / relative
-        resolved.parent.mkdir(parents=True, exist_ok=True)
-        return str(resolved)
-    resolved = _BACKEND_ROOT / relative
+    """Resolve a writable file path (parent dir created if missing)."""
+    resolved = (_app_data_dir() or _BACKEND_ROOT) / relative
     resolved.parent.mkdir(parents=True, exist_ok=True)
     return str(resolved)
 
@@ -92,6 +84,8 @@ class Settings(BaseSettings):
     llm_temperature: float = 0.3
     llm_max_tokens: int = 4096
     llm_requests_per_minute: int = 0
+    llm_cache_dir: str = ""       # optional on-disk cache for page-extraction completions
+    llm_cache_ttl_seconds: int = 2592000
 
     # Reasoning model — used for ReAct agent decision-making (stronger reasoning)
     #   e.g. "gpt-4o", "anthropic/claude-3-5-sonnet-20241022", "openrouter/deepseek/deepseek-r1"
@@ -119,6 +113,8 @@ class Settings(BaseSettings):
 
     # --- Search ---
     serper_api_key: str = ""
+    serper_cache_dir: str = ""    # optional on-disk cache for Serper search responses
+    serper_cache_ttl_seconds: int = 86400
     tavily_api_key: str = ""      # supports multiple keys: "key1,key2"
     jina_api_key: str = ""
 
@@ -188,6 +184,9 @@ class Settings(BaseSettings):
     # --- Concurrency ---
     search_concurrency: int = 10  # max concurrent Serper API calls
     scrape_concurrency: int = 5   # max concurrent Jina Reader calls
+    scrape_direct_fetch_enabled: bool = True  # try a plain GET before Jina for static pages
+    scrape_cache_dir: str = ""    # optional on-disk cache for page reads
+    scrape_cache_ttl_seconds: int = 86400
     email_gen_concurrency: int = 3  # max concurrent LLM calls for email generation
     react_max_iterations: int = 5   # max ReAct loop iterations per URL
 
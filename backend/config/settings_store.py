@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import platform
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 _BACKEND_ROOT = Path(__file__).resolve().parent.parent
@@ -37,14 +38,15 @@ def get_env_path() -> Path:
     return _BACKEND_ROOT / ".env"
 
 
-def read_settings() -> dict[str, str]:
-    """Parse the .env file into a KEY -> value mapping."""
-    path = get_env_path()
-    if not path.exists():
-        return {}
+@lru_cache(maxsize=8)
+def _parse_env_file(path: str, mtime_ns: int, size: int) -> dict[str, str]:
+    """Parse a .env file once per (path, mtime, size) stamp.
 
+    The stamp arguments are only part of the cache key so an edited file is
+    re-read; callers must copy the returned dict before mutating it.
+    """
     result: dict[str, str] = {}
-    for line in path.read_text(encoding="utf-8").splitlines():
+    for line in Path(path).read_text(encoding="utf-8").splitlines():
         line = line.strip()
         if not line or line.startswith("#") or "=" not in line:
             continue
@@ -53,11 +55,27 @@ def read_settings() -> dict[str, str]:
     return result
 
 
+def read_settings() -> dict[str, str]:
+    """Parse the .env file into a KEY -> value mapping."""
+    path = get_env_path()
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return {}
+    return dict(_parse_env_file(str(path), stat.st_mtime_ns, stat.st_size))
+
+
+def cache_clear() -> None:
+    """Drop cached .env parses (for tests or out-of-band edits)."""
+    _parse_env_file.cache_clear()
+
+
 def write_settings(data: dict[str, str]) -> None:
     """Overwrite the .env file with the provided mapping."""
     path = get_env_path()
     path.parent.mkdir(parents=True, exist_ok=True)
     path.write_text("".join(f"{key}={value}\n" for key, value in data.items()), encoding="utf-8")
+    cache_clear()
 
 
 def update_settings(updates: dict[str, str]) -> None:
@@ -67,7 +85,11 @@ def update_settings(updates: dict[str, str]) -> None:
     write_settings(existing)
 
 
-def is_configured() -> bool:
-    """Return True when at least one LLM key is configured."""
-    settings = read_settings()
+def is_configured(settings: dict[str, str] | None = None) -> bool:
+    """Return True when at least one LLM key is configured.
+
+    Pass an already-read mapping to avoid parsing the .env file twice.
+    """
+    if settings is None:
+        settings = read_settings()
     return any(settings.get(key, "").strip() for key in _LLM_KEYS)
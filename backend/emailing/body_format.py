@@ -23,6 +23,9 @@ _CLOSING_PATTERNS = (
     "期待您的回复",
 )
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_BREAK_RE = re.compile(r"(?<=[.!?])\s+")
+
 
 def _normalize_lines(text: str) -> str:
     text = text.replace("\r\n", "\n").replace("\r", "\n")
@@ -41,10 +44,10 @@ def _normalize_lines(text: str) -> str:
 
 
 def _split_sentences(text: str) -> list[str]:
-    collapsed = re.sub(r"\s+", " ", text.strip())
+    collapsed = _WHITESPACE_RE.sub(" ", text.strip())
     if not collapsed:
         return []
-    parts = re.split(r"(?<=[.!?])\s+", collapsed)
+    parts = _SENTENCE_BREAK_RE.split(collapsed)
     return [part.strip() for part in parts if part.strip()]
 
 
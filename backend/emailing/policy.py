@@ -22,16 +22,18 @@ _TITLE_PRIORITIES = [
     "general manager",
 ]
 
+_INFERRED_SUFFIX_RE = re.compile(r"\s*\(inferred\)\s*$", re.I)
+
 
 def _normalize_email(email: str) -> str:
-    return re.sub(r"\s*\(inferred\)\s*$", "", str(email or ""), flags=re.I).strip().lower()
+    return _INFERRED_SUFFIX_RE.sub("", str(email or "")).strip().lower()
 
 
 def _email_status(email: str) -> str:
     text = str(email or "").strip()
     if not text:
         return "none"
-    if re.search(r"\(inferred\)\s*$", text, flags=re.I) or text.lower() == "inferred":
+    if _INFERRED_SUFFIX_RE.search(text) or text.lower() == "inferred":
         return "inferred-from-pattern"
     return "verified"
 
@@ -85,7 +87,7 @@ def expand_email_targets(lead: dict[str, Any]) -> list[dict[str, str]]:
         normalized = _normalize_email(str(email or ""))
         if "@" not in normalized:
             continue
-        local = normalized.split("@", 1)[0]
+        local = normalized.partition("@")[0]
         company_emails.append((0 if local in _GENERIC_LOCAL_PARTS else 1, normalized))
     if company_emails:
         company_emails.sort(key=lambda item: (item[0], item[1]))
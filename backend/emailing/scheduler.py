@@ -20,7 +20,8 @@ def _refresh_hunt_email_summary(store: EmailStore, hunt_id: str, campaign_id: st
     if not hunt:
         return
     campaign = store.get_campaign(campaign_id)
-    sequences = store.list_sequences_for_campaign(campaign_id)
+    sequence_counts = store.count_sequences_by_status_for_campaign(campaign_id)
+    message_counts = store.count_messages_by_status_for_campaign(campaign_id)
     settings = get_settings()
     template_summary = store.get_template_performance_for_campaign(
         campaign_id,
@@ -30,11 +31,11 @@ def _refresh_hunt_email_summary(store: EmailStore, hunt_id: str, campaign_id: st
     summary = {
         "campaign_id": campaign_id,
         "status": campaign.get("status", "draft") if campaign else "draft",
-        "sequences_total": len(sequences),
-        "sent_count": store.count_messages_for_campaign(campaign_id, status="sent"),
-        "failed_count": store.count_messages_for_campaign(campaign_id, status="failed"),
-        "pending_count": store.count_messages_for_campaign(campaign_id, status="pending"),
-        "replied_count": sum(1 for seq in sequences if seq.get("status") == "replied"),
+        "sequences_total": sum(sequence_counts.values()),
+        "sent_count": message_counts.get("sent", 0),
+        "failed_count": message_counts.get("failed", 0),
+        "pending_count": message_counts.get("pending", 0),
+        "replied_count": sequence_counts.get("replied", 0),
         "template_summary": list(template_summary.values()),
     }
     result = hunt.setdefault("result", {})
@@ -107,6 +107,12 @@ CREATE INDEX IF NOT EXISTS idx_reply_sequence_id ON email_reply_events(sequence_
 """
 
 
+# Database files whose schema this process has already created or migrated.
+# Routes open a fresh store per request; re-running the DDL and column
+# checks each time would add a write transaction to every read.
+_initialized_paths: set[str] = set()
+
+
 class EmailStore:
     def __init__(self, db_path: str) -> None:
         self.db_path = db_path
@@ -118,6 +124,8 @@ class EmailStore:
         return conn
 
     def init_db(self) -> None:
+        if self.db_path in _initialized_paths and Path(self.db_path).exists():
+            return
         with self._connect() as conn:
             conn.executescript(_DDL)
             self._ensure_column(conn, "lead_email_sequences", "generation_mode", "TEXT NOT NULL DEFAULT 'personalized'")
@@ -125,6 +133,7 @@ class EmailStore:
             self._ensure_column(conn, "lead_email_sequences", "template_group", "TEXT DEFAULT ''")
             self._ensure_column(conn, "lead_email_sequences", "template_usage_index", "INTEGER NOT NULL DEFAULT 0")
             self._ensure_column(conn, "lead_email_sequences", "template_max_send_count", "INTEGER NOT NULL DEFAULT 0")
+        _initialized_paths.add(self.db_path)
 
     def _ensure_column(self, conn: sqlite3.Connection, table_name: str, column_name: str, definition: str) -> None:
         columns = {
@@ -193,6 +202,21 @@ class EmailStore:
                 [payload[c] for c in cols],
             )
 
+    def create_sequence_with_messages(self, sequence: dict[str, Any], messages: list[dict[str, Any]]) -> None:
+        """Insert a sequence and all of its messages in a single transaction."""
+        seq_cols = list(sequence.keys())
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO lead_email_sequences ({', '.join(seq_cols)}) VALUES ({', '.join('?' for _ in seq_cols)})",
+                [sequence[c] for c in seq_cols],
+            )
+            if messages:
+                msg_cols = list(messages[0].keys())
+                conn.executemany(
+                    f"INSERT INTO email_messages ({', '.join(msg_cols)}) VALUES ({', '.join('?' for _ in msg_cols)})",
+                    [[message[c] for c in msg_cols] for message in messages],
+                )
+
     def get_sequence(self, sequence_id: str) -> dict[str, Any] | None:
         with self._connect() as conn:
             row = conn.execute("SELECT * FROM lead_email_sequences WHERE id = ?", (sequence_id,)).fetchone()
@@ -206,6 +230,17 @@ class EmailStore:
             ).fetchall()
         return [dict(row) for row in rows]
 
+    def list_sequences_for_hunt(self, hunt_id: str) -> list[dict[str, Any]]:
+        """Return the sequences of every campaign created for ``hunt_id``."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT s.* FROM lead_email_sequences s "
+                "JOIN email_campaigns c ON c.id = s.campaign_id "
+                "WHERE c.hunt_id = ? ORDER BY c.created_at DESC, s.created_at ASC",
+                (hunt_id,),
+            ).fetchall()
+        return [dict(row) for row in rows]
+
     def has_contact_history_for_lead_key(self, lead_key: str) -> bool:
         """Return whether a lead/email pair was already queued or contacted before.
 
@@ -342,6 +377,32 @@ class EmailStore:
             row = conn.execute(query, params).fetchone()
         return int(row[0]) if row else 0
 
+    def count_messages_by_status_for_campaign(self, campaign_id: str) -> dict[str, int]:
+        """Return ``{status: message_count}`` for a campaign in one grouped query."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT m.status, COUNT(*) FROM email_messages m "
+                "JOIN lead_email_sequences s ON s.id = m.sequence_id "
+                "WHERE s.campaign_id = ? GROUP BY m.status",
+                (campaign_id,),
+            ).fetchall()
+        return {str(row[0]): int(row[1]) for row in rows}
+
+    def count_sequences_by_status_for_campaign(self, campaign_id: str) -> dict[str, int]:
+        """Return ``{status: sequence_count}`` for a campaign in one grouped query."""
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) FROM lead_email_sequences WHERE campaign_id = ? GROUP BY status",
+                (campaign_id,),
+            ).fetchall()
+        return {str(row[0]): int(row[1]) for row in rows}
+
+    def count_messages_grouped_by_status(self) -> dict[str, int]:
+        """Return ``{status: message_count}`` across all campaigns in one query."""
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM email_messages GROUP BY status").fetchall()
+        return {str(row[0]): int(row[1]) for row in rows}
+
     def count_messages_by_status(self, status: str) -> int:
         with self._connect() as conn:
             row = conn.execute(
@@ -511,39 +572,45 @@ class EmailStore:
         if not sequences:
             return {}
 
-        template_summary: dict[str, dict[str, Any]] = {}
+        # One grouped count instead of a COUNT(*) query per sequence.
         with self._connect() as conn:
-            for sequence in sequences:
-                template_id = str(sequence.get("template_id") or "")
-                if not template_id:
-                    continue
-                summary = template_summary.setdefault(
-                    template_id,
-                    {
-                        "template_id": template_id,
-                        "template_group": str(sequence.get("template_group") or ""),
-                        "generation_mode": str(sequence.get("generation_mode") or "template_pool"),
-                        "assigned_count": 0,
-                        "max_send_count": int(sequence.get("template_max_send_count") or 0),
-                        "sent_count": 0,
-                        "replied_count": 0,
-                        "reply_rate": 0.0,
-                        "remaining_capacity": 0,
-                        "status": "warming_up",
-                        "optimization_needed": False,
-                        "recommended_action": "keep_collecting_data",
-                        "reason": "Not enough delivery/reply data yet.",
-                    },
-                )
-                summary["assigned_count"] += 1
-                if sequence.get("status") == "replied":
-                    summary["replied_count"] += 1
-
-                row = conn.execute(
-                    "SELECT COUNT(*) FROM email_messages WHERE sequence_id = ? AND status = 'sent'",
-                    (sequence["id"],),
-                ).fetchone()
-                summary["sent_count"] += int(row[0]) if row else 0
+            rows = conn.execute(
+                "SELECT m.sequence_id, COUNT(*) FROM email_messages m "
+                "JOIN lead_email_sequences s ON s.id = m.sequence_id "
+                "WHERE s.campaign_id = ? AND m.status = 'sent' "
+                "GROUP BY m.sequence_id",
+                (campaign_id,),
+            ).fetchall()
+        sent_by_sequence = {str(row[0]): int(row[1]) for row in rows}
+
+        template_summary: dict[str, dict[str, Any]] = {}
+        for sequence in sequences:
+            template_id = str(sequence.get("template_id") or "")
+            if not template_id:
+                continue
+            summary = template_summary.setdefault(
+                template_id,
+                {
+                    "template_id": template_id,
+                    "template_group": str(sequence.get("template_group") or ""),
+                    "generation_mode": str(sequence.get("generation_mode") or "template_pool"),
+                    "assigned_count": 0,
+                    "max_send_count": int(sequence.get("template_max_send_count") or 0),
+                    "sent_count": 0,
+                    "replied_count": 0,
+                    "reply_rate": 0.0,
+                    "remaining_capacity": 0,
+                    "status": "warming_up",
+                    "optimization_needed": False,
+                    "recommended_action": "keep_collecting_data",
+                    "reason": "Not enough delivery/reply data yet.",
+                },
+            )
+            summary["assigned_count"] += 1
+            if sequence.get("status") == "replied":
+                summary["replied_count"] += 1
+
+            summary["sent_count"] += sent_by_sequence.get(str(sequence["id"]), 0)
 
         for summary in template_summary.values():
             assigned = int(summary["assigned_count"])
@@ -12,6 +12,8 @@ from tools.llm_output import parse_json
 
 logger = logging.getLogger(__name__)
 
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 TEMPLATE_EXTRACTOR_SYSTEM = """You analyze previous outbound emails and extract a reusable style/template profile.
 
@@ -37,7 +39,7 @@ Return JSON only.
 
 
 def _clean_text(value: str) -> str:
-    return re.sub(r"\s+", " ", str(value or "")).strip()
+    return _WHITESPACE_RE.sub(" ", str(value or "")).strip()
 
 
 def _clip(value: str, *, limit: int = 1600) -> str:
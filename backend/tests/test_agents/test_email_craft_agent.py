@@ -1576,6 +1576,51 @@ class TestEmailCraftNode:
         assert "Lead B" in result["email_sequences"][1]["emails"][0]["subject"]
         assert "Lead B" in result["email_sequences"][1]["emails"][0]["body_text"]
 
+    @pytest.mark.asyncio
+    async def test_reused_template_personalization_runs_concurrently_in_order(self):
+        leads = [
+            {
+                "company_name": f"Lead {name}",
+                "country_code": "us",
+                "industry": "Industrial Supply",
+                "website": f"https://{name.lower()}.example.com",
+                "emails": [f"buyer@{name.lower()}.example.com"],
+            }
+            for name in ("A", "B", "C")
+        ]
+        state = _base_state(leads=leads)
+        active = {"now": 0, "peak": 0}
+
+        async def slow_personalize(llm, *, base_sequence, lead, target, insight):
+            active["now"] += 1
+            active["peak"] = max(active["peak"], active["now"])
+            await asyncio.sleep(0.01)
+            active["now"] -= 1
+            return None
+
+        with patch("agents.email_craft_agent.LLMTool") as MockLLM, \
+             patch("agents.email_craft_agent.get_settings") as mock_settings, \
+             patch("agents.email_craft_agent._personalize_template_sequence", side_effect=slow_personalize), \
+             patch("agents.email_craft_agent.react_loop", return_value=FAKE_EMAIL_RESPONSE):
+
+            mock_settings.return_value.email_gen_concurrency = 3
+            mock_settings.return_value.react_max_iterations = 3
+            mock_settings.return_value.email_template_max_send_count = 42
+
+            llm_inst = AsyncMock()
+            llm_inst.generate = AsyncMock(return_value=json.dumps({
+                "passed": True,
+                "issues": [],
+                "suggestions": [],
+            }))
+            llm_inst.close = AsyncMock()
+            MockLLM.return_value = llm_inst
+
+            result = await email_craft_node(state)
+
+        assert active["peak"] == 2
+        assert [seq["lead"]["company_name"] for seq in result["email_sequences"]] == ["Lead A", "Lead B", "Lead C"]
+
     @pytest.mark.asyncio
     async def test_generates_new_template_for_different_groups(self):
         leads = [
@@ -5,7 +5,7 @@ from unittest.mock import AsyncMock, patch, MagicMock
 
 import pytest
 
-from agents.lead_extract_agent import lead_extract_node, _scrape_and_extract, _verify_lead_emails, _apply_evidence_to_scores, _quick_gate_candidate, _has_concrete_customs_data, _normalize_decision_maker_emails, _is_generic_mailbox, _candidate_budget
+from agents.lead_extract_agent import lead_extract_node, _scrape_and_extract, _verify_lead_emails, _apply_evidence_to_scores, _quick_gate_candidate, _quick_gate_batch, _has_concrete_customs_data, _normalize_decision_maker_emails, _is_generic_mailbox, _candidate_budget, _official_website_domain
 import asyncio
 
 
@@ -332,6 +332,37 @@ class TestCandidateBudget:
         parsed = json.loads(result)
         assert parsed["company_name"] == "SolarTech GmbH"
 
+    @pytest.mark.asyncio
+    async def test_react_tool_extract_lead_info_reads_scraped_urls(self):
+        """extract_lead_info can analyze pages by URL without the model echoing them."""
+        from agents.lead_extract_agent import _build_react_tools
+
+        jina = AsyncMock()
+        jina.read = AsyncMock(return_value="# SolarTech GmbH\n" + "Inverter distributor in Berlin. " * 5)
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value=VALID_REACT_RESULT)
+
+        tools = _build_react_tools(jina, llm, AsyncMock(), {})
+        scrape_tool = next(t for t in tools if t.name == "scrape_page")
+        lead_tool = next(t for t in tools if t.name == "extract_lead_info")
+
+        await scrape_tool.fn(url="https://solartech.de")
+        result = await lead_tool.fn(urls=["https://solartech.de", "https://unknown.example"])
+
+        assert json.loads(result)["company_name"] == "SolarTech GmbH"
+        prompt = llm.generate.await_args.args[0]
+        assert "Inverter distributor in Berlin." in prompt
+
+        missing = json.loads(await lead_tool.fn(urls=["https://unknown.example"]))
+        assert "error" in missing
+
+
+class TestOfficialWebsiteDomain:
+    def test_company_sites_only(self):
+        assert _official_website_domain("https://www.Acme.com:8080/contact") == "acme.com"
+        assert _official_website_domain("https://linkedin.com/company/acme") == ""
+        assert _official_website_domain("https://linkedin.com/company/acme", "company_site") == "linkedin.com"
+
 
 class TestQuickGate:
     @pytest.mark.asyncio
@@ -380,6 +411,69 @@ class TestQuickGate:
         assert gate["customer_role_guess"] == "distributor"
         assert gate["competitor_risk"] == "high"
 
+    @pytest.mark.asyncio
+    async def test_quick_gate_batch_uses_one_call_and_keeps_order(self):
+        llm = AsyncMock()
+        llm.generate = AsyncMock(return_value=json.dumps({"results": [
+            {"index": 2, "pass_gate": False, "entity_type": "directory", "reason": "Directory.", "risk_flags": ["directory"]},
+            {"index": 1, "pass_gate": True, "entity_type": "company", "customer_role_guess": "distributor", "confidence": 0.8},
+        ]}))
+
+        verdicts = await _quick_gate_batch(
+            [{"title": "Acme Electrical"}, {"title": "Supplier Directory"}],
+            llm,
+            {"products": ["micro switch"]},
+        )
+
+        assert llm.generate.await_count == 1
+        assert [passed for passed, _ in verdicts] == [True, False]
+        assert verdicts[0][1]["customer_role_guess"] == "distributor"
+        assert "directory" in verdicts[1][1]["risk_flags"]
+
+    @pytest.mark.asyncio
+    async def test_quick_gate_batch_regates_whole_batch_when_a_verdict_is_missing(self):
+        llm = AsyncMock()
+        llm.generate = AsyncMock(side_effect=[
+            json.dumps({"results": [{"index": 1, "pass_gate": True, "entity_type": "company"}]}),
+            json.dumps({"pass_gate": True, "entity_type": "company"}),
+            json.dumps({"pass_gate": False, "entity_type": "media", "reason": "News site."}),
+        ])
+
+        verdicts = await _quick_gate_batch(
+            [{"title": "Acme Electrical"}, {"title": "Industry News"}],
+            llm,
+            {"products": ["micro switch"]},
+        )
+
+        assert llm.generate.await_count == 3
+        assert "Acme Electrical" in llm.generate.await_args_list[1].args[0]
+        assert "Industry News" in llm.generate.await_args_list[2].args[0]
+        assert [passed for passed, _ in verdicts] == [True, False]
+        assert verdicts[1][1]["entity_type"] == "media"
+
+    @pytest.mark.asyncio
+    async def test_quick_gate_batch_does_not_shift_zero_based_verdicts(self):
+        llm = AsyncMock()
+        llm.generate = AsyncMock(side_effect=[
+            json.dumps({"results": [
+                {"index": 0, "pass_gate": False, "entity_type": "directory"},
+                {"index": 1, "pass_gate": True, "entity_type": "company"},
+            ]}),
+            json.dumps({"pass_gate": True, "entity_type": "company"}),
+            json.dumps({"pass_gate": False, "entity_type": "directory"}),
+        ])
+
+        verdicts = await _quick_gate_batch(
+            [{"title": "Acme Electrical"}, {"title": "Supplier Directory"}],
+            llm,
+            {"products": ["micro switch"]},
+        )
+
+        assert "## Candidate 1 " in llm.generate.await_args_list[0].args[0]
+        assert "## Candidate 0 " not in llm.generate.await_args_list[0].args[0]
+        assert llm.generate.await_count == 3
+        assert [passed for passed, _ in verdicts] == [True, False]
+
     @pytest.mark.asyncio
     async def test_react_tool_find_customs_data(self):
         """Test the customs router tool function directly."""
@@ -117,6 +117,13 @@ class TestResultIdentityKey:
         key = _result_identity_key({"link": "https://example.com/a"})
         assert key == "url:https://example.com/a"
 
+    def test_url_variants_of_same_page_share_a_key(self):
+        keys = {
+            _result_identity_key({"link": link})
+            for link in ("https://acme.com", "https://acme.com/", "https://WWW.acme.com/#contact")
+        }
+        assert keys == {"url:https://acme.com"}
+
     def test_uses_place_id_without_url(self):
         key = _result_identity_key({"link": "", "maps_data": {"place_id": "PID-1"}})
         assert key == "place:pid-1"
@@ -1,6 +1,15 @@
+import pytest
 from fastapi.testclient import TestClient
 
 from api.app import create_app
+from config.settings import get_settings
+
+
+@pytest.fixture(autouse=True)
+def _isolated_db_paths(tmp_path, monkeypatch):
+    settings = get_settings()
+    monkeypatch.setattr(settings, "email_db_path", str(tmp_path / "email_automation.db"))
+    monkeypatch.setattr(settings, "automation_queue_db_path", str(tmp_path / "automation_queue.db"))
 
 
 def test_automation_routes(monkeypatch):
@@ -1,6 +1,7 @@
 from fastapi.testclient import TestClient
 
 from api.app import create_app
+from api.email_routes import _write_summary_to_hunt
 
 
 def test_create_and_start_email_campaign(monkeypatch, tmp_path):
@@ -692,3 +693,28 @@ def test_email_routes_require_token_when_configured(monkeypatch, tmp_path):
     get_settings.cache_clear()
     assert unauthorized.status_code == 401
     assert authorized.status_code == 200
+
+
+def test_write_summary_to_hunt_reuses_given_summary(monkeypatch):
+    hunt = {"result": {}}
+    monkeypatch.setattr("api.email_routes.load_hunt", lambda hunt_id: hunt)
+    monkeypatch.setattr("api.email_routes.save_hunt", lambda hunt_id, data: None)
+    summary = {
+        "campaign": {"id": "cmp_1", "status": "active"},
+        "sequence_count": 2,
+        "sent_count": 1,
+        "pending_count": 4,
+        "failed_count": 0,
+        "template_summary": [{"template_id": "tpl_1", "sent_count": 1}],
+        "sequences": [{"status": "replied"}, {"status": "scheduled"}],
+    }
+
+    # The store is never queried when the caller already built the summary.
+    _write_summary_to_hunt(object(), "hunt_1", "cmp_1", summary)
+
+    written = hunt["result"]["email_campaign_summary"]
+    assert written["status"] == "active"
+    assert written["sequences_total"] == 2
+    assert written["pending_count"] == 4
+    assert written["replied_count"] == 1
+    assert written["template_summary"] == [{"template_id": "tpl_1", "sent_count": 1}]
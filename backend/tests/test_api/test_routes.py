@@ -1,13 +1,19 @@
 """Tests for api/routes.py — FastAPI endpoints with httpx TestClient."""
 
-from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import AsyncClient, ASGITransport
 
 from api.app import create_app
-from api.routes import _hunts, _sequence_is_send_approved, stop_background_workers
+from api.routes import (
+    _dedupe_leads,
+    _hunts,
+    _scan_hunt_replies,
+    _sequence_is_send_approved,
+    _unique_leads_count,
+    stop_background_workers,
+)
 from config.settings import get_settings
 
 # Patch save_hunt globally so tests never write to disk
@@ -16,7 +22,7 @@ pytestmark = pytest.mark.usefixtures("_mock_save_hunt")
 
 @pytest.fixture(autouse=True)
 def _mock_save_hunt():
-    with patch("api.routes.save_hunt"):
+    with patch("api.routes.save_hunt"), patch("api.routes.save_hunt_async", new_callable=AsyncMock):
         yield
 
 
@@ -58,6 +64,18 @@ class TestBackgroundWorkers:
         assert _sequence_is_send_approved({"auto_send_eligible": False}) is True
 
 
+class TestLeadDedupe:
+    def test_unique_count_matches_dedupe(self):
+        leads = [
+            {"company_name": "Acme", "website": "https://acme.com"},
+            {"company_name": "Acme GmbH", "website": "HTTPS://ACME.COM "},
+            {"company_name": "Beta"},
+            {"emails": ["a@c.com"]},
+            "not-a-lead",
+        ]
+        assert _unique_leads_count(leads) == len(_dedupe_leads(leads)) == 3
+
+
 class TestCreateHunt:
     @pytest.mark.asyncio
     @patch("api.routes._run_hunt", new_callable=AsyncMock)
@@ -186,9 +204,12 @@ class TestHuntStatus:
 
 
 class TestTemplateSeed:
+    @pytest.fixture(autouse=True)
+    def _template_seed_cache_path(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(get_settings(), "template_seed_cache_path", str(tmp_path / "template_seed_cache.json"))
+
     @pytest.mark.asyncio
     async def test_prepare_template_seed(self, client, monkeypatch):
-        Path(get_settings().template_seed_cache_path).unlink(missing_ok=True)
         monkeypatch.setattr(
             "api.routes.insight_node",
             AsyncMock(return_value={"insight": {
@@ -226,7 +247,6 @@ class TestTemplateSeed:
 
     @pytest.mark.asyncio
     async def test_prepare_template_seed_uses_cache(self, client, monkeypatch):
-        Path(get_settings().template_seed_cache_path).unlink(missing_ok=True)
         monkeypatch.setattr(
             "api.routes.insight_node",
             AsyncMock(return_value={"insight": {
@@ -702,6 +722,46 @@ class TestDetectReplies:
         assert resp.status_code == 409
         assert "IMAP is not configured" in resp.json()["detail"]
 
+    @pytest.mark.asyncio
+    async def test_background_scan_checks_each_sent_sequence(self, app):
+        def _sequence(email: str, status: str) -> dict:
+            return {
+                "lead": {"company_name": email, "emails": [email]},
+                "emails": [{"send_status": status}],
+            }
+
+        _hunts["reply-scan"] = {
+            "status": "completed",
+            "result": {
+                "email_sequences": [
+                    _sequence("a@acme.com", "sent"),
+                    _sequence("b@beta.com", "draft"),
+                    _sequence("c@gamma.com", "sent"),
+                ],
+            },
+        }
+
+        def fake_search(settings, *, from_address):
+            if from_address == "c@gamma.com":
+                raise RuntimeError("imap down")
+            return [{"from_address": from_address}]
+
+        fake_settings = MagicMock()
+        fake_settings.email_reply_detection_enabled = True
+        with (
+            patch("api.routes.get_settings", return_value=fake_settings),
+            patch("api.routes.ensure_imap_tested"),
+            patch("api.routes.search_recent_replies", side_effect=fake_search) as mock_search,
+        ):
+            await _scan_hunt_replies()
+
+        sequences = _hunts["reply-scan"]["result"]["email_sequences"]
+        assert mock_search.call_count == 2
+        assert sequences[0]["lead"]["reply_status"] == "replied"
+        assert sequences[0]["reply_detection"]["reply_count"] == 1
+        assert "reply_detection" not in sequences[1]
+        assert "reply_detection" not in sequences[2]
+
 
 class TestListHunts:
     @pytest.mark.asyncio
@@ -8,7 +8,7 @@ from httpx import AsyncClient, ASGITransport
 
 from api.app import create_app
 from api.routes import _hunts, _sse_queues
-from api.sse import _sse_event, _event_generator
+from api.sse import _sse_event, _event_generator, _automation_job_event_generator
 
 
 @pytest.fixture
@@ -209,3 +209,26 @@ class TestSseEndpoint:
         assert "text/event-stream" in resp.headers["content-type"]
         assert "event: heartbeat" in resp.text
         assert "Waiting for consumer to claim" in resp.text
+
+
+class TestAutomationJobStream:
+    @pytest.mark.asyncio
+    async def test_unchanged_polls_emit_nothing(self, monkeypatch):
+        queued = {"id": "job-1", "status": "queued", "progress_message": "Waiting"}
+        polls = [queued, dict(queued), dict(queued), {**queued, "status": "completed"}]
+
+        class FakeQueue:
+            def get(self, job_id):
+                return polls.pop(0)
+
+        async def _fast_sleep(_: float):
+            return None
+
+        monkeypatch.setattr("api.sse._automation_job_queue", lambda: FakeQueue())
+        monkeypatch.setattr("api.sse._serialize_job", lambda job: {"job_id": job["id"], "status": job["status"]})
+        monkeypatch.setattr("api.sse.asyncio.sleep", _fast_sleep)
+
+        events = [event async for event in _automation_job_event_generator("job-1")]
+
+        assert [e.split("\n", 1)[0] for e in events] == ["event: heartbeat", "event: completed"]
+        assert json.loads(events[1].split("data: ")[1]) == {"job_id": "job-1", "status": "completed"}
@@ -15,6 +15,8 @@ def test_enqueue_claim_and_complete(tmp_path):
     assert job["id"] == job_id
     assert job["status"] == "running"
     assert queue.count_by_status("running") == 1
+    queue.enqueue({"description": "Find more buyers"}, now_iso="2026-04-04T00:00:02+00:00")
+    assert queue.count_grouped_by_status() == {"queued": 1, "running": 1}
 
     queue.mark_completed(job_id, hunt_id="hunt-123", finished_at="2026-04-04T00:10:00+00:00")
     completed = queue.get(job_id)
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import threading
+from pathlib import Path
+
+import pytest
+
 from automation.job_queue import HuntJobQueue
 from automation.metrics import collect_automation_metrics, collect_automation_status
-from api.hunt_store import load_all_hunts, save_hunt
+from api import hunt_store
+from api.hunt_store import _prepare_save, _write_prepared, load_all_hunts, save_hunt, save_hunt_async
 from emailing.store import EmailStore
 
 
@@ -211,13 +217,17 @@ def test_collect_automation_metrics_loads_persisted_hunts_when_not_provided(monk
     assert metrics["hunts"]["generated_email_sequences"] == 3
 
 
-def test_load_all_hunts_runtime_read_does_not_mark_running_as_failed(monkeypatch, tmp_path):
-    hunts_dir = tmp_path / "hunts"
+@pytest.fixture
+def hunts_dir(monkeypatch, tmp_path):
+    path = tmp_path / "hunts"
     monkeypatch.setattr(
         "api.hunt_store.get_settings",
-        lambda: type("S", (), {"hunts_dir": str(hunts_dir)})(),
+        lambda: type("S", (), {"hunts_dir": str(path)})(),
     )
+    return path
+
 
+def test_load_all_hunts_runtime_read_does_not_mark_running_as_failed(hunts_dir):
     save_hunt(
         "hunt-running",
         {
@@ -232,3 +242,105 @@ def test_load_all_hunts_runtime_read_does_not_mark_running_as_failed(monkeypatch
 
     assert runtime_view["hunt-running"]["status"] == "running"
     assert startup_view["hunt-running"]["status"] == "failed"
+
+
+def test_save_hunt_skips_rewrite_when_payload_unchanged(monkeypatch, hunts_dir):
+    writes = []
+    original_write_bytes = Path.write_bytes
+
+    def counting_write_bytes(self, data):
+        writes.append(self.name)
+        return original_write_bytes(self, data)
+
+    monkeypatch.setattr(Path, "write_bytes", counting_write_bytes)
+
+    save_hunt("hunt-same", {"status": "running"})
+    save_hunt("hunt-same", {"status": "running"})
+    save_hunt("hunt-same", {"status": "completed"})
+
+    assert writes == ["hunt-same.json.tmp", "hunt-same.json.tmp"]
+    assert load_all_hunts()["hunt-same"]["status"] == "completed"
+
+
+def test_save_hunt_failure_keeps_previous_file(monkeypatch, hunts_dir):
+    save_hunt("hunt-torn", {"status": "running", "leads": [{"company_name": "Acme"}]})
+
+    original_write_bytes = Path.write_bytes
+
+    def torn_write_bytes(self, data):
+        original_write_bytes(self, data[: len(data) // 2])
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "write_bytes", torn_write_bytes)
+    save_hunt("hunt-torn", {"status": "completed", "leads": []})
+    monkeypatch.setattr(Path, "write_bytes", original_write_bytes)
+
+    assert load_all_hunts()["hunt-torn"]["leads"] == [{"company_name": "Acme"}]
+
+
+async def test_save_hunt_async_ignores_stale_out_of_order_write(hunts_dir):
+    hunt = {"status": "running"}
+    older = _prepare_save("hunt-async", hunt)
+    hunt["status"] = "completed"
+    await save_hunt_async("hunt-async", hunt)
+    hunt["status"] = "mutated-after-save"
+    _write_prepared(*older)
+
+    assert load_all_hunts()["hunt-async"]["status"] == "completed"
+
+
+def test_save_hunt_repeat_of_older_state_is_not_skipped_while_write_pending(hunts_dir):
+    save_hunt("hunt-pending", {"status": "running"})
+    pending = _prepare_save("hunt-pending", {"status": "paused"})
+    save_hunt("hunt-pending", {"status": "running"})
+    _write_prepared(*pending)
+
+    assert load_all_hunts()["hunt-pending"]["status"] == "running"
+
+
+def test_save_hunt_does_not_wait_on_another_hunts_write(monkeypatch, hunts_dir):
+    started, release = threading.Event(), threading.Event()
+    original_write_atomic = hunt_store._write_atomic
+
+    def slow_write_atomic(path, raw):
+        if path.name == "hunt-slow.json":
+            started.set()
+            release.wait(5)
+        original_write_atomic(path, raw)
+
+    monkeypatch.setattr(hunt_store, "_write_atomic", slow_write_atomic)
+    writer = threading.Thread(target=save_hunt, args=("hunt-slow", {"status": "running"}))
+    writer.start()
+    assert started.wait(5)
+
+    done = threading.Thread(target=save_hunt, args=("hunt-fast", {"status": "running"}))
+    done.start()
+    done.join(1)
+    fast_finished = not done.is_alive()
+    release.set()
+    writer.join()
+    done.join()
+
+    assert fast_finished
+    assert set(load_all_hunts()) == {"hunt-slow", "hunt-fast"}
+
+
+def test_load_all_hunts_runtime_read_reparses_only_changed_files(monkeypatch, hunts_dir):
+    save_hunt("hunt-a", {"status": "running"})
+    save_hunt("hunt-b", {"status": "completed"})
+    save_hunt("hunt-c", {"status": "completed"})
+    load_all_hunts()
+
+    parsed: list[str] = []
+    real_loads = hunt_store.loads
+    monkeypatch.setattr(hunt_store, "loads", lambda raw: parsed.append(raw) or real_loads(raw))
+
+    save_hunt("hunt-a", {"status": "completed", "leads": [{"company_name": "Acme"}]})
+    (hunts_dir / "hunt-b.json").unlink()
+    hunts = load_all_hunts()
+
+    assert len(parsed) == 1
+    assert hunts == {
+        "hunt-a": {"status": "completed", "leads": [{"company_name": "Acme"}]},
+        "hunt-c": {"status": "completed"},
+    }
@@ -1,5 +1,8 @@
+import sqlite3
 from pathlib import Path
 
+import pytest
+
 from emailing.store import EmailStore
 
 
@@ -34,6 +37,21 @@ def test_email_store_init_and_account_roundtrip(tmp_path: Path):
     assert account["from_email"] == "sales@example.com"
 
 
+def test_init_db_runs_schema_setup_once_per_file(tmp_path: Path, monkeypatch):
+    db_path = tmp_path / "email.db"
+    EmailStore(str(db_path)).init_db()
+
+    store = EmailStore(str(db_path))
+    monkeypatch.setattr(store, "_connect", lambda: pytest.fail("schema setup repeated"))
+    store.init_db()
+
+    # A deleted database is recreated rather than trusted from memory.
+    monkeypatch.undo()
+    db_path.unlink()
+    store.init_db()
+    assert store.get_account("missing") is None
+
+
 def test_message_lifecycle(tmp_path: Path):
     db_path = tmp_path / "email.db"
     store = EmailStore(str(db_path))
@@ -101,6 +119,53 @@ def test_message_lifecycle(tmp_path: Path):
         sent_at="2026-03-09T01:05:00Z",
     )
     assert store.list_pending_messages_ready("2026-03-09T02:00:00Z") == []
+    assert store.count_messages_grouped_by_status() == {"sent": 1}
+
+
+def test_create_sequence_with_messages_is_atomic(tmp_path: Path):
+    store = EmailStore(str(tmp_path / "email.db"))
+    store.init_db()
+    sequence = {
+        "id": "seq_1",
+        "campaign_id": "cmp_1",
+        "hunt_id": "hunt_1",
+        "lead_key": "w:acme.com",
+        "lead_email": "buyer@acme.com",
+        "lead_name": "Acme",
+        "status": "scheduled",
+        "next_scheduled_at": "2026-03-09T00:00:00Z",
+        "created_at": "2026-03-09T00:00:00Z",
+        "updated_at": "2026-03-09T00:00:00Z",
+    }
+
+    def message(message_id: str, step_number: int) -> dict:
+        return {
+            "id": message_id,
+            "sequence_id": "seq_1",
+            "step_number": step_number,
+            "goal": "intro",
+            "locale": "en",
+            "subject": f"Step {step_number}",
+            "body_text": "Body",
+            "status": "pending",
+            "scheduled_at": "2026-03-09T00:00:00Z",
+            "created_at": "2026-03-09T00:00:00Z",
+            "updated_at": "2026-03-09T00:00:00Z",
+        }
+
+    store.create_sequence_with_messages(sequence, [message("msg_1", 1), message("msg_2", 2)])
+    assert store.get_sequence("seq_1")["next_scheduled_at"] == "2026-03-09T00:00:00Z"
+    assert [m["step_number"] for m in store.list_messages_for_sequence("seq_1")] == [1, 2]
+
+    # A duplicate step rolls back the whole sequence, not just the bad row.
+    duplicate = {**sequence, "id": "seq_2", "lead_key": "w:other.com"}
+    with pytest.raises(sqlite3.IntegrityError):
+        store.create_sequence_with_messages(
+            duplicate,
+            [{**message("msg_3", 1), "sequence_id": "seq_2"}, {**message("msg_4", 1), "sequence_id": "seq_2"}],
+        )
+    assert store.get_sequence("seq_2") is None
+    assert store.get_message("msg_3") is None
 
 
 def test_template_performance_aggregation(tmp_path: Path):
@@ -176,6 +241,9 @@ def test_template_performance_aggregation(tmp_path: Path):
     assert summary["tpl_123"]["replied_count"] == 1
     assert summary["tpl_123"]["reply_rate"] == 50.0
     assert summary["tpl_123"]["remaining_capacity"] == 98
+    assert store.count_messages_by_status_for_campaign("cmp_tpl") == {"sent": 2}
+    assert store.count_sequences_by_status_for_campaign("cmp_tpl") == {"scheduled": 1, "replied": 1}
+    assert [seq["id"] for seq in store.list_sequences_for_hunt("hunt_tpl")] == ["seq_tpl_1", "seq_tpl_2"]
 
 
 def test_template_performance_uses_custom_thresholds(tmp_path: Path):
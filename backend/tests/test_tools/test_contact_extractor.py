@@ -176,11 +176,29 @@ class TestExtractSocialMedia:
         social = extract_social_media(text)
         assert "facebook" not in social
 
+    def test_share_link_falls_through_to_profile(self):
+        text = (
+            "https://twitter.com/acme_second "
+            "https://www.facebook.com/sharer "
+            "https://www.facebook.com/acmecorp "
+            "https://twitter.com/acme_third"
+        )
+        social = extract_social_media(text)
+        assert social == {
+            "facebook": "https://www.facebook.com/acmecorp",
+            "twitter": "https://twitter.com/acme_second",
+        }
+        assert list(social) == ["facebook", "twitter"]
+
     def test_no_social(self):
         text = "This company has no social media presence listed."
         social = extract_social_media(text)
         assert social == {}
 
+    def test_bare_host_without_scheme_ignored(self):
+        text = "Find us on linkedin.com/company/acme-corp and facebook.com/acmecorp"
+        assert extract_social_media(text) == {}
+
 
 # ── Contact page discovery ─────────────────────────────────────────────
 
@@ -1,14 +1,21 @@
+import asyncio
+
 import pytest
 
-from tools.customs_router import build_customs_queries, find_customs_data
+from tools.customs_router import (
+    _extract_partner_countries,
+    _fetch_provider_page,
+    build_customs_queries,
+    find_customs_data,
+)
 
 
 class DummyGoogle:
     def __init__(self, results):
         self._results = results
 
-    async def search(self, query, num=5):
-        return list(self._results)
+    async def search_many(self, queries, num=5):
+        return [list(self._results) for _ in queries]
 
 
 class DummyJina:
@@ -31,6 +38,11 @@ def test_build_customs_queries_includes_provider_and_context():
     assert any("micro switch rotary switch" in q for q in queries)
 
 
+def test_extract_partner_countries_keeps_declared_order_and_aliases():
+    text = "Shipped to USA and Germany; imported from China via the UK"
+    assert _extract_partner_countries(text) == ["United States", "Germany", "United Kingdom", "China"]
+
+
 @pytest.mark.asyncio
 async def test_find_customs_data_returns_structured_evidence(monkeypatch):
     google = DummyGoogle([
@@ -42,7 +54,7 @@ async def test_find_customs_data_returns_structured_evidence(monkeypatch):
     ])
     jina = DummyJina("")
 
-    async def fake_fetch_provider_page(provider, url, jina_reader):
+    async def fake_fetch_provider_page(provider, url, jina_reader, raw_client=None):
         return (
             "Acme Gmbh importer shipments from Vietnam to Germany in 2024. "
             "HS code 853650. Import records for micro switch.",
@@ -80,7 +92,7 @@ async def test_find_customs_data_returns_no_data_when_only_invalid_pages(monkeyp
     ])
     jina = DummyJina("")
 
-    async def fake_fetch_provider_page(provider, url, jina_reader):
+    async def fake_fetch_provider_page(provider, url, jina_reader, raw_client=None):
         return (
             "Warning: Target URL returned error 404: Not Found. "
             "Choose the Largest & Most Trusted Export-Import Trade Data Platform.",
@@ -98,3 +110,135 @@ async def test_find_customs_data_returns_no_data_when_only_invalid_pages(monkeyp
 
     assert result["status"] == "no_data"
     assert result["summary"] == "No concrete customs data found"
+
+
+@pytest.mark.asyncio
+async def test_find_customs_data_batches_queries_in_one_call():
+    class BatchGoogle:
+        def __init__(self):
+            self.calls = []
+
+        async def search_many(self, queries, num=5):
+            self.calls.append(list(queries))
+            return [[] for _ in queries]
+
+    google = BatchGoogle()
+    result = await find_customs_data(
+        company_name="Acme GmbH",
+        google_search=google,
+        jina_reader=DummyJina(""),
+    )
+
+    assert result["status"] == "no_data"
+    assert len(google.calls) == 1
+    assert len(google.calls[0]) == 8
+
+
+@pytest.mark.asyncio
+async def test_find_customs_data_survives_search_failure():
+    class FailingGoogle:
+        async def search_many(self, queries, num=5):
+            raise RuntimeError("boom")
+
+    result = await find_customs_data(
+        company_name="Acme GmbH",
+        google_search=FailingGoogle(),
+        jina_reader=DummyJina(""),
+    )
+
+    assert result["status"] == "no_data"
+
+
+@pytest.mark.asyncio
+async def test_find_customs_data_shares_one_raw_client(monkeypatch):
+    google = DummyGoogle([
+        {"title": "Acme Gmbh importer", "link": "https://www.importgenius.com/importers/acme-gmbh"},
+        {"title": "Acme Gmbh shipments", "link": "https://www.importgenius.com/importers/acme-gmbh-2"},
+    ])
+    clients = []
+
+    async def fake_fetch_provider_page(provider, url, jina_reader, raw_client=None):
+        clients.append(raw_client)
+        return "", "raw_fetch", "blocked"
+
+    monkeypatch.setattr("tools.customs_router._fetch_provider_page", fake_fetch_provider_page)
+
+    await find_customs_data(company_name="Acme GmbH", google_search=google, jina_reader=DummyJina(""))
+
+    assert len(clients) == 2
+    assert clients[0] is not None and clients[0] is clients[1]
+
+
+@pytest.mark.asyncio
+async def test_find_customs_data_fetches_duplicate_links_once(monkeypatch):
+    # DummyGoogle returns the same rows for every query.
+    google = DummyGoogle([
+        {"title": "Acme Gmbh importer", "link": "https://www.volza.com/company-profile/acme-gmbh"},
+    ])
+    fetched = []
+
+    async def fake_fetch_provider_page(provider, url, jina_reader, raw_client=None):
+        fetched.append(url)
+        return "", "jina_reader", "blocked"
+
+    monkeypatch.setattr("tools.customs_router._fetch_provider_page", fake_fetch_provider_page)
+
+    await find_customs_data(company_name="Acme GmbH", google_search=google, jina_reader=DummyJina(""))
+
+    assert fetched == ["https://www.volza.com/company-profile/acme-gmbh"]
+
+
+@pytest.mark.asyncio
+async def test_find_customs_data_fetches_provider_pages_concurrently(monkeypatch):
+    google = DummyGoogle([
+        {"title": f"Acme Gmbh shipments {i}", "link": f"https://www.volza.com/company-profile/acme-gmbh-{i}"}
+        for i in range(3)
+    ])
+    state = {"active": 0, "peak": 0}
+
+    async def fake_fetch_provider_page(provider, url, jina_reader, raw_client=None):
+        state["active"] += 1
+        state["peak"] = max(state["peak"], state["active"])
+        await asyncio.sleep(0.01)
+        state["active"] -= 1
+        return f"Acme Gmbh imports from Vietnam in 2024. HS code 853650. {url}", "jina_reader", ""
+
+    monkeypatch.setattr("tools.customs_router._fetch_provider_page", fake_fetch_provider_page)
+
+    result = await find_customs_data(company_name="Acme GmbH", google_search=google, jina_reader=DummyJina(""))
+
+    assert state["peak"] == 3
+    assert len(result["evidence"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_importgenius_raw_fetch_returns_visible_text(monkeypatch):
+    markup = (
+        "<html><head><style>body { color: red }</style><script>var x = '<b>';</script></head>"
+        "<body><h1>Acme&nbsp;GmbH</h1><p>Imports from Vietnam in 2024</p><!-- hidden --></body></html>"
+    )
+
+    async def fake_fetch_raw(url, client=None):
+        return markup, ""
+
+    monkeypatch.setattr("tools.customs_router._fetch_raw", fake_fetch_raw)
+
+    text, method, error = await _fetch_provider_page(
+        "importgenius", "https://www.importgenius.com/importers/acme", DummyJina("jina text")
+    )
+
+    assert (text, method, error) == ("Acme GmbH Imports from Vietnam in 2024", "raw_fetch", "")
+
+
+@pytest.mark.asyncio
+async def test_importgenius_script_shell_falls_back_to_jina(monkeypatch):
+    async def fake_fetch_raw(url, client=None):
+        return "<html><body><div id='root'></div><script>render()</script></body></html>", ""
+
+    monkeypatch.setattr("tools.customs_router._fetch_raw", fake_fetch_raw)
+
+    text, method, _ = await _fetch_provider_page(
+        "importgenius", "https://www.importgenius.com/importers/acme", DummyJina("jina text")
+    )
+
+    assert (text, method) == ("jina text", "jina_reader")
@@ -0,0 +1,36 @@
+"""Tests for tools/email_finder.py — regex email extraction."""
+
+from tools.email_finder import extract_emails_from_text
+
+
+class TestExtractEmailsFromText:
+    def test_dedupes_case_insensitively_in_order(self):
+        text = "Sales@Acme.com, info@acme.com, sales@acme.com"
+        assert extract_emails_from_text(text) == ["sales@acme.com", "info@acme.com"]
+
+    def test_skips_blacklisted(self):
+        text = "noreply@acme.com user@example.com logo@2x.png sales@acme.com"
+        assert extract_emails_from_text(text) == ["sales@acme.com"]
+
+    def test_limit_stops_after_unique_matches(self):
+        text = " ".join(["dup@acme.com"] * 50 + [f"user{i}@acme.com" for i in range(50)])
+        emails = extract_emails_from_text(text, limit=3)
+        assert emails == ["dup@acme.com", "user0@acme.com", "user1@acme.com"]
+
+    def test_no_limit_returns_all(self):
+        text = " ".join(f"user{i}@acme.com" for i in range(30))
+        assert len(extract_emails_from_text(text)) == 30
+
+    def test_text_without_at_sign(self):
+        assert extract_emails_from_text("Contact sales at acme dot com") == []
+
+    def test_long_run_without_at_sign_is_linear(self):
+        # Quadratic before the start-of-run lookbehind: minutes at this size.
+        text = "data:image/png;base64," + "A" * 200_000 + " sales@acme.com"
+        assert extract_emails_from_text(text) == ["sales@acme.com"]
+
+    def test_match_starts_at_beginning_of_local_part(self):
+        assert extract_emails_from_text("mail: first.last+sales@acme.co.uk.") == ["first.last+sales@acme.co.uk"]
+
+    def test_no_fragment_match_after_adjacent_address(self):
+        assert extract_emails_from_text("a@b.co.uk.x@y.com") == ["a@b.co.uk"]
@@ -114,3 +114,36 @@ class TestEmailVerifierTool:
         assert results[0]["is_deliverable"] is True
         assert results[1]["is_deliverable"] is False
         assert results[2]["valid_syntax"] is False
+
+    @pytest.mark.asyncio
+    async def test_verify_batch_resolves_each_domain_once(self):
+        tool = EmailVerifierTool()
+        calls = []
+
+        def mock_mx(domain):
+            calls.append(domain)
+            return ["mx.good.com"] if domain == "good.com" else []
+
+        with patch("tools.email_verifier._get_mx_records", side_effect=mock_mx):
+            results = await tool.verify_batch([
+                "sales@good.com",
+                "info@good.com",
+                "user@bad.xyz",
+            ])
+            again = await tool.verify("ceo@good.com")
+
+        assert sorted(calls) == ["bad.xyz", "good.com"]
+        assert [r["is_deliverable"] for r in results] == [True, True, False]
+        assert again["mx_records"] == ["mx.good.com"]
+
+    @pytest.mark.asyncio
+    async def test_empty_mx_answer_is_not_cached(self):
+        tool = EmailVerifierTool()
+
+        with patch("tools.email_verifier._get_mx_records", side_effect=[[], ["mx.acme.com"]]) as mock_mx:
+            first = await tool.verify("sales@acme.com")
+            second = await tool.verify("info@acme.com")
+
+        assert mock_mx.call_count == 2
+        assert first["is_deliverable"] is False
+        assert second["is_deliverable"] is True
@@ -69,10 +69,23 @@ class TestExcelParserCSV:
         rows = tool.parse_to_dicts(sample_csv, max_rows=2)
         assert len(rows) == 2
 
+    def test_max_rows_stops_parsing_early(self, tmp_path):
+        # The malformed row lies beyond max_rows, so it is never parsed.
+        path = tmp_path / "large.csv"
+        path.write_text("company,country\nSolarTech,DE\nGreenPower,CN\nbroken,row,extra\n")
+        tool = ExcelParserTool()
+        assert "GreenPower" in tool.parse_to_markdown(str(path), max_rows=2)
+
     def test_get_row_count(self, sample_csv):
         tool = ExcelParserTool()
         assert tool.get_row_count(sample_csv) == 3
 
+    def test_get_row_count_handles_quoted_newlines(self, tmp_path):
+        path = tmp_path / "notes.csv"
+        path.write_text('company,notes\nSolarTech,"line one\nline two"\nGreenPower,\n')
+        tool = ExcelParserTool()
+        assert tool.get_row_count(str(path)) == 2
+
     def test_get_sheet_names_csv(self, sample_csv):
         tool = ExcelParserTool()
         assert tool.get_sheet_names(sample_csv) == ["Sheet1"]
@@ -78,3 +78,122 @@ class TestGoogleSearchTool:
         with pytest.raises(RuntimeError, match="SERPER_API_KEY"):
             await tool.search("test")
         await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_identical_queries_are_served_from_cache(self):
+        tool = GoogleSearchTool(settings=_make_settings())
+        mock_resp = httpx.Response(200, json=SERPER_RESPONSE, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, return_value=mock_resp) as post:
+            first = await tool.search("solar inverter distributor")
+            first[0]["title"] = "mutated"
+            second = await tool.search("solar inverter distributor")
+            await tool.search("solar inverter distributor", gl="de")
+
+        assert post.await_count == 2
+        assert second[0]["title"] == "SolarTech GmbH"
+        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_survives_new_tool_instance(self, tmp_path):
+        settings = _make_settings(serper_cache_dir=str(tmp_path))
+        mock_resp = httpx.Response(200, json=SERPER_RESPONSE, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, return_value=mock_resp) as post:
+            first_tool = GoogleSearchTool(settings=settings)
+            await first_tool.search("solar inverter distributor")
+            await first_tool.close()
+
+            second_tool = GoogleSearchTool(settings=settings)
+            results = await second_tool.search("solar inverter distributor")
+            await second_tool.close()
+
+        assert post.await_count == 1
+        assert results[0]["title"] == "SolarTech GmbH"
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_disk_cache_entry_is_refetched(self, tmp_path):
+        settings = _make_settings(serper_cache_dir=str(tmp_path), serper_cache_ttl_seconds=0)
+        mock_resp = httpx.Response(200, json=SERPER_RESPONSE, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, return_value=mock_resp) as post:
+            for _ in range(2):
+                tool = GoogleSearchTool(settings=settings)
+                await tool.search("solar inverter distributor")
+                await tool.close()
+
+        assert post.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_search_many_sends_uncached_queries_in_one_batch(self):
+        tool = GoogleSearchTool(settings=_make_settings())
+        captured = []
+
+        async def mock_post(url, **kwargs):
+            captured.append(kwargs["json"])
+            body = kwargs["json"]
+            if isinstance(body, dict):
+                return httpx.Response(200, json=SERPER_RESPONSE, request=_FAKE_REQUEST)
+            payload = [
+                {"organic": [{"title": f"{item['q']} result", "link": f"https://{i}.example"}]}
+                for i, item in enumerate(body)
+            ]
+            return httpx.Response(200, json=payload, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", side_effect=mock_post):
+            await tool.search("cached query", num=5)
+            batches = await tool.search_many(["alpha", "cached query", "beta", "alpha"], num=5)
+
+        assert captured[1] == [{"q": "alpha", "num": 5}, {"q": "beta", "num": 5}]
+        assert [rows[0]["title"] for rows in batches] == [
+            "alpha result", "SolarTech GmbH", "beta result", "alpha result",
+        ]
+        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_is_retried_per_query(self):
+        tool = GoogleSearchTool(settings=_make_settings())
+        captured = []
+
+        async def mock_post(url, **kwargs):
+            body = kwargs["json"]
+            captured.append(body)
+            if isinstance(body, list) or body["q"] == "bad query":
+                return httpx.Response(400, json={"message": "bad request"}, request=_FAKE_REQUEST)
+            return httpx.Response(200, json=SERPER_RESPONSE, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", side_effect=mock_post):
+            batches = await tool.search_many(["alpha", "bad query"], num=5)
+            # The failed query was not cached, so it is asked again.
+            await tool.search_many(["alpha", "bad query"], num=5)
+
+        assert batches[0][0]["title"] == "SolarTech GmbH"
+        assert batches[1] == []
+        assert captured[0] == [{"q": "alpha", "num": 5}, {"q": "bad query", "num": 5}]
+        assert captured[-1] == {"q": "bad query", "num": 5}
+        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_non_dict_batch_elements_only_empty_their_query(self):
+        tool = GoogleSearchTool(settings=_make_settings())
+        payload = ["unexpected", {"organic": ["junk", SERPER_RESPONSE["organic"][0]]}]
+        resp = httpx.Response(200, json=payload, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, return_value=resp) as post:
+            batches = await tool.search_many(["alpha", "beta"], num=5)
+
+        assert post.await_count == 1
+        assert batches[0] == []
+        assert [row["title"] for row in batches[1]] == ["SolarTech GmbH"]
+        await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_search_many_raises_when_every_query_fails(self):
+        tool = GoogleSearchTool(settings=_make_settings())
+        resp = httpx.Response(403, json={"message": "forbidden"}, request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "post", new_callable=AsyncMock, return_value=resp):
+            with pytest.raises(httpx.HTTPStatusError):
+                await tool.search_many(["alpha", "beta"], num=5)
+        await tool.close()
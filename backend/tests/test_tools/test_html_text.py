@@ -0,0 +1,73 @@
+"""Tests for tools/html_text.py — regex HTML to text reduction."""
+
+import random
+
+from tools.html_text import compact_for_llm, html_to_text
+
+_PAGE = (
+    "<html><head><title>Acme GmbH</title><style>p{color:red}</style></head><body>"
+    "<!-- nav --><h1>About &amp; Contact</h1><p>Solar   inverters<br>since 1998</p>"
+    '<a class="x" href="/kontakt"><span>Kontakt</span></a>'
+    "<script>track();</script></body></html>"
+)
+
+
+class TestHtmlToText:
+    def test_plain_text_collapses_whitespace(self):
+        assert html_to_text(_PAGE) == (
+            "Acme GmbH About & Contact Solar inverters since 1998 Kontakt"
+        )
+
+    def test_keep_links_drops_head_and_keeps_anchors(self):
+        text = html_to_text(_PAGE, keep_links=True)
+        assert text.splitlines() == [
+            "About & Contact",
+            "Solar inverters",
+            "since 1998",
+            "[Kontakt](/kontakt)",
+        ]
+
+    def test_unclosed_anchors_do_not_swallow_following_links(self):
+        markup = '<p><a href="/broken">Broken <a href="/kontakt">Kontakt</a></p>'
+        assert "[Kontakt](/kontakt)" in html_to_text(markup, keep_links=True)
+
+    def test_stray_angle_bracket_stops_at_next_tag(self):
+        assert html_to_text("<p>1 < 2</p><p>ok</p>") == "1 < 2 ok"
+
+
+class TestCompactForLlm:
+    def test_drops_images_and_link_targets_but_keeps_contact_links(self):
+        text = (
+            "[![logo](https://cdn.example.com/logo.png)](https://acme.de/) Welcome\n"
+            '[About us](https://acme.de/about?utm_source=x "About") | '
+            "[Email](mailto:sales@acme.de) | [+49 30 1234](tel:+49301234)"
+        )
+        assert compact_for_llm(text) == (
+            "Welcome\nAbout us | Email (mailto:sales@acme.de) | +49 30 1234 (tel:+49301234)"
+        )
+
+    def test_text_without_links_is_unchanged(self):
+        assert compact_for_llm("  Plain page\n\ntext  ") == "  Plain page\n\ntext  "
+
+    def test_limit_matches_compacting_the_whole_page(self):
+        page = "".join(
+            f"Line {i} ![img](https://cdn.example.com/{i}.png) [Product {i}](https://acme.de/p/{i})\n"
+            for i in range(500)
+        )
+        assert compact_for_llm(page, limit=300) == compact_for_llm(page)[:300]
+        assert compact_for_llm("short [page](https://acme.de)", limit=300) == "short page"
+
+    def test_limit_matches_whole_page_when_cuts_fall_inside_links(self):
+        rng = random.Random(20)
+        pieces = [
+            "word", " ", "  ", "\n", "\n\n", '"', "!", "[lbl]", "(",
+            "[lbl](https://ex.com/a)", "![img](https://cdn.ex.com/i.png)",
+            '[t](https://ex.com/t "Title")', "[mail](mailto:a@ex.com)",
+            "[x](https://ex.com/x\n\"t\")", "![y](https://ex.com/y\n \"t\")",
+        ]
+        for _ in range(1500):
+            page = "".join(rng.choice(pieces) for _ in range(rng.randint(5, 120)))
+            if "](" not in page:
+                continue
+            limit = rng.randint(1, 120)
+            assert compact_for_llm(page, limit=limit) == compact_for_llm(page)[:limit], (page, limit)
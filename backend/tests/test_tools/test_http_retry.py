@@ -0,0 +1,57 @@
+"""Tests for tools/http_retry.py — Retry-After aware tenacity wait."""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock
+
+import httpx
+from tenacity import Future
+from tenacity.wait import wait_fixed
+
+from tools.http_retry import WaitRetryAfter, retry_after_seconds
+
+_REQUEST = httpx.Request("POST", "https://google.serper.dev/search")
+
+
+def _status_error(status: int, headers: dict | None = None) -> httpx.HTTPStatusError:
+    resp = httpx.Response(status, headers=headers or {}, request=_REQUEST)
+    return httpx.HTTPStatusError("error", request=_REQUEST, response=resp)
+
+
+def _state_for(exc: BaseException) -> MagicMock:
+    outcome = Future(attempt_number=1)
+    outcome.set_exception(exc)
+    state = MagicMock()
+    state.outcome = outcome
+    return state
+
+
+class TestRetryAfterSeconds:
+    def test_delta_seconds(self):
+        resp = httpx.Response(429, headers={"Retry-After": "7"}, request=_REQUEST)
+        assert retry_after_seconds(resp) == 7.0
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        resp = httpx.Response(429, headers={"Retry-After": format_datetime(when, usegmt=True)}, request=_REQUEST)
+        assert 25.0 <= retry_after_seconds(resp) <= 30.0
+
+    def test_missing_or_invalid(self):
+        assert retry_after_seconds(httpx.Response(429, request=_REQUEST)) is None
+        resp = httpx.Response(429, headers={"Retry-After": "soon"}, request=_REQUEST)
+        assert retry_after_seconds(resp) is None
+
+
+class TestWaitRetryAfter:
+    def test_uses_header_delay(self):
+        wait = WaitRetryAfter(wait_fixed(2))
+        assert wait(_state_for(_status_error(429, {"Retry-After": "5"}))) == 5.0
+
+    def test_caps_header_delay(self):
+        wait = WaitRetryAfter(wait_fixed(2), max_wait=10.0)
+        assert wait(_state_for(_status_error(429, {"Retry-After": "3600"}))) == 10.0
+
+    def test_falls_back_without_header(self):
+        wait = WaitRetryAfter(wait_fixed(2))
+        assert wait(_state_for(_status_error(503))) == 2
+        assert wait(_state_for(httpx.ConnectError("boom"))) == 2
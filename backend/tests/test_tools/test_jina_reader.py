@@ -6,17 +6,21 @@ import httpx
 import pytest
 
 from config.settings import Settings
-from tools.jina_reader import JinaReaderTool
+from tools.jina_reader import JinaReaderTool, _reject_non_public_host, close_shared_clients
 
 _FAKE_REQUEST = httpx.Request("GET", "https://r.jina.ai/https://example.com")
 
 
 def _make_settings(**overrides) -> Settings:
-    defaults = {"jina_api_key": "jina-test-key"}
+    defaults = {"jina_api_key": "jina-test-key", "scrape_direct_fetch_enabled": False}
     defaults.update(overrides)
     return Settings(**defaults)
 
 
+def _direct_client(handler) -> httpx.AsyncClient:
+    return httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+
 class TestJinaReaderTool:
     @pytest.mark.asyncio
     async def test_read_returns_markdown(self):
@@ -59,6 +63,7 @@ class TestJinaReaderTool:
 
         assert captured_headers["Authorization"] == "Bearer jina-test-key"
         assert captured_headers["Accept"] == "text/markdown"
+        assert captured_headers["X-Retain-Images"] == "none"
         await tool.close()
 
     @pytest.mark.asyncio
@@ -75,3 +80,187 @@ class TestJinaReaderTool:
 
         assert "Authorization" not in captured_headers
         await tool.close()
+
+    @pytest.mark.asyncio
+    async def test_static_html_is_read_directly(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        body = "<p>We manufacture solar inverters for commercial rooftops.</p>" * 40
+        markup = (
+            "<html><head><title>Acme</title><script>var x = 1;</script></head><body>"
+            f"{body}<footer><a href=\"mailto:sales@acme.com\">Email us</a></footer></body></html>"
+        )
+        direct = _direct_client(lambda request: httpx.Response(200, html=markup))
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as jina_get:
+            result = await tool.read("https://acme.com/about")
+
+        jina_get.assert_not_awaited()
+        assert "[Email us](mailto:sales@acme.com)" in result
+        assert "var x" not in result and "<p>" not in result
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_short_contact_page_is_read_directly(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        markup = (
+            "<html><body><h1>Contact Acme Solar</h1>"
+            "<p>Our sales team answers distributor and installer enquiries on weekdays.</p>"
+            "<p>Headquarters: 12 Harbour Road, Rotterdam, The Netherlands.</p>"
+            "<p>Phone: <a href=\"tel:+31101234567\">+31 10 123 4567</a></p>"
+            "<p>Email: <a href=\"mailto:sales@acme.com\">sales@acme.com</a></p></body></html>"
+        )
+        direct = _direct_client(lambda request: httpx.Response(200, html=markup))
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as jina_get:
+            result = await tool.read("https://acme.com/contact")
+
+        jina_get.assert_not_awaited()
+        assert len(result) < JinaReaderTool.DIRECT_FETCH_MIN_TEXT_CHARS
+        assert "(mailto:sales@acme.com)" in result
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_meta_charset_is_used_when_header_has_none(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        body = "<p>我们是一家专业生产微动开关的工厂，产品出口到世界各地。</p>" * 60
+        markup = f'<html><head><meta charset="gb2312"></head><body>{body}</body></html>'.encode("gbk")
+        direct = _direct_client(
+            lambda request: httpx.Response(200, content=markup, headers={"content-type": "text/html"})
+        )
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock) as jina_get:
+            result = await tool.read("https://acme.cn/about")
+
+        jina_get.assert_not_awaited()
+        assert "微动开关" in result and "�" not in result
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_undecodable_page_falls_back_to_jina(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        markup = ("<p>" + "微动开关工厂" * 400 + "</p>").encode("gbk")
+        direct = _direct_client(
+            lambda request: httpx.Response(200, content=markup, headers={"content-type": "text/html"})
+        )
+        jina_resp = httpx.Response(200, text="# 微动开关", request=_FAKE_REQUEST)
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=jina_resp):
+            assert await tool.read("https://acme.cn/about") == "# 微动开关"
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_large_page_is_converted_off_the_event_loop(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        markup = "<p>We distribute solar inverters across Europe.</p>" * 6000
+        direct = _direct_client(lambda request: httpx.Response(200, html=markup))
+        offloaded = []
+
+        async def fake_to_thread(fn, *args, **kwargs):
+            offloaded.append(fn.__name__)
+            return fn(*args, **kwargs)
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch("tools.jina_reader.asyncio.to_thread", side_effect=fake_to_thread):
+            result = await tool.read("https://acme.com/catalog")
+
+        assert offloaded == ["html_to_text"]
+        assert result.startswith("We distribute solar inverters")
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "response",
+        [
+            httpx.Response(200, html='<html><body><div id="root"></div><script src="/app.js"></script></body></html>'),
+            httpx.Response(200, content=b"%PDF-1.7", headers={"Content-Type": "application/pdf"}),
+            httpx.Response(200, html="<p>solar inverter distributor</p>" * 100_000),
+            httpx.Response(403, html="<p>Forbidden</p>"),
+        ],
+        ids=["script-shell", "non-html", "oversized", "blocked"],
+    )
+    async def test_unusable_direct_response_falls_back_to_jina(self, response):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        direct = _direct_client(lambda request: response)
+        jina_resp = httpx.Response(200, text="# Rendered", request=_FAKE_REQUEST)
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=jina_resp) as jina_get:
+            result = await tool.read("https://example.com")
+
+        assert result == "# Rendered"
+        assert jina_get.await_args.args[0] == "https://r.jina.ai/https://example.com"
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_direct_fetch_never_reaches_private_hosts(self):
+        tool = JinaReaderTool(settings=_make_settings(scrape_direct_fetch_enabled=True))
+        default_client = await tool._get_direct_client()
+        assert default_client.event_hooks["request"] == [_reject_non_public_host]
+        await tool.close()
+
+        served = []
+
+        def handler(request):
+            served.append(str(request.url))
+            return httpx.Response(302, headers={"location": "http://127.0.0.1:8000/admin"})
+
+        direct = httpx.AsyncClient(
+            transport=httpx.MockTransport(handler),
+            follow_redirects=True,
+            event_hooks={"request": [_reject_non_public_host]},
+        )
+        jina_resp = httpx.Response(200, text="# Public page", request=_FAKE_REQUEST)
+
+        with patch.object(tool, "_get_direct_client", AsyncMock(return_value=direct)), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=jina_resp):
+            assert await tool.read("http://localhost:8000/") == "# Public page"
+            assert await tool.read("http://[fe80::1]/") == "# Public page"
+            assert await tool.read("http://93.184.216.34/contact") == "# Public page"
+
+        assert served == ["http://93.184.216.34/contact"]
+        await direct.aclose()
+
+    @pytest.mark.asyncio
+    async def test_direct_fetch_can_be_disabled(self):
+        tool = JinaReaderTool(settings=_make_settings())
+        get_direct = AsyncMock()
+        jina_resp = httpx.Response(200, text="# Rendered", request=_FAKE_REQUEST)
+
+        with patch.object(tool, "_get_direct_client", get_direct), \
+                patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=jina_resp):
+            assert await tool.read("https://example.com") == "# Rendered"
+
+        get_direct.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_disk_cache_skips_refetching_the_same_url(self, tmp_path):
+        settings = _make_settings(scrape_cache_dir=str(tmp_path))
+        jina_resp = httpx.Response(200, text="# Cached page", request=_FAKE_REQUEST)
+
+        with patch.object(httpx.AsyncClient, "get", new_callable=AsyncMock, return_value=jina_resp) as get:
+            first = JinaReaderTool(settings=settings)
+            assert await first.read("https://example.com/contact") == "# Cached page"
+            second = JinaReaderTool(settings=settings)
+            assert await second.read("https://example.com/contact#team") == "# Cached page"
+
+        assert get.await_count == 1
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    @pytest.mark.asyncio
+    async def test_jina_client_is_shared_across_tools_on_a_loop(self):
+        first = JinaReaderTool(settings=_make_settings())
+        client = await first._get_client()
+        await first.close()
+
+        second = JinaReaderTool(settings=_make_settings())
+        assert await second._get_client() is client
+        assert not client.is_closed
+
+        await close_shared_clients()
+        assert client.is_closed
+        assert await second._get_client() is not client
+        await close_shared_clients()
@@ -0,0 +1,40 @@
+"""Tests for tools/json_codec.py"""
+
+import json
+import math
+from datetime import datetime, timezone
+
+import pytest
+
+from tools.json_codec import dumps_bytes, loads
+
+
+class TestJsonCodec:
+    def test_round_trip_keeps_non_ascii(self):
+        payload = {"company": "深圳电子", "leads": [1, 2]}
+        raw = dumps_bytes(payload)
+        assert "深圳电子".encode("utf-8") in raw
+        assert loads(raw) == payload
+
+    def test_loads_accepts_text(self):
+        assert loads('{"a": 1}') == {"a": 1}
+
+    def test_non_string_keys_and_big_ints(self):
+        assert loads(dumps_bytes({1: 2})) == {"1": 2}
+        assert loads(dumps_bytes({"n": 1 << 70})) == {"n": 1 << 70}
+
+    def test_unknown_types_use_default(self):
+        class Opaque:
+            def __str__(self):
+                return "opaque"
+
+        assert loads(dumps_bytes({"v": Opaque()})) == {"v": "opaque"}
+        stamp = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        assert loads(dumps_bytes({"t": stamp}))["t"].startswith("2024-01-01")
+
+    def test_loads_matches_stdlib_on_input_orjson_rejects(self):
+        assert math.isnan(loads('{"score": NaN}')["score"])
+
+    def test_loads_raises_stdlib_decode_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            loads("Here is the JSON: {")
@@ -7,6 +7,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from config.settings import Settings
+from tools.disk_cache import write_disk_cache
 from tools.llm_client import LLMTool, _inject_api_keys
 from tools.llm_errors import format_llm_error
 
@@ -87,6 +88,13 @@ class TestLLMToolProperties:
         tool = LLMTool(settings=_make_settings(llm_temperature=0.5))
         assert tool._default_temperature == 0.5
 
+    def test_legacy_alias_normalized_once(self):
+        with patch("tools.llm_client.logger") as mock_logger:
+            tool = LLMTool(settings=_make_settings(llm_model="anthropic/MiniMax-M2.5"))
+            assert tool.model == "minimax/MiniMax-M2.5"
+            assert tool.model == "minimax/MiniMax-M2.5"
+        assert mock_logger.warning.call_count == 1
+
 
 class TestLLMToolGenerate:
     @pytest.mark.asyncio
@@ -115,6 +123,56 @@ class TestLLMToolGenerate:
         assert kwargs["messages"][0] == {"role": "system", "content": "system msg"}
         assert kwargs["messages"][1] == {"role": "user", "content": "user msg"}
 
+    @pytest.mark.asyncio
+    async def test_cached_generate_reuses_disk_entry(self, tmp_path):
+        settings = _make_settings(llm_cache_dir=str(tmp_path))
+        mock_resp = _mock_completion('{"company_name": "Acme"}')
+
+        with patch("tools.llm_client.litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp) as mock_call:
+            first = await LLMTool(settings=settings).generate("page", system="extract", cache=True)
+            second = await LLMTool(settings=settings).generate("page", system="extract", cache=True)
+            await LLMTool(settings=settings).generate("other page", system="extract", cache=True)
+            await LLMTool(settings=settings).generate("page", system="extract")
+
+        assert first == second == '{"company_name": "Acme"}'
+        assert mock_call.await_count == 3
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+    @pytest.mark.asyncio
+    async def test_json_mode_cache_skips_unparsable_entries(self, tmp_path):
+        settings = _make_settings(llm_cache_dir=str(tmp_path))
+        json_mode = {"type": "json_object"}
+        truncated = _mock_completion('{"company_name": "Ac')
+        valid = _mock_completion('{"company_name": "Acme"}')
+
+        with patch("tools.llm_client.litellm.acompletion", new_callable=AsyncMock, side_effect=[truncated, valid]) as mock_call:
+            await LLMTool(settings=settings).generate("page", response_format=json_mode, cache=True)
+            assert list(tmp_path.glob("*.json")) == []
+            await LLMTool(settings=settings).generate("page", response_format=json_mode, cache=True)
+            again = await LLMTool(settings=settings).generate("page", response_format=json_mode, cache=True)
+
+        assert again == '{"company_name": "Acme"}'
+        assert mock_call.await_count == 2
+
+        # An entry written before the schema check (or by hand) is not replayed.
+        entry = next(tmp_path.glob("*.json"))
+        write_disk_cache(entry, "not json", 60)
+        with patch("tools.llm_client.litellm.acompletion", new_callable=AsyncMock, return_value=valid) as mock_call:
+            result = await LLMTool(settings=settings).generate("page", response_format=json_mode, cache=True)
+        assert result == '{"company_name": "Acme"}'
+        assert mock_call.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_flag_is_inert_without_cache_dir(self):
+        tool = LLMTool(settings=_make_settings())
+        mock_resp = _mock_completion("ok")
+
+        with patch("tools.llm_client.litellm.acompletion", new_callable=AsyncMock, return_value=mock_resp) as mock_call:
+            await tool.generate("page", cache=True)
+            await tool.generate("page", cache=True)
+
+        assert mock_call.await_count == 2
+
     @pytest.mark.asyncio
     async def test_generate_temperature_override(self):
         tool = LLMTool(settings=_make_settings())
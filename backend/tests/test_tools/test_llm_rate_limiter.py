@@ -0,0 +1,71 @@
+"""Tests for tools/llm_rate_limiter.py — sliding-window RPM limiter."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from tools.llm_rate_limiter import AsyncWindowRateLimiter
+
+
+class TestAsyncWindowRateLimiter:
+    @pytest.mark.asyncio
+    async def test_burst_within_limit_does_not_sleep(self):
+        limiter = AsyncWindowRateLimiter(3, time_fn=lambda: 100.0)
+
+        with patch("tools.llm_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(3):
+                await limiter.acquire()
+
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_waiters_reserve_successive_slots(self):
+        now = [0.0]
+        limiter = AsyncWindowRateLimiter(2, time_fn=lambda: now[0])
+
+        with patch("tools.llm_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            now[0] = 10.0
+            await limiter.acquire()
+            now[0] = 20.0
+            await limiter.acquire()
+            await limiter.acquire()
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [40.0, 50.0]
+
+    @pytest.mark.asyncio
+    async def test_expired_slots_free_capacity(self):
+        now = [0.0]
+        limiter = AsyncWindowRateLimiter(1, time_fn=lambda: now[0])
+
+        with patch("tools.llm_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            await limiter.acquire()
+            now[0] = 61.0
+            await limiter.acquire()
+
+        mock_sleep.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_releases_its_slot(self):
+        limiter = AsyncWindowRateLimiter(1, time_fn=lambda: 0.0)
+        await limiter.acquire()
+
+        with patch("tools.llm_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            mock_sleep.side_effect = asyncio.CancelledError
+            with pytest.raises(asyncio.CancelledError):
+                await limiter.acquire()
+            mock_sleep.side_effect = None
+            await limiter.acquire()
+
+        assert [c.args[0] for c in mock_sleep.await_args_list] == [60.0, 60.0]
+
+    @pytest.mark.asyncio
+    async def test_zero_rpm_disables_limit(self):
+        limiter = AsyncWindowRateLimiter(0)
+
+        with patch("tools.llm_rate_limiter.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            for _ in range(100):
+                await limiter.acquire()
+
+        mock_sleep.assert_not_awaited()
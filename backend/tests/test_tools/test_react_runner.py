@@ -1,5 +1,6 @@
 """Tests for tools/react_runner.py — JSON parsing, field validation, message trimming."""
 
+import asyncio
 import json
 from types import SimpleNamespace
 from unittest.mock import AsyncMock, patch
@@ -8,11 +9,13 @@ import pytest
 
 from config.settings import Settings
 from tools.react_runner import (
+    ToolDef,
     _acompletion_with_rpm_limit,
     _clean_markdown_fences,
     _has_required_fields,
     _trim_messages,
     _try_parse_json,
+    react_loop,
 )
 
 
@@ -65,6 +68,9 @@ class TestTryParseJson:
         # Malformed JSON should return None
         assert _try_parse_json('{"name": "test", ') is None
 
+    def test_json_array_with_surrounding_prose(self):
+        assert _try_parse_json("Found these leads: [1, 2, 3]. Done.") == [1, 2, 3]
+
     def test_complex_nested_json(self):
         data = {
             "is_valid_lead": True,
@@ -158,3 +164,103 @@ class TestRPMControl:
         mock_get.assert_called_once_with("reasoning", 9)
         limiter.acquire.assert_awaited_once()
         mock_call.assert_awaited_once()
+
+
+def _tool_call(call_id: str, name: str, args: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=call_id,
+        function=SimpleNamespace(name=name, arguments=json.dumps(args)),
+    )
+
+
+def _completion(content: str = "", tool_calls: list | None = None) -> SimpleNamespace:
+    message = SimpleNamespace(content=content, tool_calls=tool_calls)
+    message.model_dump = lambda: {"role": "assistant", "content": content}
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+class TestToolExecution:
+    @pytest.mark.asyncio
+    async def test_tool_calls_in_one_turn_run_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def scrape(url: str = "") -> str:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return json.dumps({"url": url})
+
+        tool = ToolDef(name="scrape_page", description="", parameters={}, fn=scrape)
+        responses = [
+            _completion(tool_calls=[
+                _tool_call("a", "scrape_page", {"url": "https://a.example"}),
+                _tool_call("b", "missing_tool", {}),
+                _tool_call("c", "scrape_page", {"url": "https://c.example"}),
+            ]),
+            _completion(content='{"done": true}'),
+        ]
+        captured = []
+
+        async def fake_completion(_settings, *, scope="reasoning", **kwargs):
+            captured.append(list(kwargs["messages"]))
+            return responses[len(captured) - 1]
+
+        with patch("tools.react_runner._acompletion_with_rpm_limit", side_effect=fake_completion), \
+                patch("tools.react_runner._inject_api_keys"):
+            result = await react_loop(
+                system="sys", user_prompt="go", tools=[tool],
+                settings=Settings(), max_iterations=3,
+            )
+
+        assert result == '{"done": true}'
+        assert peak == 2
+        tool_messages = [m for m in captured[1] if m.get("role") == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["a", "b", "c"]
+        assert json.loads(tool_messages[0]["content"]) == {"url": "https://a.example"}
+        assert "Unknown tool" in tool_messages[1]["content"]
+
+    @pytest.mark.asyncio
+    async def test_sequential_tools_run_after_the_turns_other_calls(self):
+        scraped: dict[str, str] = {}
+
+        async def scrape(url: str = "") -> str:
+            await asyncio.sleep(0.01)
+            scraped[url] = f"content of {url}"
+            return json.dumps({"url": url})
+
+        async def extract(urls: list[str] | None = None) -> str:
+            return json.dumps({"pages": [scraped.get(u, "") for u in urls or []]})
+
+        tools = [
+            ToolDef(name="scrape_page", description="", parameters={}, fn=scrape),
+            ToolDef(name="extract_lead_info", description="", parameters={}, fn=extract, sequential=True),
+        ]
+        responses = [
+            _completion(tool_calls=[
+                _tool_call("a", "scrape_page", {"url": "https://a.example"}),
+                _tool_call("b", "extract_lead_info", {"urls": ["https://a.example", "https://c.example"]}),
+                _tool_call("c", "scrape_page", {"url": "https://c.example"}),
+            ]),
+            _completion(content='{"done": true}'),
+        ]
+        captured = []
+
+        async def fake_completion(_settings, *, scope="reasoning", **kwargs):
+            captured.append(list(kwargs["messages"]))
+            return responses[len(captured) - 1]
+
+        with patch("tools.react_runner._acompletion_with_rpm_limit", side_effect=fake_completion), \
+                patch("tools.react_runner._inject_api_keys"):
+            await react_loop(
+                system="sys", user_prompt="go", tools=tools,
+                settings=Settings(), max_iterations=3,
+            )
+
+        tool_messages = [m for m in captured[1] if m.get("role") == "tool"]
+        assert [m["tool_call_id"] for m in tool_messages] == ["a", "b", "c"]
+        assert json.loads(tool_messages[1]["content"]) == {
+            "pages": ["content of https://a.example", "content of https://c.example"],
+        }
@@ -5,6 +5,7 @@ import pytest
 from tools.url_filter import (
     classify_search_results,
     classify_url,
+    domain_in,
     extract_linkedin_company_slug,
     filter_search_results,
     slug_to_company_name,
@@ -197,3 +198,24 @@ class TestFilterSearchResults:
         assert company == []
         assert platform == []
         assert linkedin == []
+
+
+class TestClassifyUrlCache:
+    def test_repeated_urls_hit_cache(self):
+        classify_url.cache_clear()
+        url = "https://www.alibaba.com/product/123"
+        assert classify_url(url) == "platform_listing"
+        assert classify_url(url) == "platform_listing"
+        info = classify_url.cache_info()
+        assert info.hits == 1
+        assert info.misses == 1
+
+
+class TestDomainIn:
+    def test_exact_and_subdomain_match(self):
+        targets = {"alibaba.com", "wikipedia.org"}
+        assert domain_in("alibaba.com", targets) is True
+        assert domain_in("m.en.wikipedia.org", targets) is True
+
+    def test_suffix_without_dot_boundary_does_not_match(self):
+        assert domain_in("notalibaba.com", {"alibaba.com"}) is False
@@ -6,6 +6,9 @@ from typing import Optional
 
 import httpx
 
+from tools.json_codec import loads
+
+
 class BraveSearchTool:
     """Search the web via Brave Search API and return structured results.
 
@@ -66,7 +69,7 @@ class BraveSearchTool:
             params=params,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = loads(resp.content)
 
         results = []
         for i, item in enumerate(data.get("web", {}).get("results", []), start=1):
@@ -20,6 +20,7 @@ from tools.url_filter import (
     _CONTENT_DOMAINS,
     _IRRELEVANT_DOMAINS,
     _PLATFORM_DOMAINS,
+    domain_in,
     extract_linkedin_company_slug,
     slug_to_company_name,
 )
@@ -84,11 +85,7 @@ class CompanyWebsiteFinder:
                 domain = domain[4:]
 
             # Skip known non-official domains
-            is_non_official = any(
-                domain == d or domain.endswith("." + d)
-                for d in _NON_OFFICIAL_DOMAINS
-            )
-            if is_non_official:
+            if domain_in(domain, _NON_OFFICIAL_DOMAINS):
                 continue
 
             logger.info("[CompanyWebsiteFinder] '%s' → %s", company_name, url)
@@ -136,11 +133,11 @@ class CompanyWebsiteFinder:
         # Use the last meaningful path segment as company name hint
         slug = path_parts[-1]
         # Remove common suffixes like .html, numeric IDs
-        slug = slug.split(".")[0]
+        slug = slug.partition(".")[0]
         # Skip if it's just a number (product ID, not company name)
         if slug.isdigit():
             if len(path_parts) >= 2:
-                slug = path_parts[-2].split(".")[0]
+                slug = path_parts[-2].partition(".")[0]
             else:
                 return None
 
@@ -36,6 +36,11 @@ _PHONE_REGEX = re.compile(
     re.VERBOSE,
 )
 
+_NON_DIGIT_RE = re.compile(r"\D")
+_DECIMAL_RE = re.compile(r"\d\.\d")
+_YEAR_DIGITS_RE = re.compile(r"(?:19|20)\d{2}")
+_STANDARD_YEAR_DIGITS_RE = re.compile(r"\d{4,6}(?:19|20)\d{2}")
+
 _PHONE_MIN_DIGITS = 7
 _PHONE_MAX_DIGITS = 15
 _PHONE_MAX_PER_LEAD = 10
@@ -47,7 +52,7 @@ def _normalize_phone_digits(raw: str) -> str:
     Strips leading 00 (IDD prefix) so that +4930... and 004930... are treated
     as the same number.  Also strips a single leading + sign before extracting.
     """
-    digits = re.sub(r"\D", "", raw)
+    digits = _NON_DIGIT_RE.sub("", raw)
     if digits.startswith("00"):
         digits = digits[2:]
     return digits
@@ -63,7 +68,7 @@ def _is_valid_phone(raw: str) -> bool:
         return False
 
     # Reject if the original text contains a decimal point (GPS / float)
-    if re.search(r"\d\.\d", raw):
+    if _DECIMAL_RE.search(raw):
         return False
 
     # Reject all-same-digit strings: 00000000, 11111111, 99999999
@@ -76,17 +81,12 @@ def _is_valid_phone(raw: str) -> bool:
         return False
 
     # Reject plain years: 1900-2099
-    if re.match(r"^(19|20)\d{2}$", digits):
+    if _YEAR_DIGITS_RE.fullmatch(digits):
         return False
 
     # Reject ISO standard / date range patterns like "27001-2022", "9001-2015"
     # These look like NNNN-YYYY where YYYY is a year
-    if re.match(r"^\d{4,6}(19|20)\d{2}$", digits):
-        return False
-
-    # Reject strings that look like version numbers: only 1–2 digit groups
-    # e.g. "3.14", "10.2" — already caught by decimal check above, but belt+suspenders
-    if re.match(r"^\d{1,3}$", digits):
+    if _STANDARD_YEAR_DIGITS_RE.fullmatch(digits):
         return False
 
     # Reject numbers that start with 000 (clearly invalid)
@@ -176,6 +176,13 @@ _SOCIAL_PATTERNS: dict[str, re.Pattern] = {
     ),
 }
 
+# All platforms fused into one alternation so a page is scanned once; the
+# named group that matched (``m.lastgroup``) identifies the platform.
+_SOCIAL_RE = re.compile(
+    "|".join(f"(?P<{name}>{pattern.pattern})" for name, pattern in _SOCIAL_PATTERNS.items()),
+    re.IGNORECASE,
+)
+
 # Blacklist patterns — skip generic/share links
 _SOCIAL_BLACKLIST = re.compile(
     r"(?:sharer|share|intent/tweet|dialog/share|plugins|embed|watch\?)",
@@ -190,18 +197,26 @@ def extract_social_media(text: str) -> dict[str, str]:
         Dict keyed by platform name, e.g. {"linkedin": "https://...", "facebook": "https://..."}
         Only the first URL per platform is kept.
     """
-    result: dict[str, str] = {}
+    # Every platform pattern is an absolute URL; skip the regex on pages
+    # without one.
+    if "://" not in text:
+        return {}
 
-    for platform, pattern in _SOCIAL_PATTERNS.items():
-        matches = pattern.findall(text)
-        for url in matches:
-            # Skip share/embed links
-            if _SOCIAL_BLACKLIST.search(url):
-                continue
-            result[platform] = url.rstrip("/")
-            break  # first valid match per platform
+    found: dict[str, str] = {}
 
-    return result
+    for m in _SOCIAL_RE.finditer(text):
+        platform = m.lastgroup
+        if platform in found:
+            continue
+        url = m.group()
+        # Skip share/embed links
+        if _SOCIAL_BLACKLIST.search(url):
+            continue
+        found[platform] = url.rstrip("/")  # first valid match per platform
+        if len(found) == len(_SOCIAL_PATTERNS):
+            break
+
+    return {platform: found[platform] for platform in _SOCIAL_PATTERNS if platform in found}
 
 
 # ── Contact page URL discovery ─────────────────────────────────────────
@@ -210,6 +225,9 @@ _CONTACT_PAGE_PATTERNS = re.compile(
     r"""(?:href|src)\s*=\s*["']([^"']*?)["']""",
     re.IGNORECASE,
 )
+_LINK_ATTRIBUTE_RE = re.compile(r"href|src", re.IGNORECASE)
+
+_MARKDOWN_LINK_RE = re.compile(r"\[([^\]]*)\]\(([^)]+)\)")
 
 _CONTACT_PATH_KEYWORDS = {
     "contact", "kontakt", "contacto", "contato", "contatti",
@@ -233,20 +251,31 @@ def discover_contact_pages(html_text: str, base_url: str) -> list[str]:
         List of absolute URLs to contact/about pages (deduplicated, max 3).
     """
     # Also match Markdown-style links: [text](url)
-    md_links = re.findall(r"\[([^\]]*)\]\(([^)]+)\)", html_text)
-    href_links = _CONTACT_PAGE_PATTERNS.findall(html_text)
+    md_links = _MARKDOWN_LINK_RE.findall(html_text)
+    # Jina Reader returns Markdown, which rarely carries HTML attributes.  The
+    # attribute pattern has no literal prefix for the engine to skip ahead on,
+    # so only run it over text that can contain a match at all.  The gate
+    # stops at the first hit and does not copy the page.
+    if _LINK_ATTRIBUTE_RE.search(html_text):
+        href_links = _CONTACT_PAGE_PATTERNS.findall(html_text)
+    else:
+        href_links = []
 
     all_links = href_links + [url for _, url in md_links]
 
     seen: set[str] = set()
+    checked: set[str] = set()
     result: list[str] = []
 
     base_domain = urlparse(base_url).netloc
 
     for link in all_links:
         link = link.strip()
-        if not link or link.startswith("#") or link.startswith("javascript:"):
+        # Header, footer and mobile menus repeat the same hrefs; resolve and
+        # classify each distinct link once.
+        if not link or link in checked or link.startswith(("#", "javascript:")):
             continue
+        checked.add(link)
 
         # Resolve relative URLs
         absolute = urljoin(base_url, link)
@@ -291,10 +320,10 @@ def merge_contact_info(
 
     # Merge phones
     existing_phones_digits = set(
-        re.sub(r"\D", "", p) for p in base.get("phone_numbers", [])
+        _NON_DIGIT_RE.sub("", p) for p in base.get("phone_numbers", [])
     )
     for phone in extra_phones:
-        digits = re.sub(r"\D", "", phone)
+        digits = _NON_DIGIT_RE.sub("", phone)
         if digits not in existing_phones_digits:
             base.setdefault("phone_numbers", []).append(phone)
             existing_phones_digits.add(digits)
@@ -9,14 +9,17 @@ This module is intentionally code-first, not prompt-first:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import re
 from dataclasses import dataclass
+from functools import lru_cache
 from urllib.parse import urlparse
 
 import httpx
 
 from tools.google_search import GoogleSearchTool
+from tools.html_text import html_to_text
 from tools.jina_reader import JinaReaderTool
 
 logger = logging.getLogger(__name__)
@@ -41,6 +44,11 @@ _IGNORE_COMPANY_TOKENS = {
     "co", "company", "corp", "corporation", "inc", "llc", "ltd", "limited", "gmbh", "ag", "sa", "bv", "srl",
 }
 
+# Customs discovery queries for one lead are sent to Serper as a single
+# batched request; capping them bounds the quota a lead can use.
+_MAX_QUERIES = 8
+_MAX_PAGE_FETCHES = 4
+
 _INVALID_PAGE_HINTS = [
     "404",
     "not found",
@@ -49,6 +57,28 @@ _INVALID_PAGE_HINTS = [
     "choose the largest & most trusted export-import trade data platform",
 ]
 
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_MONTH_YEAR_RE = re.compile(
+    r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+20\d{2}\b", re.IGNORECASE
+)
+_QUARTER_RE = re.compile(r"\bQ[1-4]\s*20\d{2}\b", re.IGNORECASE)
+_YEAR_RE = re.compile(r"\b(20\d{2})\b")
+_PARTNER_CONTEXT_RE = re.compile(
+    r"(?:from|to|imported from|exported to|shipped to|origin|destination)\s+([a-z\s]{3,40})"
+)
+_HS_CODE_RE = re.compile(r"(?:hs|hsn)\s*(?:code)?\s*[:#-]?\s*([0-9]{6,10})", re.IGNORECASE)
+_PRODUCT_CLUE_RE = re.compile(r"(?:shipments?|imports?|exports?)\s+of\s+([a-z0-9\-\s]{3,40})")
+# One pass over the text finds every country word.  The lookahead makes
+# matches zero-width so overlapping words are still reported, matching the
+# plain substring semantics of ``country in text``.
+_COUNTRY_RE = re.compile(
+    "(?=(" + "|".join(re.escape(c) for c in sorted(_COUNTRY_WORDS, key=len, reverse=True)) + "))"
+)
+_COUNTRY_DISPLAY = {
+    country: "United States" if country == "usa" else "United Kingdom" if country == "uk" else country.title()
+    for country in _COUNTRY_WORDS
+}
+
 
 @dataclass
 class CustomsEvidence:
@@ -78,14 +108,13 @@ class CustomsEvidence:
         }
 
 
-def _company_tokens(company_name: str) -> list[str]:
-    tokens = re.findall(r"[a-z0-9]+", company_name.lower())
-    out: list[str] = []
-    for token in tokens:
-        if len(token) < 3 or token in _IGNORE_COMPANY_TOKENS or token in out:
-            continue
-        out.append(token)
-    return out
+@lru_cache(maxsize=256)
+def _company_tokens(company_name: str) -> tuple[str, ...]:
+    """Return the distinctive name tokens, cached since one lookup scores many rows."""
+    tokens = _TOKEN_RE.findall(company_name.lower())
+    return tuple(dict.fromkeys(
+        token for token in tokens if len(token) >= 3 and token not in _IGNORE_COMPANY_TOKENS
+    ))
 
 
 def _company_match_strength(company_name: str, title: str, link: str) -> float:
@@ -143,13 +172,13 @@ def build_customs_queries(
 
 
 def _extract_period(text: str) -> str:
-    month_year = re.findall(r"\b(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\s+20\d{2}\b", text, re.IGNORECASE)
+    month_year = _MONTH_YEAR_RE.findall(text)
     if month_year:
         return month_year[0]
-    quarter = re.findall(r"\bQ[1-4]\s*20\d{2}\b", text, re.IGNORECASE)
+    quarter = _QUARTER_RE.findall(text)
     if quarter:
         return quarter[0].upper()
-    years = [y for y in re.findall(r"\b(20\d{2})\b", text) if int(y) >= 2016]
+    years = [y for y in _YEAR_RE.findall(text) if int(y) >= 2016]
     if len(years) >= 2:
         return f"{years[0]}-{years[-1]}"
     if years:
@@ -159,8 +188,10 @@ def _extract_period(text: str) -> str:
 
 def _extract_direction(text: str) -> str:
     lower = text.lower()
-    has_import = any(word in lower for word in ["import", "imports", "importer"])
-    has_export = any(word in lower for word in ["export", "exports", "exporter"])
+    # "imports"/"importer" contain "import", so one substring scan per
+    # direction covers every inflection.
+    has_import = "import" in lower
+    has_export = "export" in lower
     if has_import and has_export:
         return "import_export"
     if has_import:
@@ -172,21 +203,19 @@ def _extract_direction(text: str) -> str:
 
 def _extract_partner_countries(text: str) -> list[str]:
     lower = text.lower()
-    contexts = re.findall(
-        r"(?:from|to|imported from|exported to|shipped to|origin|destination)\s+([a-z\s]{3,40})",
-        lower,
-    )
+    contexts = _PARTNER_CONTEXT_RE.findall(lower)
     hay = " ".join(contexts) if contexts else lower
+    present = set(_COUNTRY_RE.findall(hay))
     found: list[str] = []
     for country in _COUNTRY_WORDS:
-        normalized = "United States" if country == "usa" else "United Kingdom" if country == "uk" else country.title()
-        if country in hay and normalized not in found:
+        normalized = _COUNTRY_DISPLAY[country]
+        if country in present and normalized not in found:
             found.append(normalized)
     return found[:5]
 
 
 def _extract_hs_codes(text: str) -> list[str]:
-    codes = re.findall(r"(?:hs|hsn)\s*(?:code)?\s*[:#-]?\s*([0-9]{6,10})", text, re.IGNORECASE)
+    codes = _HS_CODE_RE.findall(text)
     out: list[str] = []
     for code in codes:
         if len(code) not in (6, 8, 10) or code in out:
@@ -203,7 +232,7 @@ def _extract_product_clues(text: str, product_keywords: list[str]) -> list[str]:
             clues.append(kw)
     if clues:
         return clues[:5]
-    fallback = re.findall(r"(?:shipments?|imports?|exports?)\s+of\s+([a-z0-9\-\s]{3,40})", lower)
+    fallback = _PRODUCT_CLUE_RE.findall(lower)
     return [" ".join(item.split()) for item in fallback[:3] if item.strip()]
 
 
@@ -267,12 +296,24 @@ def _extract_from_page(
     )
 
 
-async def _fetch_raw(url: str) -> tuple[str, str]:
+def _new_raw_client() -> httpx.AsyncClient:
+    return httpx.AsyncClient(
+        timeout=25.0,
+        follow_redirects=True,
+        headers={"User-Agent": "Mozilla/5.0 AIHunter/1.0"},
+    )
+
+
+async def _fetch_raw(url: str, client: httpx.AsyncClient | None = None) -> tuple[str, str]:
+    """Fetch a page directly, reusing *client*'s connection pool when given."""
     try:
-        async with httpx.AsyncClient(timeout=25.0, follow_redirects=True) as client:
-            resp = await client.get(url, headers={"User-Agent": "Mozilla/5.0 AIHunter/1.0"})
-            resp.raise_for_status()
-            return resp.text, ""
+        if client is None:
+            async with _new_raw_client() as own_client:
+                resp = await own_client.get(url)
+        else:
+            resp = await client.get(url)
+        resp.raise_for_status()
+        return resp.text, ""
     except Exception as e:
         return "", str(e)
 
@@ -284,9 +325,18 @@ async def _fetch_with_jina(jina: JinaReaderTool, url: str) -> tuple[str, str]:
         return "", str(e)
 
 
-async def _fetch_provider_page(provider: str, url: str, jina: JinaReaderTool) -> tuple[str, str, str]:
+async def _fetch_provider_page(
+    provider: str,
+    url: str,
+    jina: JinaReaderTool,
+    raw_client: httpx.AsyncClient | None = None,
+) -> tuple[str, str, str]:
     if provider == "importgenius":
-        text, error = await _fetch_raw(url)
+        # Static fast path; raw pages are mostly markup and inline scripts, so
+        # reduce them to visible text before the evidence regexes scan them.
+        # Script-rendered shells with no visible text still go through Jina.
+        markup, error = await _fetch_raw(url, raw_client)
+        text = html_to_text(markup) if markup else ""
         if text:
             return text, "raw_fetch", ""
         text, error = await _fetch_with_jina(jina, url)
@@ -332,12 +382,25 @@ async def find_customs_data(
         product_keywords=product_keywords,
     )
 
+    # All queries go to Serper as one batched request rather than one
+    # round-trip each.
+    try:
+        batches = await google_search.search_many(queries[:_MAX_QUERIES], num=5)
+    except Exception as e:
+        logger.debug("[CustomsRouter] queries failed for %s: %s", company_name, e)
+        batches = []
+
+    # Overlapping queries return the same provider pages; keep the first
+    # occurrence of each link so scoring and fetching see it only once.
     raw_results: list[dict] = []
-    for query in queries[:8]:
-        try:
-            raw_results.extend(await google_search.search(query, num=5))
-        except Exception as e:
-            logger.debug("[CustomsRouter] query failed %s: %s", query, e)
+    seen_links: set[str] = set()
+    for rows in batches:
+        for row in rows:
+            link = str(row.get("link", ""))
+            if not link or link in seen_links:
+                continue
+            seen_links.add(link)
+            raw_results.append(row)
 
     ranked_candidates: list[tuple[float, str, dict]] = []
     for row in raw_results:
@@ -352,14 +415,19 @@ async def find_customs_data(
 
     ranked_candidates.sort(key=lambda item: item[0], reverse=True)
 
+    candidates = ranked_candidates[:_MAX_PAGE_FETCHES]
+    # Provider page fetches are independent network waits, so run them
+    # together.  One pooled client serves all direct fetches of this lookup,
+    # so hits on the same provider share the TLS connection.
+    async with _new_raw_client() as raw_client:
+        pages = await asyncio.gather(*(
+            _fetch_provider_page(provider, str(row.get("link", "")), jina_reader, raw_client=raw_client)
+            for _, provider, row in candidates
+        ))
+
     evidence: list[CustomsEvidence] = []
-    seen_urls: set[str] = set()
-    for _, provider, row in ranked_candidates[:4]:
+    for (_, provider, row), (text, fetch_method, error) in zip(candidates, pages):
         url = str(row.get("link", ""))
-        if not url or url in seen_urls:
-            continue
-        seen_urls.add(url)
-        text, fetch_method, error = await _fetch_provider_page(provider, url, jina_reader)
         if not text:
             logger.debug("[CustomsRouter] fetch failed %s via %s: %s", url, provider, error)
             continue
@@ -0,0 +1,57 @@
+"""Small on-disk JSON cache with per-entry expiry.
+
+One file per entry, named by a hash of the key, so concurrent hunts never
+contend on a shared index. Reads and writes are blocking; async callers run
+them through ``asyncio.to_thread``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from tools.json_codec import dumps_bytes, loads
+
+logger = logging.getLogger(__name__)
+
+# Cache directories already created in this process.
+_ensured_dirs: set[Path] = set()
+
+
+def disk_cache_path(cache_dir: str, key: list[Any]) -> Path | None:
+    """Return the entry path for ``key``, or None when caching is disabled."""
+    if not cache_dir:
+        return None
+    digest = hashlib.blake2b(dumps_bytes(key), digest_size=16).hexdigest()
+    return Path(cache_dir) / f"{digest}.json"
+
+
+def read_disk_cache(path: Path) -> Any | None:
+    """Return the cached value, or None if missing, expired or unreadable."""
+    try:
+        entry = loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        logger.debug("[DiskCache] Ignoring unreadable cache entry %s: %s", path, exc)
+        return None
+    if not isinstance(entry, dict) or entry.get("expires_at", 0) <= time.time():
+        return None
+    return entry.get("value")
+
+
+def write_disk_cache(path: Path, value: Any, ttl_seconds: float) -> None:
+    """Atomically write ``value`` with an expiry; failures are only logged."""
+    entry = {"expires_at": time.time() + ttl_seconds, "value": value}
+    try:
+        if path.parent not in _ensured_dirs:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            _ensured_dirs.add(path.parent)
+        temp_path = path.with_suffix(path.suffix + ".tmp")
+        temp_path.write_bytes(dumps_bytes(entry))
+        temp_path.replace(path)
+    except OSError as exc:
+        logger.warning("[DiskCache] Failed to write cache entry %s: %s", path, exc)
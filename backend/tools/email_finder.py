@@ -5,9 +5,14 @@ from __future__ import annotations
 import re
 
 
-# Common email patterns found on web pages
+# Common email patterns found on web pages. The lookbehind only lets a match
+# start at the beginning of a local-part run: without it a long run with no
+# "@" (base64 data URIs, minified JS) is rescanned from every offset, which is
+# quadratic. The only matches this drops are fragments that start right where
+# a previous match ended inside the same run ("a@b.co.uk.x@y.com" used to also
+# yield ".x@y.com"), which are never usable addresses.
 _EMAIL_REGEX = re.compile(
-    r"[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
+    r"(?<![a-zA-Z0-9._%+\-])[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}",
 )
 
 # Filter out common false positives
@@ -37,14 +42,23 @@ def _is_valid_email(email: str) -> bool:
     return True
 
 
-def extract_emails_from_text(text: str) -> list[str]:
-    """Extract unique valid emails from raw text using regex."""
-    raw = _EMAIL_REGEX.findall(text)
-    seen = set()
-    result = []
-    for email in raw:
-        email_lower = email.lower().strip()
+def extract_emails_from_text(text: str, limit: int | None = None) -> list[str]:
+    """Extract unique valid emails from raw text using regex.
+
+    Matches are streamed and deduplicated as they are found; with ``limit``
+    the scan stops once that many unique emails have been collected.
+    """
+    # Most scraped pages carry no address at all; a substring check is far
+    # cheaper than letting the regex try every word-character run.
+    if "@" not in text:
+        return []
+    seen: set[str] = set()
+    result: list[str] = []
+    for match in _EMAIL_REGEX.finditer(text):
+        email_lower = match.group().lower().strip()
         if email_lower not in seen and _is_valid_email(email_lower):
             seen.add(email_lower)
             result.append(email_lower)
+            if limit is not None and len(result) >= limit:
+                break
     return result
@@ -5,8 +5,11 @@ from __future__ import annotations
 import asyncio
 import re
 import socket
+import time
 from typing import Optional
 
+_EMAIL_SYNTAX_RE = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
+
 
 def _get_mx_records(domain: str) -> list[str]:
     """Resolve MX records for a domain using DNS.
@@ -34,8 +37,7 @@ def _get_mx_records(domain: str) -> list[str]:
 
 def _has_valid_syntax(email: str) -> bool:
     """Check basic email syntax."""
-    pattern = re.compile(r"^[a-zA-Z0-9._%+\-]+@[a-zA-Z0-9.\-]+\.[a-zA-Z]{2,}$")
-    return bool(pattern.match(email))
+    return bool(_EMAIL_SYNTAX_RE.match(email))
 
 
 class EmailVerifierTool:
@@ -47,8 +49,39 @@ class EmailVerifierTool:
 
     Note: Full SMTP verification (RCPT TO) is not implemented
     to avoid being flagged as spam.
+
+    MX lookups that find records are cached per domain for
+    ``MX_CACHE_TTL_SECONDS``; concurrent verifications of addresses on the
+    same domain share one DNS query.
     """
 
+    MX_CACHE_TTL_SECONDS = 900.0
+
+    def __init__(self) -> None:
+        self._mx_cache: dict[str, tuple[float, asyncio.Future[list[str]]]] = {}
+
+    async def _lookup_mx(self, domain: str) -> list[str]:
+        """Resolve MX records for a domain, reusing a fresh or in-flight lookup."""
+        now = time.monotonic()
+        cached = self._mx_cache.get(domain)
+        if cached is None or cached[0] <= now:
+            future = asyncio.get_running_loop().run_in_executor(None, _get_mx_records, domain)
+            cached = (now + self.MX_CACHE_TTL_SECONDS, future)
+            self._mx_cache[domain] = cached
+        try:
+            records = list(await asyncio.shield(cached[1]))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            if self._mx_cache.get(domain) is cached:
+                del self._mx_cache[domain]
+            raise
+        # _get_mx_records also returns [] when DNS times out, so an empty
+        # answer is not reused: it would mark the whole domain undeliverable.
+        if not records and self._mx_cache.get(domain) is cached:
+            del self._mx_cache[domain]
+        return records
+
     async def verify(self, email: str) -> dict:
         """Verify an email address.
 
@@ -73,9 +106,8 @@ class EmailVerifierTool:
         result["valid_syntax"] = True
 
         # Step 2: MX record check (run in thread to avoid blocking)
-        domain = email.split("@")[1]
-        loop = asyncio.get_event_loop()
-        mx_records = await loop.run_in_executor(None, _get_mx_records, domain)
+        domain = email.partition("@")[2]
+        mx_records = await self._lookup_mx(domain)
 
         result["mx_records"] = mx_records
         result["has_mx"] = len(mx_records) > 0
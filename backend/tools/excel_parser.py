@@ -32,9 +32,7 @@ class ExcelParserTool:
         Returns:
             Markdown table string.
         """
-        df = self._read_file(file_path, sheet_name=sheet_name)
-        if max_rows is not None:
-            df = df.head(max_rows)
+        df = self._read_file(file_path, sheet_name=sheet_name, nrows=max_rows)
         return df.to_markdown(index=False)
 
     def parse_to_dicts(
@@ -54,9 +52,7 @@ class ExcelParserTool:
         Returns:
             List of row dicts.
         """
-        df = self._read_file(file_path, sheet_name=sheet_name)
-        if max_rows is not None:
-            df = df.head(max_rows)
+        df = self._read_file(file_path, sheet_name=sheet_name, nrows=max_rows)
         return df.to_dict(orient="records")
 
     def get_sheet_names(self, file_path: str) -> list[str]:
@@ -68,19 +64,36 @@ class ExcelParserTool:
         return xls.sheet_names
 
     def get_row_count(self, file_path: str, *, sheet_name: str | int = 0) -> int:
-        """Return the number of data rows (excluding header)."""
-        df = self._read_file(file_path, sheet_name=sheet_name)
+        """Return the number of data rows (excluding header).
+
+        Delimited files are counted by tokenizing only their first column;
+        quoted newlines still count correctly, unlike a raw line count.
+        """
+        usecols = [0] if Path(file_path).suffix.lower() in {".csv", ".tsv"} else None
+        df = self._read_file(file_path, sheet_name=sheet_name, usecols=usecols)
         return len(df)
 
-    def _read_file(self, file_path: str, *, sheet_name: str | int = 0) -> pd.DataFrame:
-        """Read a file into a DataFrame based on extension."""
+    def _read_file(
+        self,
+        file_path: str,
+        *,
+        sheet_name: str | int = 0,
+        nrows: int | None = None,
+        usecols: list[int] | None = None,
+    ) -> pd.DataFrame:
+        """Read a file into a DataFrame based on extension.
+
+        ``nrows`` stops the parser early, so previews of large uploads do not
+        parse rows that would only be dropped; ``usecols`` likewise skips
+        building columns the caller never reads.
+        """
         ext = Path(file_path).suffix.lower()
         if ext not in self.SUPPORTED_EXTENSIONS:
             raise ValueError(f"Unsupported file type: {ext}. Supported: {self.SUPPORTED_EXTENSIONS}")
 
         if ext == ".csv":
-            return pd.read_csv(file_path)
+            return pd.read_csv(file_path, nrows=nrows, usecols=usecols)
         elif ext == ".tsv":
-            return pd.read_csv(file_path, sep="\t")
+            return pd.read_csv(file_path, sep="\t", nrows=nrows, usecols=usecols)
         else:
-            return pd.read_excel(file_path, sheet_name=sheet_name)
+            return pd.read_excel(file_path, sheet_name=sheet_name, nrows=nrows, usecols=usecols)
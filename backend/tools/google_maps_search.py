@@ -2,17 +2,32 @@
 
 from __future__ import annotations
 
+from importlib.util import find_spec
 from typing import Optional
 
 import httpx
 
 from config.settings import Settings, get_settings
+from tools.json_codec import loads
+
+# See tools/google_search.py: multiplex concurrent Serper calls over HTTP/2
+# when the optional ``h2`` package is installed.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
 
 
 class GoogleMapsSearchTool:
     """Search Google Maps through Serper and return normalized place results."""
 
     SERPER_MAPS_URL = "https://google.serper.dev/maps"
+    # Connection-level retries (connect errors/timeouts) handled by the
+    # transport, so a flaky TLS connect does not fail a whole keyword.
+    CONNECT_RETRIES = 2
+    # Keep idle connections to Serper open across gaps between search batches.
+    POOL_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=60.0,
+    )
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
@@ -20,7 +35,14 @@ class GoogleMapsSearchTool:
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=self.CONNECT_RETRIES,
+                    http2=_HTTP2_AVAILABLE,
+                    limits=self.POOL_LIMITS,
+                ),
+            )
         return self._client
 
     async def search(
@@ -54,7 +76,7 @@ class GoogleMapsSearchTool:
             json=body,
         )
         resp.raise_for_status()
-        data = resp.json()
+        data = loads(resp.content)
 
         places = data.get("places") or data.get("data", {}).get("places", [])
         results = []
@@ -2,16 +2,28 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
+from importlib.util import find_spec
+from pathlib import Path
 from typing import Optional
 
 import httpx
 from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from config.settings import Settings, get_settings
+from tools.disk_cache import disk_cache_path, read_disk_cache, write_disk_cache
+from tools.http_retry import WaitRetryAfter
+from tools.json_codec import loads
 
 logger = logging.getLogger(__name__)
 
+# Serper calls are fanned out concurrently to one host; with the optional
+# ``h2`` package installed they are multiplexed over a single HTTP/2
+# connection instead of opening one TLS connection per in-flight request.
+_HTTP2_AVAILABLE = find_spec("h2") is not None
+
 
 def _is_retryable_error(exc: BaseException) -> bool:
     if isinstance(exc, httpx.HTTPStatusError):
@@ -25,23 +37,30 @@ class GoogleSearchTool:
     """Search Google through Serper and return normalized organic results."""
 
     SERPER_URL = "https://google.serper.dev/search"
+    CACHE_TTL_SECONDS = 3600.0
+    # Keep idle connections to Serper open across gaps between search batches.
+    POOL_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=60.0,
+    )
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
         self._client: Optional[httpx.AsyncClient] = None
+        # (query, num, gl, hl) -> (expires_at, results).  Agents and the
+        # customs router often repeat the same query within one hunt.
+        self._cache: dict[tuple[str, int, str, str], tuple[float, list[dict]]] = {}
 
     async def _get_client(self) -> httpx.AsyncClient:
         if self._client is None:
-            self._client = httpx.AsyncClient(timeout=30.0)
+            self._client = httpx.AsyncClient(
+                timeout=30.0,
+                http2=_HTTP2_AVAILABLE,
+                limits=self.POOL_LIMITS,
+            )
         return self._client
 
-    @retry(
-        retry=retry_if_exception(_is_retryable_error),
-        stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
-        before_sleep=before_sleep_log(logger, logging.WARNING),
-        reraise=True,
-    )
     async def search(
         self,
         query: str,
@@ -50,39 +69,149 @@ class GoogleSearchTool:
         gl: str = "",
         hl: str = "",
     ) -> list[dict]:
-        """Execute a Google search via Serper."""
+        """Execute a Google search via Serper.
+
+        Identical queries are answered from an in-memory cache for
+        ``CACHE_TTL_SECONDS``; only successful responses are cached.  When
+        ``serper_cache_dir`` is set, responses are also persisted there for
+        ``serper_cache_ttl_seconds`` so repeated runs skip the paid call.
+        """
+        return (await self.search_many([query], num=num, gl=gl, hl=hl))[0]
+
+    async def search_many(
+        self,
+        queries: list[str],
+        *,
+        num: int = 10,
+        gl: str = "",
+        hl: str = "",
+    ) -> list[list[dict]]:
+        """Execute several Google searches in a single Serper request.
+
+        Serper accepts a JSON array of query objects and answers with an array
+        of responses in the same order, so N searches cost one round-trip
+        instead of N.  Cached queries are answered locally and left out of
+        the batch.  Results are returned in the order of *queries*; a query
+        whose search fails gets ``[]``, and the error is raised only when no
+        query could be answered.
+        """
         if not self._settings.serper_api_key:
             raise RuntimeError("SERPER_API_KEY is required for Google search.")
 
-        body: dict[str, object] = {"q": query, "num": num}
-        if gl:
-            body["gl"] = gl
-        if hl:
-            body["hl"] = hl
-
-        client = await self._get_client()
-        resp = await client.post(
-            self.SERPER_URL,
-            headers={
+        now = time.monotonic()
+        found: dict[tuple[str, int, str, str], list[dict]] = {}
+        missing: dict[tuple[str, int, str, str], Path | None] = {}
+        for query in queries:
+            key = (query, num, gl, hl)
+            if key in found or key in missing:
+                continue
+            cached = self._cache.get(key)
+            if cached and cached[0] > now:
+                found[key] = cached[1]
+                continue
+            disk_path = disk_cache_path(self._settings.serper_cache_dir, list(key))
+            if disk_path is not None:
+                stored = await asyncio.to_thread(read_disk_cache, disk_path)
+                if isinstance(stored, list):
+                    self._cache[key] = (now + self.CACHE_TTL_SECONDS, stored)
+                    found[key] = stored
+                    continue
+            missing[key] = disk_path
+
+        if missing:
+            # Body and headers are built once here; retries of _post_search()
+            # resend the same objects instead of rebuilding them per attempt.
+            bodies: list[dict[str, object]] = []
+            for query, _, _, _ in missing:
+                body: dict[str, object] = {"q": query, "num": num}
+                if gl:
+                    body["gl"] = gl
+                if hl:
+                    body["hl"] = hl
+                bodies.append(body)
+            headers = {
                 "X-API-KEY": self._settings.serper_api_key,
                 "Content-Type": "application/json",
-            },
-            json=body,
+            }
+            responses = await self._post_batch(bodies, headers)
+
+            for (key, disk_path), response in zip(missing.items(), responses):
+                # A failed or malformed answer leaves only this query empty,
+                # and is not cached.
+                if not isinstance(response, dict):
+                    continue
+                results = []
+                for item in response.get("organic") or []:
+                    if not isinstance(item, dict):
+                        continue
+                    results.append(
+                        {
+                            "title": item.get("title", ""),
+                            "link": item.get("link", ""),
+                            "snippet": item.get("snippet", ""),
+                            "position": item.get("position", 0),
+                        }
+                    )
+                self._cache[key] = (now + self.CACHE_TTL_SECONDS, results)
+                if disk_path is not None:
+                    await asyncio.to_thread(
+                        write_disk_cache, disk_path, results, self._settings.serper_cache_ttl_seconds
+                    )
+                found[key] = results
+
+            # Errors only surface when no query could be answered at all.
+            errors = [r for r in responses if isinstance(r, Exception)]
+            if errors and not found:
+                raise errors[0]
+
+        return [
+            [dict(item) for item in found.get((query, num, gl, hl), [])]
+            for query in queries
+        ]
+
+    async def _post_batch(
+        self,
+        bodies: list[dict[str, object]],
+        headers: dict[str, str],
+    ) -> list[object]:
+        """Post *bodies* in one request, returning one response or error per body.
+
+        If a multi-query batch fails or comes back malformed, each query is
+        retried on its own so one bad query does not empty the others.
+        """
+        if len(bodies) == 1:
+            try:
+                return [await self._post_search(bodies[0], headers)]
+            except Exception as e:
+                return [e]
+        try:
+            data = await self._post_search(bodies, headers)
+            if isinstance(data, list) and len(data) == len(bodies):
+                return data
+            logger.warning("[GoogleSearch] Malformed batch response for %d queries", len(bodies))
+        except Exception as e:
+            logger.warning("[GoogleSearch] Batch of %d queries failed: %s", len(bodies), e)
+        return await asyncio.gather(
+            *(self._post_search(body, headers) for body in bodies),
+            return_exceptions=True,
         )
+
+    @retry(
+        retry=retry_if_exception(_is_retryable_error),
+        stop=stop_after_attempt(3),
+        wait=WaitRetryAfter(wait_exponential(multiplier=1, min=2, max=10)),
+        before_sleep=before_sleep_log(logger, logging.WARNING),
+        reraise=True,
+    )
+    async def _post_search(
+        self,
+        body: dict[str, object] | list[dict[str, object]],
+        headers: dict[str, str],
+    ) -> dict | list[dict]:
+        client = await self._get_client()
+        resp = await client.post(self.SERPER_URL, headers=headers, json=body)
         resp.raise_for_status()
-        data = resp.json()
-
-        results = []
-        for item in data.get("organic", []):
-            results.append(
-                {
-                    "title": item.get("title", ""),
-                    "link": item.get("link", ""),
-                    "snippet": item.get("snippet", ""),
-                    "position": item.get("position", 0),
-                }
-            )
-        return results
+        return loads(resp.content)
 
     async def close(self) -> None:
         if self._client:
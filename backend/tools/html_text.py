@@ -0,0 +1,123 @@
+"""Regex-based HTML to text reduction for directly fetched pages.
+
+Not a full HTML parser — just enough to turn server-rendered markup into
+text the contact regexes and the LLM can work with, without a headless
+browser or the Jina renderer.
+"""
+
+from __future__ import annotations
+
+import html
+import re
+
+_HTML_NON_CONTENT_RE = re.compile(
+    r"<(script|style|noscript|svg|template)\b[^>]*>.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+_HTML_HEAD_RE = re.compile(r"<head\b[^>]*>.*?</head\s*>", re.IGNORECASE | re.DOTALL)
+# The label may not run into another anchor: with a plain ``.*?`` every
+# unclosed ``<a href>`` would scan to the end of the document, which made
+# malformed pages quadratic.
+_HTML_ANCHOR_RE = re.compile(
+    r"""<a\b[^<>]*?\bhref\s*=\s*["']([^"']+)["'][^<>]*>((?:(?!</?a\b).)*)</a\s*>""",
+    re.IGNORECASE | re.DOTALL,
+)
+_HTML_BLOCK_BREAK_RE = re.compile(
+    r"<br\s*/?>|</(?:p|div|li|tr|h[1-6]|section|article|header|footer|table|ul|ol)\s*>",
+    re.IGNORECASE,
+)
+# ``[^<>]`` rather than ``[^>]`` so a stray ``<`` in text stops at the next
+# tag instead of scanning ahead for a ``>`` that may never come.
+_HTML_TAG_RE = re.compile(r"<[^<>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+_INLINE_WHITESPACE_RE = re.compile(r"[^\S\n]+")
+_BLANK_LINES_RE = re.compile(r"\s*\n\s*")
+# Jina emits ``[label](url "title")``; the optional title is matched too.
+_MD_IMAGE_RE = re.compile(r'!\[[^\]\n]*\]\([^)\s]*(?:\s+"[^"\n]*")?\)')
+_MD_LINK_RE = re.compile(r'\[([^\]\n]*)\]\(([^)\s]+)(?:\s+"[^"\n]*")?\)')
+_CONTACT_LINK_PREFIXES = ("mailto:", "tel:")
+_NON_SPACE_RE = re.compile(r"\S")
+
+
+def _anchor_to_markdown(match: re.Match) -> str:
+    href = match.group(1).strip()
+    label = _WHITESPACE_RE.sub(" ", _HTML_TAG_RE.sub(" ", match.group(2))).strip()
+    return f" [{label}]({href}) "
+
+
+def html_to_text(markup: str, *, keep_links: bool = False) -> str:
+    """Strip scripts, styles and tags from raw HTML, returning visible text.
+
+    With ``keep_links`` the ``<head>`` is dropped, anchors are kept as
+    Markdown ``[label](href)`` links and block elements end a line, so the
+    result reads like Jina Reader output: ``discover_contact_pages`` and the
+    email/social regexes still see ``mailto:`` and profile links.
+    """
+    text = _HTML_NON_CONTENT_RE.sub(" ", markup)
+    if not keep_links:
+        text = _HTML_TAG_RE.sub(" ", text)
+        return _WHITESPACE_RE.sub(" ", html.unescape(text)).strip()
+
+    text = _HTML_HEAD_RE.sub(" ", text)
+    text = _HTML_ANCHOR_RE.sub(_anchor_to_markdown, text)
+    text = _HTML_BLOCK_BREAK_RE.sub("\n", text)
+    text = _HTML_TAG_RE.sub(" ", text)
+    text = _INLINE_WHITESPACE_RE.sub(" ", html.unescape(text))
+    return _BLANK_LINES_RE.sub("\n", text).strip()
+
+
+def _link_to_label(match: re.Match) -> str:
+    label, href = match.group(1).strip(), match.group(2)
+    if href.lower().startswith(_CONTACT_LINK_PREFIXES):
+        return f"{label} ({href})" if label else href
+    return label
+
+
+def _compact_markdown(text: str) -> str:
+    text = _MD_IMAGE_RE.sub(" ", text)
+    text = _MD_LINK_RE.sub(_link_to_label, text)
+    text = _INLINE_WHITESPACE_RE.sub(" ", text)
+    return _BLANK_LINES_RE.sub("\n", text).strip()
+
+
+def _safe_cut(text: str, end: int) -> int:
+    """Return the last line start before ``end`` that no link or image spans, or 0.
+
+    Labels and targets never contain a newline; a match only continues past
+    one into a ``"title"``.  A line starting with ``!`` could be an image whose
+    removal brings such a title up, so it is not a safe cut either.
+    """
+    newline = text.rfind("\n", 0, end)
+    while newline != -1:
+        following = _NON_SPACE_RE.search(text, newline)
+        if following is None or following.group() not in '"!':
+            return newline + 1
+        newline = text.rfind("\n", 0, newline)
+    return 0
+
+
+def compact_for_llm(text: str, limit: int | None = None) -> str:
+    """Drop image embeds and non-contact link targets from Markdown page text.
+
+    Image and tracking URLs are a large share of a Jina page's characters but
+    carry nothing the extraction prompt uses, so truncated prompts keep more
+    visible copy. ``mailto:``/``tel:`` targets stay verbatim. Run the contact
+    regexes and ``discover_contact_pages`` on the original text, not this.
+
+    With ``limit`` the result is cut to that many characters, and only as much
+    of the page as is needed to fill it is rewritten; the page is only split
+    at line breaks no link crosses, so the output equals compacting it whole.
+    """
+    if "](" not in text:
+        return text if limit is None else text[:limit]
+    if limit is None:
+        return _compact_markdown(text)
+    window = limit * 2
+    while window < len(text):
+        cut = _safe_cut(text, window)
+        if cut:
+            compacted = _compact_markdown(text[:cut])
+            if len(compacted) >= limit:
+                return compacted[:limit]
+        window *= 2
+    return _compact_markdown(text)[:limit]
@@ -0,0 +1,51 @@
+"""Tenacity helpers shared by the HTTP tool clients."""
+
+from __future__ import annotations
+
+import time
+from email.utils import parsedate_to_datetime
+
+import httpx
+from tenacity import RetryCallState
+from tenacity.wait import wait_base
+
+MAX_RETRY_AFTER_SECONDS = 60.0
+
+
+def retry_after_seconds(response: httpx.Response) -> float | None:
+    """Return the delay requested by a ``Retry-After`` header, if any.
+
+    Accepts both forms allowed by RFC 9110: delta-seconds and an HTTP date.
+    """
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class WaitRetryAfter(wait_base):
+    """Wait as long as the server asked via ``Retry-After``, else use *fallback*.
+
+    Serper and Jina send ``Retry-After`` on 429s; honoring it avoids burning
+    retries on a fixed backoff that is shorter than the server's cooldown.
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float = MAX_RETRY_AFTER_SECONDS) -> None:
+        self._fallback = fallback
+        self._max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        exc = outcome.exception() if outcome is not None and outcome.failed else None
+        if isinstance(exc, httpx.HTTPStatusError):
+            delay = retry_after_seconds(exc.response)
+            if delay is not None:
+                return min(delay, self._max_wait)
+        return self._fallback(retry_state)
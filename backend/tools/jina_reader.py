@@ -2,17 +2,76 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import ipaddress
 import logging
+import re
+import socket
+import weakref
 from typing import Optional
+from urllib.parse import urldefrag
 
 import httpx
 from tenacity import before_sleep_log, retry, retry_if_exception, stop_after_attempt, wait_exponential
 
 from config.settings import Settings, get_settings
+from tools.disk_cache import disk_cache_path, read_disk_cache, write_disk_cache
+from tools.html_text import html_to_text
+from tools.http_retry import WaitRetryAfter
 
 logger = logging.getLogger(__name__)
 
 
+# Declared charset of an HTML document, from either <meta charset=...> or the
+# http-equiv Content-Type form; only the first bytes are searched.
+_META_CHARSET_RE = re.compile(rb"""<meta[^>]+charset\s*=\s*["']?\s*([A-Za-z0-9_.:-]+)""", re.IGNORECASE)
+_META_CHARSET_SCAN_BYTES = 2048
+_BOM_ENCODINGS = (
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+# Browsers decode these labels as GBK; gb18030 is its superset.
+_ENCODING_ALIASES = {"gb2312": "gb18030", "gbk": "gb18030", "x-gbk": "gb18030"}
+
+
+def _html_encoding(body: bytes | bytearray, header_charset: str | None) -> str:
+    """Pick the charset for an HTML body: BOM, then header, then <meta>, then UTF-8."""
+    for bom, encoding in _BOM_ENCODINGS:
+        if body.startswith(bom):
+            return encoding
+    declared = header_charset
+    if not declared:
+        match = _META_CHARSET_RE.search(body[:_META_CHARSET_SCAN_BYTES])
+        declared = match.group(1).decode("ascii") if match else None
+    if declared:
+        declared = _ENCODING_ALIASES.get(declared.strip().lower(), declared.strip())
+        try:
+            return codecs.lookup(declared).name
+        except LookupError:
+            pass
+    return "utf-8"
+
+
+async def _reject_non_public_host(request: httpx.Request) -> None:
+    """Refuse direct fetches of loopback, private, link-local or reserved hosts.
+
+    Direct reads go to URLs chosen by search results and the LLM, so every
+    hop, redirects included, must resolve only to public addresses.
+    """
+    host = request.url.host
+    try:
+        addresses = [ipaddress.ip_address(host)]
+    except ValueError:
+        port = request.url.port or (443 if request.url.scheme == "https" else 80)
+        infos = await asyncio.get_running_loop().getaddrinfo(host, port, type=socket.SOCK_STREAM)
+        addresses = [ipaddress.ip_address(info[4][0].partition("%")[0]) for info in infos]
+    for address in addresses:
+        if not address.is_global or address.is_multicast:
+            raise httpx.ConnectError(f"Refusing direct fetch of non-public host {host}", request=request)
+
+
 def _is_retryable_error(exc: BaseException) -> bool:
     if isinstance(exc, httpx.HTTPStatusError):
         return exc.response.status_code == 429 or exc.response.status_code >= 500
@@ -21,30 +80,153 @@ def _is_retryable_error(exc: BaseException) -> bool:
     return False
 
 
+# Every JinaReaderTool on a loop (successive hunt rounds, concurrent hunts)
+# reads through one pooled client, so warm connections to r.jina.ai outlive
+# the tool instance instead of being torn down at the end of each round.
+_shared_clients: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+async def close_shared_clients() -> None:
+    """Close the pooled Jina client of the running loop (app shutdown)."""
+    client = _shared_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 class JinaReaderTool:
-    """Fetch clean Markdown from r.jina.ai for a target URL."""
+    """Fetch clean Markdown from r.jina.ai for a target URL.
+
+    Server-rendered pages are read directly first when
+    ``scrape_direct_fetch_enabled`` is set; Jina is only used for pages that
+    fail, are not HTML, or carry too little text to be anything but a
+    script-rendered shell. Direct reads only ever reach public addresses.
+    """
 
     JINA_BASE = "https://r.jina.ai/"
+    # Every read goes to the same host, and ReAct workers interleave reads
+    # with multi-second LLM calls. httpx's default 5s keep-alive drops the
+    # pooled connections in between, forcing a fresh TLS handshake per read.
+    POOL_LIMITS = httpx.Limits(
+        max_connections=100,
+        max_keepalive_connections=20,
+        keepalive_expiry=60.0,
+    )
+    DIRECT_FETCH_HEADERS = {
+        "User-Agent": "Mozilla/5.0 AIHunter/1.0",
+        "Accept": "text/html,application/xhtml+xml",
+    }
+    # Visible text below this is treated as a JS shell and sent through Jina,
+    # unless the page links an email address or phone number: short static
+    # contact pages already hold everything the extractor needs.
+    DIRECT_FETCH_MIN_TEXT_CHARS = 1500
+    DIRECT_FETCH_MIN_CONTACT_TEXT_CHARS = 200
+    CONTACT_LINK_MARKERS = ("](mailto:", "](tel:")
+    DIRECT_FETCH_MAX_BYTES = 2 * 1024 * 1024
+    # Text that is still mostly undecodable after charset detection is sent
+    # through Jina, which renders the page the way a browser would.
+    DIRECT_FETCH_MAX_REPLACEMENT_RATIO = 0.01
+    # Converting markup costs roughly 1ms per 8 KB; larger documents are
+    # converted on a worker thread so concurrent reads and LLM calls keep
+    # being served while the regexes run.
+    DIRECT_FETCH_THREAD_MIN_CHARS = 256 * 1024
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
-        self._client: Optional[httpx.AsyncClient] = None
+        self._direct_client: Optional[httpx.AsyncClient] = None
 
     async def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(timeout=60.0)
-        return self._client
+        loop = asyncio.get_running_loop()
+        client = _shared_clients.get(loop)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(timeout=60.0, limits=self.POOL_LIMITS)
+            _shared_clients[loop] = client
+        return client
+
+    async def _get_direct_client(self) -> httpx.AsyncClient:
+        if self._direct_client is None:
+            self._direct_client = httpx.AsyncClient(
+                timeout=10.0,
+                follow_redirects=True,
+                headers=self.DIRECT_FETCH_HEADERS,
+                event_hooks={"request": [_reject_non_public_host]},
+            )
+        return self._direct_client
+
+    async def read(self, url: str) -> str:
+        """Read a URL, trying a direct fetch before the Jina Reader service.
+
+        When ``scrape_cache_dir`` is set, non-empty pages are kept there for
+        ``scrape_cache_ttl_seconds`` so reruns over the same URLs skip the
+        network entirely.  Fragments never reach the server and are ignored.
+        """
+        cache_path = disk_cache_path(self._settings.scrape_cache_dir, ["read", urldefrag(url).url])
+        if cache_path is not None:
+            cached = await asyncio.to_thread(read_disk_cache, cache_path)
+            if isinstance(cached, str):
+                return cached
+
+        text = ""
+        if self._settings.scrape_direct_fetch_enabled:
+            text = await self._read_direct(url)
+        if not text:
+            text = await self._read_via_jina(url)
+
+        if cache_path is not None and text.strip():
+            await asyncio.to_thread(
+                write_disk_cache, cache_path, text, self._settings.scrape_cache_ttl_seconds
+            )
+        return text
+
+    async def _read_direct(self, url: str) -> str:
+        """Return the page's text when a plain GET yields usable HTML, else ''."""
+        try:
+            client = await self._get_direct_client()
+            async with client.stream("GET", url) as resp:
+                resp.raise_for_status()
+                # Only the HTML document is used.  Check the headers before
+                # downloading so linked PDFs, images and media are never
+                # pulled just to be discarded; oversized documents go to Jina.
+                if "html" not in resp.headers.get("content-type", "").lower():
+                    return ""
+                if int(resp.headers.get("content-length") or 0) > self.DIRECT_FETCH_MAX_BYTES:
+                    return ""
+                body = bytearray()
+                async for chunk in resp.aiter_bytes():
+                    body.extend(chunk)
+                    if len(body) > self.DIRECT_FETCH_MAX_BYTES:
+                        return ""
+                markup = body.decode(_html_encoding(body, resp.charset_encoding), errors="replace")
+        except Exception as e:
+            logger.debug("[JinaReader] Direct fetch failed for %s: %s", url, e)
+            return ""
+        if len(markup) >= self.DIRECT_FETCH_THREAD_MIN_CHARS:
+            text = await asyncio.to_thread(html_to_text, markup, keep_links=True)
+        else:
+            text = html_to_text(markup, keep_links=True)
+        if text.count("\ufffd") > len(text) * self.DIRECT_FETCH_MAX_REPLACEMENT_RATIO:
+            return ""
+        if len(text) >= self.DIRECT_FETCH_MIN_TEXT_CHARS:
+            return text
+        if len(text) >= self.DIRECT_FETCH_MIN_CONTACT_TEXT_CHARS and any(
+            marker in text for marker in self.CONTACT_LINK_MARKERS
+        ):
+            return text
+        return ""
 
     @retry(
         retry=retry_if_exception(_is_retryable_error),
         stop=stop_after_attempt(3),
-        wait=wait_exponential(multiplier=1, min=2, max=10),
+        wait=WaitRetryAfter(wait_exponential(multiplier=1, min=2, max=10)),
         before_sleep=before_sleep_log(logger, logging.WARNING),
         reraise=True,
     )
-    async def read(self, url: str) -> str:
+    async def _read_via_jina(self, url: str) -> str:
         """Read a URL through the Jina Reader service."""
-        headers = {"Accept": "text/markdown"}
+        # Images are never used downstream; dropping them keeps long CDN
+        # image links out of the markdown (and out of truncated LLM context).
+        headers = {"Accept": "text/markdown", "X-Retain-Images": "none"}
         if self._settings.jina_api_key:
             headers["Authorization"] = f"Bearer {self._settings.jina_api_key}"
 
@@ -54,6 +236,7 @@ class JinaReaderTool:
         return resp.text
 
     async def close(self) -> None:
-        if self._client:
-            await self._client.aclose()
-            self._client = None
+        # The Jina client is shared per loop; see close_shared_clients().
+        if self._direct_client:
+            await self._direct_client.aclose()
+            self._direct_client = None
@@ -0,0 +1,40 @@
+"""JSON encode/decode helpers that use orjson when it is installed.
+
+orjson is an optional speed-up; the stdlib ``json`` module is used when it is
+missing or when orjson rejects a value (e.g. integers wider than 64 bits).
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def loads(data: str | bytes) -> Any:
+    """Parse a JSON document from text or raw bytes.
+
+    Input orjson rejects (``NaN``, integers wider than 64 bits, lone
+    surrogates) is re-parsed with the stdlib, so results and the raised
+    ``json.JSONDecodeError`` match ``json.loads``.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def dumps_bytes(obj: Any, *, default: Callable[[Any], Any] | None = str) -> bytes:
+    """Serialize *obj* to compact UTF-8 JSON bytes (non-ASCII kept as-is)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=default, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, default=default).encode("utf-8")
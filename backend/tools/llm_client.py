@@ -14,7 +14,10 @@ from typing import Any
 import litellm
 
 from config.settings import Settings, get_settings
+from observability.cost_tracker import get_tracker
+from tools.disk_cache import disk_cache_path, read_disk_cache, write_disk_cache
 from tools.llm_errors import format_llm_error
+from tools.llm_output import clean_json, extract_json
 from tools.llm_rate_limiter import get_llm_rate_limiter
 
 
@@ -67,6 +70,13 @@ def _is_retryable_rate_limit_error(exc: Exception) -> bool:
     )
 
 
+def _is_reusable_completion(content: str, response_format: dict | None) -> bool:
+    """Return whether a completion is safe to replay from the disk cache."""
+    if not response_format:
+        return True
+    return isinstance(extract_json(clean_json(content)), dict)
+
+
 def _provider_key_map(settings: Settings, scope: str) -> dict[str, str]:
     if scope in {"email", "email_reasoning"}:
         return {
@@ -93,12 +103,18 @@ def _provider_key_map(settings: Settings, scope: str) -> dict[str, str]:
     }
 
 
+def _set_env(name: str, value: str) -> None:
+    # Every LLMTool/ReAct call re-injects keys; skip the putenv when unchanged.
+    if os.environ.get(name) != value:
+        os.environ[name] = value
+
+
 def _inject_api_keys(settings: Settings, scope: str = "default") -> None:
     """Push provider API keys from Settings into env vars for litellm."""
     _key_map = _provider_key_map(settings, scope)
     for env_var, value in _key_map.items():
         if value:
-            os.environ[env_var] = value
+            _set_env(env_var, value)
 
     # Native workaround: If using anthropic/ prefix for MiniMax, inject ANTHROPIC_API_BASE
     llm_models = [
@@ -108,7 +124,7 @@ def _inject_api_keys(settings: Settings, scope: str = "default") -> None:
         settings.email_reasoning_model,
     ]
     if any(model.startswith("anthropic/") and "minimax" in model.lower() for model in llm_models if model):
-        os.environ["ANTHROPIC_API_BASE"] = normalize_minimax_api_base(settings.minimax_api_base)
+        _set_env("ANTHROPIC_API_BASE", normalize_minimax_api_base(settings.minimax_api_base))
 
 
 def _select_model(settings: Settings, model_type: str) -> str:
@@ -158,10 +174,14 @@ class LLMTool:
         self._agent = agent
         self._hunt_round = hunt_round
         _inject_api_keys(self._settings, self._model_type)
+        # Resolved once: ``model`` is read several times per call and the
+        # legacy-alias normalization logs a warning every time it rewrites.
+        self._model = normalize_model_name(_select_model(self._settings, self._model_type))
+        self._response_format_supported = not self._model.startswith(_RESPONSE_FORMAT_UNSUPPORTED_PREFIXES)
 
     @property
     def model(self) -> str:
-        return normalize_model_name(_select_model(self._settings, self._model_type))
+        return self._model
 
     @property
     def _default_temperature(self) -> float:
@@ -187,7 +207,7 @@ class LLMTool:
 
     def _supports_response_format(self) -> bool:
         """Return whether the current provider accepts OpenAI-style response_format."""
-        return not self.model.startswith(_RESPONSE_FORMAT_UNSUPPORTED_PREFIXES)
+        return self._response_format_supported
 
     async def generate(
         self,
@@ -197,6 +217,7 @@ class LLMTool:
         temperature: float | None = None,
         max_tokens: int | None = None,
         response_format: dict | None = None,
+        cache: bool = False,
     ) -> str:
         """Generate a completion from the LLM.
 
@@ -206,6 +227,10 @@ class LLMTool:
             temperature: Override default temperature.
             max_tokens: Override default max_tokens.
             response_format: Optional JSON mode config.
+            cache: Reuse a stored completion for an identical request when
+                ``llm_cache_dir`` is set.  Only for deterministic extraction
+                calls — a hit records no cost.  In JSON mode, entries that do
+                not parse as an object are ignored and overwritten.
 
         Returns:
             The generated text content.
@@ -213,6 +238,17 @@ class LLMTool:
         temp = temperature if temperature is not None else self._default_temperature
         tokens = max_tokens or self._default_max_tokens
 
+        cache_path = None
+        if cache:
+            cache_path = disk_cache_path(
+                self._settings.llm_cache_dir,
+                [self.model, system, prompt, temp, tokens, response_format],
+            )
+        if cache_path is not None:
+            cached = await asyncio.to_thread(read_disk_cache, cache_path)
+            if isinstance(cached, str) and _is_reusable_completion(cached, response_format):
+                return cached
+
         messages: list[dict[str, str]] = []
         if system:
             messages.append({"role": "system", "content": system})
@@ -261,7 +297,6 @@ class LLMTool:
         # Record cost to tracker if hunt_id is set
         if self._hunt_id:
             try:
-                from observability.cost_tracker import get_tracker
                 usage = getattr(response, "usage", None)
                 if usage:
                     cost = getattr(response, "_hidden_params", {}).get("response_cost") or 0.0
@@ -276,7 +311,12 @@ class LLMTool:
             except Exception:
                 pass  # Never let tracking break the main flow
 
-        return response.choices[0].message.content
+        content = response.choices[0].message.content
+        if cache_path is not None and content and _is_reusable_completion(content, response_format):
+            await asyncio.to_thread(
+                write_disk_cache, cache_path, content, self._settings.llm_cache_ttl_seconds
+            )
+        return content
 
     async def close(self) -> None:
         """No-op — litellm manages its own connections."""
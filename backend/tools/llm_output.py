@@ -12,9 +12,10 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 from typing import Any
 
+from tools.json_codec import loads
+
 logger = logging.getLogger(__name__)
 
 
@@ -42,11 +43,32 @@ def clean_json(raw: str) -> str:
     return text
 
 
+def extract_json(text: str) -> dict | list | None:
+    """Parse *text* as JSON, falling back to its outermost ``{...}``/``[...]`` span.
+
+    The span runs from the first opening to the last closing bracket, which
+    skips prose a model puts before or after the document.
+    """
+    try:
+        return loads(text)
+    except json.JSONDecodeError:
+        pass
+    for opening, closing in (("{", "}"), ("[", "]")):
+        start = text.find(opening)
+        end = text.rfind(closing)
+        if start != -1 and end > start:
+            try:
+                return loads(text[start:end + 1])
+            except json.JSONDecodeError:
+                pass
+    return None
+
+
 def parse_json(raw: str, *, context: str = "") -> dict | list | None:
     """Parse LLM output as JSON with multiple fallback strategies.
 
     1. Direct parse after cleaning markdown fences
-    2. Regex extraction of outermost {...} or [...]
+    2. Outermost {...} span, then outermost [...] span
     3. Returns None if all strategies fail
 
     Args:
@@ -61,28 +83,9 @@ def parse_json(raw: str, *, context: str = "") -> dict | list | None:
         return None
 
     clean = clean_json(raw)
-
-    # Strategy 1: direct parse
-    try:
-        return json.loads(clean)
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy 2: extract outermost JSON object {...}
-    m = re.search(r'\{.*\}', clean, re.DOTALL)
-    if m:
-        try:
-            return json.loads(m.group())
-        except json.JSONDecodeError:
-            pass
-
-    # Strategy 3: extract outermost JSON array [...]
-    m = re.search(r'\[.*\]', clean, re.DOTALL)
-    if m:
-        try:
-            return json.loads(m.group())
-        except json.JSONDecodeError:
-            pass
+    parsed = extract_json(clean)
+    if parsed is not None:
+        return parsed
 
     logger.warning("[%s] Failed to parse JSON: %s", context or "parse_json", clean[:200])
     return None
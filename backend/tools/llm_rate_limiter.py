@@ -16,11 +16,17 @@ _NO_LIMIT = 0
 
 
 class AsyncWindowRateLimiter:
-    """Simple sliding-window async limiter."""
+    """Simple sliding-window async limiter.
+
+    Each caller reserves the earliest slot that keeps the window under the
+    limit and sleeps until then, so waiters are served in arrival order and
+    wake exactly once instead of repeatedly racing for the lock.
+    """
 
     def __init__(self, requests_per_minute: int, *, time_fn: Callable[[], float] | None = None) -> None:
         self._rpm = max(_NO_LIMIT, int(requests_per_minute))
         self._time_fn = time_fn or time.monotonic
+        # Granted slot times in ascending order; may include future slots.
         self._timestamps: deque[float] = deque()
         self._lock = asyncio.Lock()
 
@@ -29,22 +35,28 @@ class AsyncWindowRateLimiter:
         if self._rpm <= _NO_LIMIT:
             return
 
-        while True:
-            wait_for = 0.0
-            async with self._lock:
-                now = self._time_fn()
-                self._evict_expired(now)
-
-                if len(self._timestamps) < self._rpm:
-                    self._timestamps.append(now)
-                    return
+        async with self._lock:
+            now = self._time_fn()
+            self._evict_expired(now)
 
-                oldest = self._timestamps[0]
-                wait_for = max(0.0, _WINDOW_SECONDS - (now - oldest))
+            slot = now
+            if len(self._timestamps) >= self._rpm:
+                slot = max(now, self._timestamps[-self._rpm] + _WINDOW_SECONDS)
+            self._timestamps.append(slot)
 
-            if wait_for > 0:
-                logger.debug("LLM RPM limit reached; sleeping %.2fs", wait_for)
+        wait_for = slot - now
+        if wait_for > 0:
+            logger.debug("LLM RPM limit reached; sleeping %.2fs", wait_for)
+            try:
                 await asyncio.sleep(wait_for)
+            except asyncio.CancelledError:
+                # A cancelled waiter never makes its call; free the slot so
+                # later callers are not delayed behind it.
+                try:
+                    self._timestamps.remove(slot)
+                except ValueError:
+                    pass
+                raise
 
     def _evict_expired(self, now: float) -> None:
         while self._timestamps and now - self._timestamps[0] >= _WINDOW_SECONDS:
@@ -13,15 +13,18 @@ Flow:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-import re
 from typing import Any, Callable, Awaitable
 
 import litellm
 
 from config.settings import Settings, get_settings
+from observability.cost_tracker import get_tracker
+from tools.json_codec import loads
 from tools.llm_errors import format_llm_error
+from tools.llm_output import extract_json
 from tools.llm_client import _inject_api_keys, normalize_model_name
 from tools.llm_rate_limiter import get_llm_rate_limiter
 
@@ -65,8 +68,8 @@ def _try_parse_json(text: str) -> dict | list | None:
 
     Strategies:
     1. Direct parse after cleaning markdown fences
-    2. Regex extraction of outermost {...}
-    3. Regex extraction of outermost [...]
+    2. Outermost {...} span
+    3. Outermost [...] span
 
     Returns:
         Parsed dict/list, or None if all strategies fail.
@@ -74,31 +77,7 @@ def _try_parse_json(text: str) -> dict | list | None:
     if not text or not text.strip():
         return None
 
-    cleaned = _clean_markdown_fences(text)
-
-    # Strategy 1: direct parse
-    try:
-        return json.loads(cleaned)
-    except (json.JSONDecodeError, TypeError):
-        pass
-
-    # Strategy 2: extract outermost JSON object {...}
-    m = re.search(r'\{.*\}', cleaned, re.DOTALL)
-    if m:
-        try:
-            return json.loads(m.group())
-        except json.JSONDecodeError:
-            pass
-
-    # Strategy 3: extract outermost JSON array [...]
-    m = re.search(r'\[.*\]', cleaned, re.DOTALL)
-    if m:
-        try:
-            return json.loads(m.group())
-        except json.JSONDecodeError:
-            pass
-
-    return None
+    return extract_json(_clean_markdown_fences(text))
 
 
 def _has_required_fields(parsed: dict | list | None, required_fields: list[str]) -> bool:
@@ -145,7 +124,12 @@ def _strip_tool_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]
 
 
 class ToolDef:
-    """Definition of a tool the ReAct agent can call."""
+    """Definition of a tool the ReAct agent can call.
+
+    Tool calls of one turn run concurrently, except ``sequential`` tools:
+    those read state that other tools produce, so they run one at a time,
+    in call order, after the turn's other calls have finished.
+    """
 
     def __init__(
         self,
@@ -153,11 +137,14 @@ class ToolDef:
         description: str,
         parameters: dict[str, Any],
         fn: Callable[..., Awaitable[str]],
+        *,
+        sequential: bool = False,
     ) -> None:
         self.name = name
         self.description = description
         self.parameters = parameters
         self.fn = fn
+        self.sequential = sequential
 
     def to_openai_schema(self) -> dict:
         """Convert to OpenAI function-calling tool schema."""
@@ -182,7 +169,6 @@ def _record_react_cost(
     if not hunt_id:
         return
     try:
-        from observability.cost_tracker import get_tracker
         usage = getattr(response, "usage", None)
         if usage:
             cost = getattr(response, "_hidden_params", {}).get("response_cost") or 0.0
@@ -198,6 +184,46 @@ def _record_react_cost(
         pass  # Never let tracking break the main flow
 
 
+async def _run_tool_call(tool_map: dict[str, ToolDef], tool_call: Any) -> str:
+    """Execute one tool call, returning its result or a JSON error string."""
+    fn_name = tool_call.function.name
+    fn_args_raw = tool_call.function.arguments
+
+    try:
+        fn_args = loads(fn_args_raw) if fn_args_raw else {}
+    except json.JSONDecodeError:
+        fn_args = {}
+
+    tool_def = tool_map.get(fn_name)
+    if not tool_def:
+        return json.dumps({"error": f"Unknown tool: {fn_name}"})
+    try:
+        logger.debug("[ReAct] Calling tool %s(%s)", fn_name, fn_args)
+        return await tool_def.fn(**fn_args)
+    except Exception as e:
+        logger.warning("[ReAct] Tool %s failed: %s", fn_name, e)
+        return json.dumps({"error": f"Tool {fn_name} failed: {e}"})
+
+
+async def _run_turn(tool_map: dict[str, ToolDef], tool_calls: list[Any]) -> list[str]:
+    """Run one turn's tool calls, returning their results in call order."""
+    sequential = [
+        getattr(tool_map.get(tool_call.function.name), "sequential", False)
+        for tool_call in tool_calls
+    ]
+    results: list[str] = [""] * len(tool_calls)
+    concurrent = [i for i, is_sequential in enumerate(sequential) if not is_sequential]
+    concurrent_results = await asyncio.gather(
+        *(_run_tool_call(tool_map, tool_calls[i]) for i in concurrent)
+    )
+    for i, result in zip(concurrent, concurrent_results):
+        results[i] = result
+    for i, is_sequential in enumerate(sequential):
+        if is_sequential:
+            results[i] = await _run_tool_call(tool_map, tool_calls[i])
+    return results
+
+
 async def react_loop(
     *,
     system: str,
@@ -381,27 +407,12 @@ async def react_loop(
         # Append assistant message with tool calls
         messages.append(msg.model_dump())
 
-        # Execute each tool call
-        for tool_call in msg.tool_calls:
-            fn_name = tool_call.function.name
-            fn_args_raw = tool_call.function.arguments
-
-            try:
-                fn_args = json.loads(fn_args_raw) if fn_args_raw else {}
-            except json.JSONDecodeError:
-                fn_args = {}
-
-            tool_def = tool_map.get(fn_name)
-            if not tool_def:
-                result = json.dumps({"error": f"Unknown tool: {fn_name}"})
-            else:
-                try:
-                    logger.debug("[ReAct] Calling tool %s(%s)", fn_name, fn_args)
-                    result = await tool_def.fn(**fn_args)
-                except Exception as e:
-                    logger.warning("[ReAct] Tool %s failed: %s", fn_name, e)
-                    result = json.dumps({"error": f"Tool {fn_name} failed: {e}"})
-
+        # Execute the tool calls of this turn concurrently — parallel
+        # scrape_page calls are independent network round-trips — then the
+        # sequential ones, which may read what those calls produced.  Results
+        # are appended in call order.
+        results = await _run_turn(tool_map, msg.tool_calls)
+        for tool_call, result in zip(msg.tool_calls, results):
             messages.append({
                 "role": "tool",
                 "tool_call_id": tool_call.id,
@@ -12,6 +12,7 @@ Design principle: **classify, don't discard**.  Let the model decide.
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from urllib.parse import urlparse
 
 # ── Truly irrelevant domains — zero B2B signal ──────────────────────────
@@ -78,13 +79,29 @@ def _bare_domain(url: str) -> str:
     return domain
 
 
-def _domain_matches(domain: str, target: str) -> bool:
-    return domain == target or domain.endswith("." + target)
+def _domain_suffixes(domain: str) -> set[str]:
+    """Return the domain and each parent domain (``a.b.com`` → a.b.com, b.com, com).
+
+    Checking these against a domain set matches exact domains and subdomains
+    in O(labels) instead of scanning every entry of the set.
+    """
+    labels = domain.split(".")
+    return {".".join(labels[i:]) for i in range(len(labels))}
+
+
+def domain_in(domain: str, targets: set[str] | dict[str, str]) -> bool:
+    """Return True when *domain* equals or is a subdomain of any target."""
+    return not _domain_suffixes(domain).isdisjoint(targets)
 
 
+@lru_cache(maxsize=4096)
 def classify_url(url: str) -> str:
     """Classify a URL into a processing category.
 
+    Pure function of the URL string, so results are memoized — the same
+    link is classified by search dedupe, lead extraction and the website
+    finder within one hunt.
+
     Returns one of:
         - ``"company_site"`` — likely a company's own website → direct scrape
         - ``"platform_listing"`` — B2B platform page → scrape for company info
@@ -101,28 +118,27 @@ def classify_url(url: str) -> str:
     if not domain:
         return "irrelevant"
 
+    suffixes = _domain_suffixes(domain)
+
     # 1. Truly irrelevant
-    for d in _IRRELEVANT_DOMAINS:
-        if _domain_matches(domain, d):
-            return "irrelevant"
+    if not suffixes.isdisjoint(_IRRELEVANT_DOMAINS):
+        return "irrelevant"
 
     # 2. LinkedIn company pages — special handling (Jina can't scrape)
     if _LINKEDIN_COMPANY_RE.search(url):
         return "linkedin_company"
 
     # 3. LinkedIn non-company pages (profiles, posts) → content
-    if _domain_matches(domain, "linkedin.com"):
+    if "linkedin.com" in suffixes:
         return "content_page"
 
     # 4. B2B platform listings
-    for pd in _PLATFORM_DOMAINS:
-        if _domain_matches(domain, pd):
-            return "platform_listing"
+    if not suffixes.isdisjoint(_PLATFORM_DOMAINS):
+        return "platform_listing"
 
     # 5. Content-rich domains (news, blogs, forums, directories)
-    for cd in _CONTENT_DOMAINS:
-        if _domain_matches(domain, cd):
-            return "content_page"
+    if not suffixes.isdisjoint(_CONTENT_DOMAINS):
+        return "content_page"
 
     # 6. Default — treat as a potential company website
     return "company_site"
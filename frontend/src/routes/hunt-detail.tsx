@@ -1661,10 +1661,14 @@ export function HuntDetailPage() {
       "source", "source_keyword", "match_score",
     ];
     const escapeCSV = (v: string) => v.includes(",") || v.includes('"') || v.includes("\n") ? `"${v.replace(/"/g, '""')}"` : v;
-    const rows = displayLeads.map((l: Record<string, unknown>) =>
-      headers.map((h) => {
-        if (h === "linkedin" || h === "facebook" || h === "twitter" || h === "instagram" || h === "youtube" || h === "whatsapp" || h === "wechat") {
-          const social = l.social_media as Record<string, string> | undefined;
+    const socialHeaders = new Set(["linkedin", "facebook", "twitter", "instagram", "youtube", "whatsapp", "wechat"]);
+    // Nested objects are resolved once per lead, not once per column.
+    const rows = displayLeads.map((l: Record<string, unknown>) => {
+      const social = l.social_media as Record<string, string> | undefined;
+      const dms = (l.decision_makers as Array<{name?: string; title?: string; email?: string; linkedin?: string; source_url?: string}> | undefined) || [];
+      const md = (l.maps_data as Record<string, unknown>) || {};
+      return headers.map((h) => {
+        if (socialHeaders.has(h)) {
           return escapeCSV(String(social?.[h] ?? ""));
         }
         if (h === "business_types") {
@@ -1672,7 +1676,6 @@ export function HuntDetailPage() {
           return escapeCSV(types ? types.join("; ") : "");
         }
         if (h.startsWith("decision_maker") || h === "decision_makers_count") {
-          const dms = (l.decision_makers as Array<{name?: string; title?: string; email?: string; linkedin?: string; source_url?: string}> | undefined) || [];
           if (h === "decision_makers_count") return escapeCSV(String(dms.length));
           if (h === "decision_maker_names") return escapeCSV(dms.map((dm) => dm.name || "").filter(Boolean).join("; "));
           if (h === "decision_maker_titles") return escapeCSV(dms.map((dm) => dm.title || "").filter(Boolean).join("; "));
@@ -1709,7 +1712,6 @@ export function HuntDetailPage() {
           return escapeCSV(ev.map((x) => `${x.claim || ""}${x.source_url ? ` @ ${x.source_url}` : ""}`).join("; "));
         }
         if (h.startsWith("maps_")) {
-          const md = (l.maps_data as Record<string, unknown>) || {};
           if (h === "maps_title") return escapeCSV(String(md.title ?? ""));
           if (h === "maps_website") return escapeCSV(String(md.website ?? ""));
           if (h === "maps_type") return escapeCSV(String(md.type ?? ""));
@@ -1721,10 +1723,9 @@ export function HuntDetailPage() {
         }
         const v = l[h];
         return escapeCSV(Array.isArray(v) ? v.join("; ") : String(v ?? ""));
-      }).join(",")
-    );
-    const csv = [headers.join(","), ...rows].join("\n");
-    const blob = new Blob([csv], { type: "text/csv" });
+      }).join(",");
+    });
+    const blob = new Blob([headers.join(","), ...rows.flatMap((row) => ["\n", row])], { type: "text/csv" });
     const url = URL.createObjectURL(blob);
     const a = document.createElement("a");
     a.href = url;